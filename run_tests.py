@@ -7,9 +7,28 @@ Provides different test categories and detailed reporting.
 import argparse
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Deque, IO, Optional
+
+# Number of trailing output lines kept per stream of each command
+OUTPUT_TAIL_LINES = 2000
+
+# Horizontal rules used by the command output and the report
+_HR60 = "=" * 60
+_HR80 = "=" * 80
+
+
+def _drain_stream(stream: IO[str], sink: Deque[str], echo: Optional[IO[str]]) -> None:
+    """Read a child's output stream line by line into a bounded buffer."""
+    for line in stream:
+        sink.append(line)
+        if echo is not None:
+            echo.write(line)
+    stream.close()
 
 
 class TestRunner:
@@ -20,51 +39,106 @@ class TestRunner:
         self.src_dir = self.project_root / "src"
         self.tests_dir = self.project_root / "tests"
         self.results = {}
+        self.defer_output = False
     
     def run_command(self, cmd: List[str], description: str) -> Dict[str, Any]:
-        """Run a command and capture results."""
-        print(f"\n{'='*60}")
-        print(f"Running: {description}")
-        print(f"Command: {' '.join(cmd)}")
-        print(f"{'='*60}")
+        """Run a command and capture results.
+        
+        Output is streamed line by line and only the last ``OUTPUT_TAIL_LINES``
+        lines of each stream are kept. It is echoed live unless
+        ``defer_output`` is set, in which case the caller prints it.
+        """
+        live = not self.defer_output
+        if live:
+            self._print_command_header(description, cmd)
         
         start_time = time.time()
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                cwd=self.project_root
+                cwd=self.project_root,
+                bufsize=1
             )
+            stdout_lines: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+            stderr_lines: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+            readers = [
+                threading.Thread(
+                    target=_drain_stream,
+                    args=(proc.stdout, stdout_lines, sys.stdout if live else None),
+                    daemon=True
+                ),
+                threading.Thread(
+                    target=_drain_stream,
+                    args=(proc.stderr, stderr_lines, sys.stderr if live else None),
+                    daemon=True
+                ),
+            ]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
+            returncode = proc.wait()
             duration = time.time() - start_time
             
-            print(f"Exit code: {result.returncode}")
-            if result.stdout:
-                print("STDOUT:")
-                print(result.stdout)
-            if result.stderr:
-                print("STDERR:")
-                print(result.stderr)
-            
-            return {
-                "success": result.returncode == 0,
-                "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+            command_result = {
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stdout": "".join(stdout_lines),
+                "stderr": "".join(stderr_lines),
                 "duration": duration,
-                "description": description
+                "description": description,
+                "command": cmd
             }
         except Exception as e:
             duration = time.time() - start_time
-            print(f"Error running command: {e}")
-            return {
+            command_result = {
                 "success": False,
                 "returncode": -1,
                 "stdout": "",
                 "stderr": str(e),
                 "duration": duration,
-                "description": description
+                "description": description,
+                "command": cmd,
+                "error": True
             }
+        
+        if live:
+            if command_result.get("error"):
+                print(f"Error running command: {command_result['stderr']}")
+            else:
+                print(f"Exit code: {command_result['returncode']}")
+        return command_result
+    
+    def _print_command_header(self, description: str, cmd: List[str]) -> None:
+        print("\n" + _HR60)
+        print(f"Running: {description}")
+        print(f"Command: {' '.join(cmd)}")
+        print(_HR60)
+    
+    def print_command_result(self, result: Dict[str, Any]) -> None:
+        """Print the buffered output of a command (or of its sub-commands)."""
+        if "command" not in result:
+            for value in result.values():
+                if isinstance(value, dict):
+                    self.print_command_result(value)
+            return
+        
+        self._print_command_header(result["description"], result["command"])
+        
+        if result.get("error"):
+            print(f"Error running command: {result['stderr']}")
+            return
+        
+        print(f"Exit code: {result['returncode']}")
+        if result["stdout"]:
+            print("STDOUT:")
+            print(result["stdout"])
+        if result["stderr"]:
+            print("STDERR:")
+            print(result["stderr"])
     
     def run_unit_tests(self) -> Dict[str, Any]:
         """Run unit tests."""
@@ -178,9 +252,9 @@ class TestRunner:
     
     def generate_report(self) -> None:
         """Generate comprehensive test report."""
-        print(f"\n{'='*80}")
+        print("\n" + _HR80)
         print("COMPREHENSIVE TEST REPORT")
-        print(f"{'='*80}")
+        print(_HR80)
         
         total_tests = len(self.results)
         passed_tests = sum(1 for r in self.results.values() if r.get("success", False))
@@ -191,9 +265,9 @@ class TestRunner:
         print(f"Failed: {failed_tests}")
         print(f"Success rate: {(passed_tests/total_tests)*100:.1f}%")
         
-        print(f"\n{'='*80}")
+        print("\n" + _HR80)
         print("DETAILED RESULTS")
-        print(f"{'='*80}")
+        print(_HR80)
         
         for category, result in self.results.items():
             status = "✅ PASS" if result.get("success", False) else "❌ FAIL"
@@ -208,12 +282,12 @@ class TestRunner:
         if coverage_html.exists():
             print(f"\n📊 Coverage report: file://{coverage_html.absolute()}")
         
-        print(f"\n{'='*80}")
+        print("\n" + _HR80)
         if failed_tests == 0:
             print("🎉 ALL TESTS PASSED!")
         else:
             print(f"⚠️  {failed_tests} TEST CATEGORIES FAILED")
-        print(f"{'='*80}")
+        print(_HR80)
     
     def run_all_tests(self) -> bool:
         """Run all test categories."""
@@ -224,13 +298,25 @@ class TestRunner:
         self.results["integration_tests"] = self.run_integration_tests()
         self.results["coverage"] = self.run_coverage_tests()
         
-        # Code quality
-        self.results["linting"] = self.run_linting()
-        self.results["type_checking"] = self.run_type_checking()
-        self.results["formatting"] = self.run_formatting_check()
+        # Code quality and security tools are independent processes, so run
+        # them concurrently and print their output grouped per tool afterwards
+        jobs = {
+            "linting": self.run_linting,
+            "type_checking": self.run_type_checking,
+            "formatting": self.run_formatting_check,
+            "security": self.run_security_checks,
+        }
+        self.defer_output = True
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = {name: executor.submit(job) for name, job in jobs.items()}
+                for name, future in futures.items():
+                    self.results[name] = future.result()
+        finally:
+            self.defer_output = False
         
-        # Security
-        self.results["security"] = self.run_security_checks()
+        for name in jobs:
+            self.print_command_result(self.results[name])
         
         # Performance (optional)
         try:
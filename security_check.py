@@ -5,35 +5,405 @@ Performs comprehensive security checks and generates reports.
 """
 
 import argparse
+import importlib
 import json
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Pattern, Set, Tuple, Union
 import re
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+orjson: Any = None
+try:
+    orjson = importlib.import_module("orjson")
+except ImportError:
+    pass
+
+
+# Patterns are kept to a single line ([^\S\n] rather than \s) so they can be
+# run over a whole file at once without matching across line breaks.
+SECRET_PATTERNS = [
+    (r'password[^\S\n]*=[^\S\n]*["\'][^"\'\n]{8,}["\']', "Hardcoded password"),
+    (r'api_key[^\S\n]*=[^\S\n]*["\'][^"\'\n]{20,}["\']', "API key"),
+    (r'secret[^\S\n]*=[^\S\n]*["\'][^"\'\n]{16,}["\']', "Secret key"),
+    (r'token[^\S\n]*=[^\S\n]*["\'][^"\'\n]{20,}["\']', "Access token"),
+    (r'-----BEGIN[^\S\n]+(?:[A-Z]|[^\S\n])+PRIVATE KEY-----', "Private key"),
+]
+
+# The long-string pattern has no literal anchor, so it is kept out of the
+# union and only tried on lines that could possibly hold a quoted 32+ char run.
+LONG_STRING_PATTERN = r'["\'][A-Za-z0-9]{32,}?["\']'
+LONG_STRING_DESCRIPTION = "Long string (potential key)"
+LONG_STRING_MIN_LINE = 34
+
+DANGEROUS_IMPORTS = [
+    ("eval", "Dynamic code execution"),
+    ("exec", "Dynamic code execution"),
+    ("subprocess.call", "Command execution without shell=False"),
+    ("os.system", "Shell command execution"),
+    ("pickle.loads", "Unsafe deserialization"),
+    ("yaml.load", "Unsafe YAML loading (use safe_load)"),
+    ("__import__", "Dynamic import"),
+]
+
+
+def _load_json(data: Union[bytes, bytearray]) -> Any:
+    """Parse raw JSON tool output, using orjson when it is installed.
+    
+    Both parsers raise a ``json.JSONDecodeError`` subclass on bad input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _run_streaming(cmd: List[str], cwd: Path) -> Tuple[int, bytearray, bytes]:
+    """Run ``cmd``, reading its stdout in chunks into a single buffer.
+    
+    Unlike ``capture_output=True`` this never holds a list of chunks and their
+    joined copy at the same time. stderr is drained on a thread so a chatty
+    tool cannot block on a full pipe.
+    
+    Returns:
+        Tuple of (return code, stdout bytes, stderr bytes)
+    """
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        stderr = proc.stderr
+        stderr_chunks: List[bytes] = []
+        drain = threading.Thread(
+            target=lambda: stderr_chunks.append(stderr.read()), daemon=True
+        )
+        drain.start()
+        
+        stdout = bytearray()
+        read = proc.stdout.read
+        chunk = read(PIPE_CHUNK_SIZE)
+        while chunk:
+            stdout += chunk
+            chunk = read(PIPE_CHUNK_SIZE)
+        
+        drain.join()
+        returncode = proc.wait()
+    
+    return returncode, stdout, b"".join(stderr_chunks)
+
+
+def _perm_str(mode: int) -> str:
+    """Format the permission bits of ``mode`` as three octal digits, e.g. ``644``."""
+    return f"{mode & 0o777:03o}"
+
+
+def _matching_lines(
+    content: bytes, *patterns: Pattern[bytes], haystack: Optional[bytes] = None
+) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(line_number, line)`` for each line any of ``patterns`` matches.
+    
+    The patterns run over ``haystack`` when given, e.g. a case-folded copy of
+    ``content`` with the same length; the lines yielded come from ``content``.
+    """
+    if haystack is None:
+        haystack = content
+    return _lines_at(content, sorted({
+        content.rfind(b'\n', 0, match.start()) + 1
+        for pattern in patterns
+        for match in pattern.finditer(haystack)
+    }))
+
+
+def _fold_case(pattern: str) -> str:
+    """Lowercase the literal letters of ``pattern``, leaving escapes alone.
+    
+    The result matches lowercased text exactly where ``pattern`` matches the
+    original with ``re.IGNORECASE`` (for ASCII bytes patterns).
+    """
+    return re.sub(
+        r"\\.|[A-Z]",
+        lambda match: (
+            match.group() if len(match.group()) > 1 else match.group().lower()
+        ),
+        pattern,
+    )
+
+
+def _lines_at(content: bytes, line_starts: List[int]) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(line_number, line)`` for each of the sorted ``line_starts``."""
+    line_num = 1
+    counted_to = 0
+    for line_start in line_starts:
+        line_num += content.count(b'\n', counted_to, line_start)
+        counted_to = line_start
+        line_end = content.find(b'\n', line_start)
+        yield line_num, content[line_start:line_end if line_end != -1 else None]
+
+
+# Compiled at import time, i.e. once per process including scan workers.
+# Sources are scanned as raw bytes, so the patterns are compiled as bytes too;
+# only the reported snippets get decoded.
+_SECRET_RES = [
+    (re.compile(pattern.encode(), re.IGNORECASE), description)
+    for pattern, description in SECRET_PATTERNS
+]
+# The union runs over a lowercased copy of each file instead of using
+# IGNORECASE, which keeps sre's first-character prefilter and makes the pass
+# several times faster. The long-string pattern is case-insensitive as written.
+_SECRET_UNION = re.compile(
+    b"|".join(
+        b"(?:%s)" % _fold_case(pattern).encode() for pattern, _ in SECRET_PATTERNS
+    )
+)
+_LONG_STRING_RE = re.compile(LONG_STRING_PATTERN.encode())
+_DANGEROUS_NEEDLES = [
+    (func.encode(), func, description) for func, description in DANGEROUS_IMPORTS
+]
+_DANGEROUS_UNION = re.compile(
+    b"|".join(re.escape(needle) for needle, _, _ in _DANGEROUS_NEEDLES)
+)
+
+
+def _build_dangerous_automaton() -> Any:
+    """Build an Aho-Corasick automaton over the dangerous function names.
+    
+    Returns None when pyahocorasick is not installed; the union regex is used
+    instead in that case.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, (func, _) in enumerate(DANGEROUS_IMPORTS):
+        automaton.add_word(func, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_DANGEROUS_AUTOMATON = _build_dangerous_automaton()
+
+SCAN_CHUNKSIZE = 16
+
+# Vendored, generated and VCS trees that never hold project source
+_SKIP_DIRS = frozenset({
+    "__pycache__", ".git", ".venv", "venv", ".tox", "build", "dist",
+    "node_modules", "site-packages",
+})
+
+_HR80 = "=" * 80
+
+# Bytes read from a tool's stdout pipe per call
+PIPE_CHUNK_SIZE = 1 << 20
+
+
+def _find_secrets(content: bytes, rel_path: str) -> List[Dict[str, Any]]:
+    """Return the potential hardcoded secrets in ``content``."""
+    findings: List[Dict[str, Any]] = []
+    findings_append = findings.append
+    
+    # One pass of the union regex (plus one for long strings) finds the
+    # candidate lines; the individual patterns then only run on those few lines.
+    candidates = _matching_lines(
+        content, _SECRET_UNION, _LONG_STRING_RE, haystack=content.lower()
+    )
+    for line_num, line in candidates:
+        stripped = line.strip()
+        # Skip comments
+        if stripped.startswith(b'#'):
+            continue
+        descriptions = [
+            description
+            for pattern, description in _SECRET_RES
+            if pattern.search(line)
+        ]
+        if (
+            len(line) >= LONG_STRING_MIN_LINE
+            and (b'"' in line or b"'" in line)
+            and _LONG_STRING_RE.search(line)
+        ):
+            descriptions.append(LONG_STRING_DESCRIPTION)
+        if not descriptions:
+            continue
+        snippet = stripped.decode('utf-8', 'replace')[:100]
+        for description in descriptions:
+            findings_append({
+                "file": rel_path,
+                "line": line_num,
+                "description": description,
+                "content": snippet
+            })
+    
+    return findings
+
+
+def _dangerous_lines(content: bytes) -> Iterator[Tuple[int, bytes, List[int]]]:
+    """Yield ``(line_number, line, needle_indexes)`` for lines using dangerous calls.
+    
+    ``needle_indexes`` index into ``DANGEROUS_IMPORTS`` in declaration order.
+    """
+    # Most files use none of the functions. Literal bytes.find scans settle
+    # those far faster than either the union regex or the automaton.
+    if not any(needle in content for needle, _, _ in _DANGEROUS_NEEDLES):
+        return
+    
+    if _DANGEROUS_AUTOMATON is None:
+        # Only lines containing at least one needle are checked in detail
+        for line_num, line in _matching_lines(content, _DANGEROUS_UNION):
+            yield line_num, line, [
+                index
+                for index, (needle, _, _) in enumerate(_DANGEROUS_NEEDLES)
+                if needle in line
+            ]
+        return
+    
+    # Latin-1 maps each byte to one character, so automaton offsets are also
+    # byte offsets into ``content``. Needles never span lines, so the line
+    # holding a match can be found from its end offset.
+    line_needles: Dict[int, Set[int]] = {}
+    for end_index, index in _DANGEROUS_AUTOMATON.iter(content.decode('latin-1')):
+        line_start = content.rfind(b'\n', 0, end_index) + 1
+        line_needles.setdefault(line_start, set()).add(index)
+    line_starts = sorted(line_needles)
+    lines = _lines_at(content, line_starts)
+    for (line_num, line), line_start in zip(lines, line_starts):
+        yield line_num, line, sorted(line_needles[line_start])
+
+
+def _find_dangerous_imports(content: bytes, rel_path: str) -> List[Dict[str, Any]]:
+    """Return the uses of dangerous functions in ``content``."""
+    findings: List[Dict[str, Any]] = []
+    findings_append = findings.append
+    
+    for line_num, line, needle_indexes in _dangerous_lines(content):
+        stripped = line.strip()
+        if stripped.startswith(b'#'):
+            continue
+        snippet = stripped.decode('utf-8', 'replace')
+        for index in needle_indexes:
+            _, dangerous_func, description = _DANGEROUS_NEEDLES[index]
+            findings_append({
+                "file": rel_path,
+                "line": line_num,
+                "function": dangerous_func,
+                "description": description,
+                "content": snippet
+            })
+    
+    return findings
+
+
+def _walk_python_files(root: Path) -> List[os.DirEntry]:
+    """Collect the ``*.py`` entries under ``root`` with an ``os.scandir`` walk.
+    
+    The returned entries carry the file type from the directory listing and
+    cache their ``stat()`` result, so later checks do not need extra syscalls.
+    Like ``rglob``, symlinked directories are not descended into; directories
+    named in ``_SKIP_DIRS`` are pruned without being listed.
+    """
+    entries = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        entries.append(entry)
+        except OSError:
+            continue
+    entries.sort(key=lambda entry: entry.path)
+    return entries
+
+
+def _scan_file(py_file: Path, project_root: Path) -> Dict[str, Any]:
+    """Run the content checks on one source file, reading it only once.
+    
+    Kept at module level so it can be shipped to worker processes.
+    """
+    rel_path = str(py_file.relative_to(project_root))
+    result: Dict[str, Any] = {"secrets": [], "imports": [], "read_error": None}
+    
+    try:
+        content = py_file.read_bytes()
+        
+        # Skip test files
+        if 'test' not in str(py_file).lower():
+            result["secrets"] = _find_secrets(content, rel_path)
+        result["imports"] = _find_dangerous_imports(content, rel_path)
+    except Exception as e:
+        result["read_error"] = str(e)
+    
+    return result
+
 
 class SecurityAuditor:
     """Comprehensive security auditing for the project."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.project_root = Path(__file__).parent
         self.src_dir = self.project_root / "src"
-        self.results = {}
+        self.results: Dict[str, Any] = {}
+        self._py_entries: Optional[List[os.DirEntry]] = None
+        self._source_scan: Optional[Dict[str, Any]] = None
+    
+    def _python_entries(self) -> List[os.DirEntry]:
+        """Return the source files to audit, walking ``src_dir`` only once."""
+        if self._py_entries is None:
+            self._py_entries = _walk_python_files(self.src_dir)
+        return self._py_entries
+    
+    def _scan_sources(self) -> Dict[str, Any]:
+        """Run the per-file checks over all source files in a process pool.
+        
+        The scan runs once per auditor; the secrets and imports checks each
+        pick their part out of the merged result.
+        """
+        if self._source_scan is not None:
+            return self._source_scan
+        
+        py_files = [Path(entry.path) for entry in self._python_entries()]
+        scan: Dict[str, Any] = {"secrets": [], "imports": [], "read_errors": []}
+        
+        scan_file = partial(_scan_file, project_root=self.project_root)
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(scan_file, py_files, chunksize=SCAN_CHUNKSIZE)
+            for py_file, result in zip(py_files, results):
+                scan["secrets"].extend(result["secrets"])
+                scan["imports"].extend(result["imports"])
+                if result["read_error"] is not None:
+                    scan["read_errors"].append((py_file, result["read_error"]))
+        
+        # Report findings by file and line; the sort is stable, so findings on
+        # the same line keep their pattern order
+        for key in ("secrets", "imports"):
+            scan[key].sort(key=itemgetter("file", "line"))
+        
+        self._source_scan = scan
+        return scan
     
     def run_bandit_scan(self) -> Dict[str, Any]:
         """Run Bandit security scanner."""
         print("🔍 Running Bandit security scan...")
         
         try:
-            result = subprocess.run([
+            returncode, stdout, stderr = _run_streaming([
                 sys.executable, "-m", "bandit",
                 "-r", str(self.src_dir),
                 "-f", "json"
-            ], capture_output=True, text=True, cwd=self.project_root)
+            ], self.project_root)
             
-            if result.returncode == 0:
-                bandit_results = json.loads(result.stdout) if result.stdout else {}
+            if returncode == 0:
+                bandit_results = _load_json(stdout) if stdout else {}
                 issues = bandit_results.get("results", [])
                 
                 return {
@@ -47,7 +417,7 @@ class SecurityAuditor:
             else:
                 return {
                     "status": "error",
-                    "error": result.stderr
+                    "error": stderr.decode('utf-8', 'replace')
                 }
         except Exception as e:
             return {
@@ -62,7 +432,7 @@ class SecurityAuditor:
         try:
             result = subprocess.run([
                 sys.executable, "-m", "safety", "check", "--json"
-            ], capture_output=True, text=True, cwd=self.project_root)
+            ], capture_output=True, cwd=self.project_root)
             
             if result.returncode == 0:
                 return {
@@ -73,7 +443,7 @@ class SecurityAuditor:
             else:
                 # Safety returns non-zero when vulnerabilities are found
                 try:
-                    safety_results = json.loads(result.stdout) if result.stdout else []
+                    safety_results = _load_json(result.stdout) if result.stdout else []
                     return {
                         "status": "vulnerabilities_found",
                         "vulnerabilities_found": len(safety_results),
@@ -82,7 +452,9 @@ class SecurityAuditor:
                 except json.JSONDecodeError:
                     return {
                         "status": "error",
-                        "error": result.stderr or result.stdout
+                        "error": (result.stderr or result.stdout).decode(
+                            'utf-8', 'replace'
+                        )
                     }
         except Exception as e:
             return {
@@ -94,35 +466,10 @@ class SecurityAuditor:
         """Check for potentially hardcoded secrets."""
         print("🔍 Scanning for hardcoded secrets...")
         
-        secret_patterns = [
-            (r'password\s*=\s*["\'][^"\']{8,}["\']', "Hardcoded password"),
-            (r'api_key\s*=\s*["\'][^"\']{20,}["\']', "API key"),
-            (r'secret\s*=\s*["\'][^"\']{16,}["\']', "Secret key"),
-            (r'token\s*=\s*["\'][^"\']{20,}["\']', "Access token"),
-            (r'["\'][A-Za-z0-9]{32,}["\']', "Long string (potential key)"),
-            (r'-----BEGIN\s+[A-Z\s]+PRIVATE KEY-----', "Private key"),
-        ]
-        
-        findings = []
-        
-        for py_file in self.src_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                lines = content.split('\n')
-                
-                for line_num, line in enumerate(lines, 1):
-                    for pattern, description in secret_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            # Skip test files and comments
-                            if not line.strip().startswith('#') and 'test' not in str(py_file).lower():
-                                findings.append({
-                                    "file": str(py_file.relative_to(self.project_root)),
-                                    "line": line_num,
-                                    "description": description,
-                                    "content": line.strip()[:100]
-                                })
-            except Exception as e:
-                print(f"Warning: Could not scan {py_file}: {e}")
+        scan = self._scan_sources()
+        for py_file, error in scan["read_errors"]:
+            print(f"Warning: Could not scan {py_file}: {error}")
+        findings = scan["secrets"]
         
         return {
             "status": "success",
@@ -136,21 +483,20 @@ class SecurityAuditor:
         
         findings = []
         
-        # Check Python files
-        for py_file in self.src_dir.rglob("*.py"):
+        # Check Python files, reusing the stat data cached on each DirEntry
+        for entry in self._python_entries():
             try:
-                stat = py_file.stat()
-                mode = oct(stat.st_mode)[-3:]
+                mode = entry.stat().st_mode
                 
                 # Check if file is world-writable (dangerous)
-                if mode.endswith('6') or mode.endswith('7'):
+                if mode & 0o002:
                     findings.append({
-                        "file": str(py_file.relative_to(self.project_root)),
-                        "permissions": mode,
+                        "file": str(Path(entry.path).relative_to(self.project_root)),
+                        "permissions": _perm_str(mode),
                         "issue": "World-writable file"
                     })
             except Exception as e:
-                print(f"Warning: Could not check permissions for {py_file}: {e}")
+                print(f"Warning: Could not check permissions for {entry.path}: {e}")
         
         # Check config files
         config_files = [
@@ -162,14 +508,13 @@ class SecurityAuditor:
         for config_file in config_files:
             if config_file.exists():
                 try:
-                    stat = config_file.stat()
-                    mode = oct(stat.st_mode)[-3:]
+                    mode = config_file.stat().st_mode
                     
                     # Config files should not be world-readable
-                    if mode[2] in ['4', '5', '6', '7']:
+                    if mode & 0o004:
                         findings.append({
                             "file": str(config_file.relative_to(self.project_root)),
-                            "permissions": mode,
+                            "permissions": _perm_str(mode),
                             "issue": "Config file is world-readable"
                         })
                 except Exception as e:
@@ -185,35 +530,10 @@ class SecurityAuditor:
         """Check for potentially dangerous imports."""
         print("🔍 Checking for dangerous imports...")
         
-        dangerous_imports = [
-            ("eval", "Dynamic code execution"),
-            ("exec", "Dynamic code execution"),
-            ("subprocess.call", "Command execution without shell=False"),
-            ("os.system", "Shell command execution"),
-            ("pickle.loads", "Unsafe deserialization"),
-            ("yaml.load", "Unsafe YAML loading (use safe_load)"),
-            ("__import__", "Dynamic import"),
-        ]
-        
-        findings = []
-        
-        for py_file in self.src_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                lines = content.split('\n')
-                
-                for line_num, line in enumerate(lines, 1):
-                    for dangerous_func, description in dangerous_imports:
-                        if dangerous_func in line and not line.strip().startswith('#'):
-                            findings.append({
-                                "file": str(py_file.relative_to(self.project_root)),
-                                "line": line_num,
-                                "function": dangerous_func,
-                                "description": description,
-                                "content": line.strip()
-                            })
-            except Exception as e:
-                print(f"Warning: Could not scan {py_file}: {e}")
+        scan = self._scan_sources()
+        for py_file, error in scan["read_errors"]:
+            print(f"Warning: Could not scan {py_file}: {error}")
+        findings = scan["imports"]
         
         return {
             "status": "success",
@@ -223,9 +543,13 @@ class SecurityAuditor:
     
     def generate_security_report(self) -> None:
         """Generate comprehensive security report."""
-        print(f"\n{'='*80}")
-        print("SECURITY AUDIT REPORT")
-        print(f"{'='*80}")
+        # The report is assembled in memory and written out in one call
+        lines: List[str] = []
+        lines_append = lines.append
+        
+        lines_append(f"\n{_HR80}")
+        lines_append("SECURITY AUDIT REPORT")
+        lines_append(_HR80)
         
         # Summary
         total_issues = 0
@@ -250,63 +574,67 @@ class SecurityAuditor:
                 elif check_name == "secrets":
                     critical_issues += result.get("potential_secrets", 0)
         
-        print(f"Total security issues found: {total_issues}")
-        print(f"Critical issues: {critical_issues}")
+        lines_append(f"Total security issues found: {total_issues}")
+        lines_append(f"Critical issues: {critical_issues}")
         
         # Detailed results
-        print(f"\n{'='*80}")
-        print("DETAILED RESULTS")
-        print(f"{'='*80}")
+        lines_append(f"\n{_HR80}")
+        lines_append("DETAILED RESULTS")
+        lines_append(_HR80)
         
         for check_name, result in self.results.items():
-            print(f"\n{check_name.upper()} SCAN:")
+            lines_append(f"\n{check_name.upper()} SCAN:")
             
             if result.get("status") == "error":
-                print(f"  ❌ Error: {result.get('error', 'Unknown error')}")
+                lines_append(f"  ❌ Error: {result.get('error', 'Unknown error')}")
                 continue
             
             if check_name == "bandit":
                 issues = result.get("issues_found", 0)
                 if issues == 0:
-                    print("  ✅ No security issues found")
+                    lines_append("  ✅ No security issues found")
                 else:
-                    print(f"  ⚠️  {issues} issues found:")
-                    print(f"    - High severity: {result.get('high_severity', 0)}")
-                    print(f"    - Medium severity: {result.get('medium_severity', 0)}")
-                    print(f"    - Low severity: {result.get('low_severity', 0)}")
+                    lines_append(f"  ⚠️  {issues} issues found:")
+                    high = result.get('high_severity', 0)
+                    medium = result.get('medium_severity', 0)
+                    lines_append(f"    - High severity: {high}")
+                    lines_append(f"    - Medium severity: {medium}")
+                    lines_append(f"    - Low severity: {result.get('low_severity', 0)}")
             
             elif check_name == "safety":
                 vulns = result.get("vulnerabilities_found", 0)
                 if vulns == 0:
-                    print("  ✅ No known vulnerabilities in dependencies")
+                    lines_append("  ✅ No known vulnerabilities in dependencies")
                 else:
-                    print(f"  ❌ {vulns} vulnerabilities found in dependencies")
+                    lines_append(f"  ❌ {vulns} vulnerabilities found in dependencies")
             
             elif check_name == "secrets":
                 secrets = result.get("potential_secrets", 0)
                 if secrets == 0:
-                    print("  ✅ No potential secrets found")
+                    lines_append("  ✅ No potential secrets found")
                 else:
-                    print(f"  ⚠️  {secrets} potential secrets found")
+                    lines_append(f"  ⚠️  {secrets} potential secrets found")
             
             elif check_name == "permissions":
                 perms = result.get("permission_issues", 0)
                 if perms == 0:
-                    print("  ✅ No permission issues found")
+                    lines_append("  ✅ No permission issues found")
                 else:
-                    print(f"  ⚠️  {perms} permission issues found")
+                    lines_append(f"  ⚠️  {perms} permission issues found")
             
             elif check_name == "imports":
                 imports = result.get("dangerous_imports", 0)
                 if imports == 0:
-                    print("  ✅ No dangerous imports found")
+                    lines_append("  ✅ No dangerous imports found")
                 else:
-                    print(f"  ⚠️  {imports} potentially dangerous imports found")
+                    lines_append(
+                        f"  ⚠️  {imports} potentially dangerous imports found"
+                    )
         
         # Recommendations
-        print(f"\n{'='*80}")
-        print("SECURITY RECOMMENDATIONS")
-        print(f"{'='*80}")
+        lines_append(f"\n{_HR80}")
+        lines_append("SECURITY RECOMMENDATIONS")
+        lines_append(_HR80)
         
         recommendations = [
             "🔒 Keep dependencies updated regularly",
@@ -322,19 +650,29 @@ class SecurityAuditor:
         ]
         
         for rec in recommendations:
-            print(f"  {rec}")
+            lines_append(f"  {rec}")
         
-        print(f"\n{'='*80}")
+        lines_append(f"\n{_HR80}")
         if critical_issues == 0 and total_issues == 0:
-            print("🎉 SECURITY AUDIT PASSED - No critical issues found!")
+            lines_append("🎉 SECURITY AUDIT PASSED - No critical issues found!")
         elif critical_issues == 0:
-            print(f"⚠️  SECURITY AUDIT WARNING - {total_issues} non-critical issues found")
+            lines_append(
+                f"⚠️  SECURITY AUDIT WARNING - {total_issues} non-critical issues found"
+            )
         else:
-            print(f"❌ SECURITY AUDIT FAILED - {critical_issues} critical issues found")
-        print(f"{'='*80}")
+            lines_append(
+                f"❌ SECURITY AUDIT FAILED - {critical_issues} critical issues found"
+            )
+        lines_append(_HR80)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def run_full_audit(self) -> bool:
-        """Run complete security audit."""
+    def run_full_audit(self, report: bool = True) -> bool:
+        """Run complete security audit.
+        
+        Args:
+            report: Whether to print the human-readable report
+        """
         print("🔐 Starting comprehensive security audit...")
         
         # Run all security checks
@@ -345,7 +683,8 @@ class SecurityAuditor:
         self.results["imports"] = self.check_imports()
         
         # Generate report
-        self.generate_security_report()
+        if report:
+            self.generate_security_report()
         
         # Return success if no critical issues
         critical_issues = 0
@@ -380,7 +719,9 @@ def main():
     auditor = SecurityAuditor()
     
     if args.check == "all":
-        success = auditor.run_full_audit()
+        success = auditor.run_full_audit(report=not args.json)
+        if args.json:
+            print(json.dumps(auditor.results, indent=2))
     else:
         # Run specific check
         if args.check == "bandit":
@@ -1,31 +1,52 @@
 """
 Commit Worker module for processing file change events.
 
-This module implements the CommitWorker class that runs in a thread pool
+This module implements the CommitWorker class that runs on its own thread
 to process file change events from the queue and orchestrate the analysis
-and commit process.
+and commit process, and the CommitWorkerPool that owns those threads.
 """
 
 import logging
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
-from typing import Optional, List
+from collections import OrderedDict
+from queue import Queue, SimpleQueue
+from typing import Any, Callable, Dict, Optional, List, Set, Union
 
 from watchdog.events import FileSystemEvent
 
-from config_manager import ConfigurationManager, FileAction
+from config_manager import CONFIG_FILE_NAMES, ConfigurationManager, FileAction
+from event_queue import (BatchQueue, ShardedEventQueue, as_batch_queue,
+                         cpu_numa_nodes)
 from review_queue import ReviewQueue
 
+# Maximum number of events drained from the queue per lock round-trip
+EVENT_BATCH_SIZE = 64
+
+# How long a worker waits for more events to join a batch before processing
+# it; 0 processes whatever is already queued straight away
+BATCH_LINGER_MS = 0
+
+# How often CommitWorkerPool checks the queue backlog to decide on scaling up
+SCALE_CHECK_INTERVAL = 0.5
+
 
 class CommitWorker:
     """
     Worker class that processes file change events from a thread-safe queue.
 
-    This worker runs in a thread pool and is responsible for dequeuing events
-    and orchestrating the analysis and commit process.
+    Each worker runs on a dedicated thread started by CommitWorkerPool and is
+    responsible for dequeuing events and orchestrating the analysis and
+    commit process.
     """
 
+    # Queued by stop() to wake a worker blocked on the queue and end its loop
+    _SENTINEL = object()
+
+    # Git allows a single writer per index, so workers stage and commit in turn
+    _commit_lock = threading.Lock()
+
     def __init__(
         self,
         config_manager: ConfigurationManager,
@@ -33,6 +54,12 @@ class CommitWorker:
         review_queue: ReviewQueue,
         llm_generator,
         worker_id: int = 0,
+        event_queue: "Optional[Union[Queue[Any], SimpleQueue[Any], BatchQueue]]" = None,
+        cpu_set: Optional[Set[int]] = None,
+        max_batch_n: int = EVENT_BATCH_SIZE,
+        max_batch_ms: int = BATCH_LINGER_MS,
+        idle_timeout: Optional[float] = None,
+        can_retire: Optional[Callable[["CommitWorker"], bool]] = None,
     ):
         """
         Initialize the CommitWorker.
@@ -43,24 +70,200 @@ class CommitWorker:
             review_queue: Queue for files needing human review
             llm_generator: LLM commit message generator
             worker_id: Unique identifier for this worker instance
+            event_queue: Thread-safe queue of file system events to consume;
+                with a ShardedEventQueue the worker drains the shard matching
+                its worker_id and steals from the others when idle; a
+                SimpleQueue skips task accounting for callers that never join
+            cpu_set: CPUs to pin the worker thread to, or None to let the OS
+                schedule it anywhere
+            max_batch_n: Maximum number of events processed as one batch
+            max_batch_ms: How long to keep collecting events after the first
+                one of a batch arrives, in milliseconds
+            idle_timeout: Seconds without events after which the worker
+                exits, or None to run until stopped
+            can_retire: Called when the idle timeout expires; the worker
+                exits only if it returns True
         """
         self.config_manager = config_manager
         self.git_repo = git_repo
         self.review_queue = review_queue
         self.llm_generator = llm_generator
         self.worker_id = worker_id
+        self.event_queue: Optional[BatchQueue] = (
+            as_batch_queue(event_queue) if event_queue is not None else None
+        )
+        self.cpu_set = cpu_set
+        self.max_batch_n = max(1, max_batch_n)
+        self.max_batch_ms = max_batch_ms
+        self.idle_timeout = idle_timeout
+        self.can_retire = can_retire
         self.logger = logging.getLogger(f"CommitWorker-{worker_id}")
         self.running = False
 
+        # What _route_event does with an event for each file action
+        self._handlers: Dict[FileAction, Callable] = {
+            FileAction.IGNORE: self._handle_ignore,
+            FileAction.REVIEW: self._handle_review,
+            FileAction.INCLUDE: self._handle_include,
+        }
+
     def start(self) -> None:
-        """Start the worker thread."""
+        """
+        Start the worker thread.
+
+        Called on the worker's own thread, so that pinning it to cpu_set
+        affects only this worker.
+        """
         self.running = True
-        self.logger.info(f"CommitWorker {self.worker_id} starting...")
+        self.logger.info("CommitWorker %s starting...", self.worker_id)
+
+        if self.cpu_set and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, self.cpu_set)
+                self.logger.debug("Pinned to CPUs %s", sorted(self.cpu_set))
+            except OSError as e:
+                self.logger.warning(
+                    "Could not pin to CPUs %s: %s", sorted(self.cpu_set), e
+                )
 
     def stop(self) -> None:
-        """Stop the worker thread."""
+        """
+        Stop the worker thread.
+
+        Queues one stop sentinel. Workers sharing a queue exit on whichever
+        sentinel they dequeue, so stopping every worker of a pool stops them
+        all, each after finishing the events queued ahead of its sentinel.
+        """
         self.running = False
-        self.logger.info(f"CommitWorker {self.worker_id} stopping...")
+        self.logger.info("CommitWorker %s stopping...", self.worker_id)
+        if self.event_queue is not None:
+            self.event_queue.put(self._SENTINEL)
+
+    @staticmethod
+    def _config_paths(event: FileSystemEvent) -> List[str]:
+        """
+        Find the .gitinclude and .gitignore files an event affects.
+
+        Args:
+            event: The file system event to check
+
+        Returns:
+            The source and/or destination path if they are configuration files
+        """
+        paths = (
+            os.fsdecode(event.src_path),
+            os.fsdecode(getattr(event, "dest_path", "") or ""),
+        )
+        return [path for path in paths if os.path.basename(path) in CONFIG_FILE_NAMES]
+
+    def _route_event(self, event: FileSystemEvent) -> List[str]:
+        """
+        Decide what to do with a single file system event.
+
+        Ignored and ambiguous files are dealt with here; included files are
+        left to the caller to commit. A move is routed by its destination,
+        and its source is also staged if it is included, so that the commit
+        records the old path's removal along with the new file.
+
+        Args:
+            event: The file system event to process
+
+        Returns:
+            The paths to stage; empty if nothing should be committed
+        """
+        self.logger.debug("Processing event: %s - %s", event.src_path, event.event_type)
+
+        # Cached rules and file actions are stale once include/ignore rules change
+        for config_path in self._config_paths(event):
+            self.logger.info("Configuration changed: %s", config_path)
+            self.config_manager.refresh(config_path)
+
+        # watchdog paths may be bytes; git and the file action cache want str
+        src_path = os.fsdecode(event.src_path)
+        dest_path = os.fsdecode(getattr(event, "dest_path", "") or "")
+        if not dest_path:
+            path = self._route_path(event, src_path)
+            return [path] if path is not None else []
+
+        paths = []
+        path = self._route_path(event, dest_path)
+        if path is not None:
+            paths.append(path)
+        if (
+            not event.is_directory
+            and self.config_manager.get_file_action(src_path) == FileAction.INCLUDE
+        ):
+            paths.append(src_path)
+        return paths
+
+    def _route_path(self, event: FileSystemEvent, path: str) -> Optional[str]:
+        """
+        Apply the configured file action to one path of an event.
+
+        Args:
+            event: The file system event being processed
+            path: The event's source or destination path
+
+        Returns:
+            The path if it should be committed, otherwise None
+        """
+        action = self.config_manager.get_file_action(path)
+        handler = self._handlers.get(action)
+        return handler(event, path) if handler is not None else None
+
+    def _handle_ignore(self, event: FileSystemEvent, path: str) -> Optional[str]:
+        """Leave an ignored file alone."""
+        self.logger.debug("Ignoring file: %s", path)
+        return None
+
+    def _handle_review(self, event: FileSystemEvent, path: str) -> Optional[str]:
+        """Queue a file with ambiguous rules for human review."""
+        self.logger.info("File needs review: %s", path)
+        self.review_queue.add_item(
+            file_path=path,
+            reason="Ambiguous include/ignore rules",
+        )
+        return None
+
+    def _handle_include(self, event: FileSystemEvent, path: str) -> Optional[str]:
+        """Hand an included file back to be committed."""
+        if event.is_directory:
+            return None
+        self.logger.info("Processing file: %s", path)
+        return path
+
+    def _commit_files(self, paths: List[str]) -> bool:
+        """
+        Stage files and commit them with a single generated message.
+
+        Args:
+            paths: Files to stage and commit
+
+        Returns:
+            True if the files were committed or there was nothing to commit
+        """
+        with self._commit_lock:
+            self.git_repo.add_files(paths)
+            staged = self.git_repo.get_staged_files(paths)
+            if not staged:
+                self.logger.debug("No staged changes to commit")
+                return True
+            diff = self.git_repo.get_diff("STAGED", paths=staged)
+
+        # Generating the message can take minutes when it falls back to
+        # Linear, so other workers keep staging and committing meanwhile.
+        # Committing only our own paths leaves their staged files out of it
+        message = self.llm_generator.generate_commit_message(diff, paths)
+        if not message:
+            self.logger.warning(
+                "Commit message generation failed. Changes left staged."
+            )
+            return False
+
+        with self._commit_lock:
+            self.git_repo.commit(message, stage_all=False, paths=staged)
+        self.logger.info("Committed %d files: %s", len(staged), message)
+        return True
 
     def process_event(self, event: FileSystemEvent) -> bool:
         """
@@ -72,70 +275,163 @@ class CommitWorker:
         Returns:
             True if event was processed successfully, False otherwise
         """
-        try:
-            self.logger.debug(
-                f"Processing event: {event.src_path} - {event.event_type}"
-            )
+        return self.process_batch([event]) == 1
 
-            # Check file action based on configuration
-            action = self.config_manager.get_file_action(event.src_path)
+    def process_batch(self, events: List[FileSystemEvent]) -> int:
+        """
+        Process a batch of file system events.
 
-            if action == FileAction.IGNORE:
-                self.logger.debug(f"Ignoring file: {event.src_path}")
-                return True
-            elif action == FileAction.REVIEW:
-                self.logger.info(f"File needs review: {event.src_path}")
-                # Add to review queue
-                self.review_queue.add_item(
-                    file_path=event.src_path,
-                    reason="Ambiguous include/ignore rules",
-                )
-                return True
-            elif action == FileAction.INCLUDE:
-                self.logger.info(f"Processing file: {event.src_path}")
-                # TODO: Integrate with git operations
-                # TODO: Integrate with LLM commit message generation
+        All included files in the batch are staged and committed together, so
+        a burst of saves produces one commit rather than one per event.
 
-            self.logger.info(f"Worker {self.worker_id} processed: {event.src_path}")
-            return True
+        Args:
+            events: The events to process, in queue order
 
-        except Exception as e:
-            self.logger.error(f"Error processing event {event.src_path}: {e}")
-            return False
+        Returns:
+            Number of events processed successfully
+        """
+        processed = 0
+        # Paths to commit, in order, and the number of events they came from
+        included: "OrderedDict[str, None]" = OrderedDict()
+        included_events = 0
+
+        for event in events:
+            try:
+                paths = self._route_event(event)
+            except Exception as e:
+                self.logger.error("Error processing event %s: %s", event.src_path, e)
+                continue
+
+            if paths:
+                included.update(dict.fromkeys(paths))
+                included_events += 1
+            else:
+                processed += 1
+
+        if included:
+            try:
+                if self._commit_files(list(included)):
+                    processed += included_events
+            except Exception as e:
+                self.logger.error("Error committing %d files: %s", len(included), e)
+
+        self.logger.debug("Worker %s processed %d events", self.worker_id, processed)
+        return processed
+
+    def _next_batch(self, event_queue: BatchQueue) -> List[Any]:
+        """
+        Dequeue the next batch of events.
+
+        Blocks until an item is queued, then keeps collecting items for up to
+        max_batch_ms ("smart batching"), or just drains whatever is already
+        queued if that is 0, up to max_batch_n items. A stop sentinel ends the
+        batch early and is returned as its last item.
+
+        Args:
+            event_queue: The queue to dequeue from
+
+        Returns:
+            The dequeued items; empty if nothing arrived within idle_timeout
+        """
+        batch: List[Any] = event_queue.get_batch(
+            self.worker_id,
+            self.max_batch_n,
+            until=self._SENTINEL,
+            timeout=self.idle_timeout,
+        )
+        if not batch:
+            return batch
+
+        deadline = time.monotonic() + self.max_batch_ms / 1000
+        while batch[-1] is not self._SENTINEL and len(batch) < self.max_batch_n:
+            more = event_queue.get_batch(
+                self.worker_id,
+                self.max_batch_n - len(batch),
+                until=self._SENTINEL,
+                timeout=max(0.0, deadline - time.monotonic()),
+            )
+            if not more:
+                break
+            batch.extend(more)
+        return batch
 
     def run(self) -> None:
         """
         Main worker loop that processes events from the queue.
 
-        This method runs continuously until stopped, pulling events
-        from the queue and processing them.
+        This method blocks on the queue without polling, processing events
+        in batches until it dequeues a stop sentinel (see stop()) or retires
+        after idle_timeout.
         """
         self.start()
 
-        while self.running:
+        event_queue = self.event_queue
+        if event_queue is None:
+            # Nothing to consume; idle until stopped
+            while self.running:
+                time.sleep(0.1)
+            return
+
+        while True:
             try:
-                # Process events directly since we don't have an event queue
-                # This is a simplified version for testing
-                time.sleep(0.1)  # Brief pause to prevent tight loops
+                batch = self._next_batch(event_queue)
+                if not batch:
+                    # Idle for idle_timeout seconds
+                    if self.can_retire is None or self.can_retire(self):
+                        self.running = False
+                        self.logger.info(
+                            "CommitWorker %s retiring after %ss idle",
+                            self.worker_id,
+                            self.idle_timeout,
+                        )
+                        break
+                    continue
+
+                stopping = batch[-1] is self._SENTINEL
+                events = batch[:-1] if stopping else batch
+
+                try:
+                    self.process_batch(events)
+                finally:
+                    event_queue.task_done(len(batch))
+
+                if stopping:
+                    break
 
             except Exception as e:
-                self.logger.error(f"Unexpected error in worker loop: {e}")
+                self.logger.error("Unexpected error in worker loop: %s", e)
                 time.sleep(0.1)  # Brief pause to prevent tight error loops
 
 
 class CommitWorkerPool:
     """
     Manages a pool of CommitWorker threads for processing file change events.
+
+    Each worker runs its own long-lived loop on a dedicated thread. The work
+    is dominated by git subprocesses, SQLite and LLM HTTP calls, all of which
+    release the GIL while blocked, so threads overlap it without having to
+    pickle the shared repository, database and configuration objects.
+
+    The pool keeps num_workers core workers running. If max_workers is
+    larger, a monitor thread adds workers while the queue backlog exceeds
+    scale_up_threshold, and those extra workers exit again once they have
+    been idle for scale_down_idle_s.
     """
 
     def __init__(
         self,
         config_manager: ConfigurationManager,
         git_repo,
-        event_queue: Queue,
+        event_queue: "Union[Queue[Any], SimpleQueue[Any], BatchQueue]",
         review_queue: ReviewQueue,
         llm_generator,
         num_workers: int = 2,
+        cpu_sets: Optional[List[Set[int]]] = None,
+        max_batch_n: int = EVENT_BATCH_SIZE,
+        max_batch_ms: int = BATCH_LINGER_MS,
+        max_workers: Optional[int] = None,
+        scale_up_threshold: int = EVENT_BATCH_SIZE,
+        scale_down_idle_s: float = 30.0,
     ):
         """
         Initialize the CommitWorkerPool.
@@ -143,39 +439,173 @@ class CommitWorkerPool:
         Args:
             config_manager: Configuration manager for file filtering
             git_repo: Git repository wrapper
-            event_queue: Thread-safe queue containing file system events
+            event_queue: Thread-safe queue containing file system events; a
+                ShardedEventQueue should have one shard per core worker
             review_queue: Queue for files needing human review
             llm_generator: LLM commit message generator
-            num_workers: Number of worker threads to create
+            num_workers: Number of core worker threads, which always run
+            cpu_sets: CPUs to pin each worker to, indexed by worker id (see
+                config.worker_cpu_sets), or None to leave workers unpinned
+            max_batch_n: Maximum number of events each worker batches
+            max_batch_ms: How long workers keep collecting events for a batch
+            max_workers: Upper bound on workers when scaling up under load;
+                None or num_workers disables scaling
+            scale_up_threshold: Queue backlog above which a worker is added
+            scale_down_idle_s: Seconds an extra worker may sit idle before it
+                exits
         """
         self.config_manager = config_manager
         self.git_repo = git_repo
-        self.event_queue = event_queue
+        self.event_queue = as_batch_queue(event_queue)
         self.review_queue = review_queue
         self.llm_generator = llm_generator
         self.num_workers = num_workers
+        self.cpu_sets = cpu_sets
+        self.max_batch_n = max_batch_n
+        self.max_batch_ms = max_batch_ms
+        self.max_workers = max(num_workers, max_workers or num_workers)
+        self.scale_up_threshold = scale_up_threshold
+        self.scale_down_idle_s = scale_down_idle_s
+        self.worker_nodes: List[Optional[int]] = [None] * num_workers
         self.workers: List[CommitWorker] = []
-        self.executor: Optional[ThreadPoolExecutor] = None
+        self.threads: List[threading.Thread] = []
         self.logger = logging.getLogger("CommitWorkerPool")
 
-    def start(self) -> None:
-        """Start the worker pool."""
-        self.logger.info(f"Starting CommitWorkerPool with {self.num_workers} workers")
+        # Guards workers and threads while extra workers come and go
+        self._lock = threading.Lock()
+        self._scaling = False
+        self._stop_monitor = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
 
-        # Create the thread pool executor
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.num_workers, thread_name_prefix="CommitWorker"
-        )
+    def _worker_nodes(self) -> List[Optional[int]]:
+        """
+        Work out the NUMA node each worker is pinned to.
 
-        # Create and start workers
+        Returns:
+            Node per worker id, or None for unpinned workers and CPU sets
+            spanning several nodes
+        """
+        cpu_nodes = cpu_numa_nodes()
+        worker_nodes: List[Optional[int]] = []
         for i in range(self.num_workers):
-            worker = CommitWorker(
-                self.config_manager, self.git_repo, self.review_queue, self.llm_generator, worker_id=i
+            cpu_set = self.cpu_sets[i] if self.cpu_sets else None
+            nodes = {cpu_nodes.get(cpu) for cpu in cpu_set or ()}
+            worker_nodes.append(nodes.pop() if len(nodes) == 1 else None)
+        return worker_nodes
+
+    def _spawn_worker(self, worker_id: int, idle_timeout: Optional[float]) -> None:
+        """
+        Create a worker and start it on its own thread.
+
+        Called with the lock held.
+
+        Args:
+            worker_id: Id of the new worker
+            idle_timeout: Seconds of idleness after which the worker exits, or
+                None for a core worker
+        """
+        cpu_set = None
+        if self.cpu_sets:
+            cpu_set = self.cpu_sets[worker_id % len(self.cpu_sets)]
+
+        worker = CommitWorker(
+            self.config_manager,
+            self.git_repo,
+            self.review_queue,
+            self.llm_generator,
+            worker_id=worker_id,
+            event_queue=self.event_queue,
+            cpu_set=cpu_set,
+            max_batch_n=self.max_batch_n,
+            max_batch_ms=self.max_batch_ms,
+            idle_timeout=idle_timeout,
+            can_retire=self._retire_worker,
+        )
+        self.workers.append(worker)
+
+        # Run each worker loop on its own thread
+        thread = threading.Thread(
+            target=worker.run, name=f"CommitWorker-{worker_id}", daemon=True
+        )
+        self.threads.append(thread)
+        thread.start()
+
+    def _retire_worker(self, worker: CommitWorker) -> bool:
+        """
+        Let an idle extra worker leave the pool.
+
+        Refused once the pool is stopping, because stop() has then already
+        queued a sentinel for the worker.
+
+        Args:
+            worker: The worker asking to exit
+
+        Returns:
+            True if the worker should exit
+        """
+        with self._lock:
+            if not self._scaling:
+                return False
+            index = self.workers.index(worker)
+            del self.workers[index]
+            del self.threads[index]
+            self.logger.info(
+                "Retired idle worker %s, %d workers left",
+                worker.worker_id,
+                len(self.workers),
             )
-            self.workers.append(worker)
+            return True
+
+    def _monitor(self) -> None:
+        """Monitor loop: add a worker whenever the backlog is too deep."""
+        while not self._stop_monitor.wait(SCALE_CHECK_INTERVAL):
+            backlog = self.event_queue.qsize()
+            if backlog <= self.scale_up_threshold:
+                continue
+
+            with self._lock:
+                if not self._scaling or len(self.workers) >= self.max_workers:
+                    continue
+                # Reuse the lowest id an extra worker has retired from
+                used_ids = {worker.worker_id for worker in self.workers}
+                worker_id = next(
+                    i
+                    for i in range(self.num_workers, self.max_workers)
+                    if i not in used_ids
+                )
+                self._spawn_worker(worker_id, idle_timeout=self.scale_down_idle_s)
+                self.logger.info(
+                    "Backlog of %d events, added worker %s (%d workers)",
+                    backlog,
+                    worker_id,
+                    len(self.workers),
+                )
 
-            # Submit worker to thread pool
-            self.executor.submit(worker.run)
+    def start(self) -> None:
+        """Start the worker pool."""
+        self.logger.info("Starting CommitWorkerPool with %d workers", self.num_workers)
+
+        # Steal node-locally first when workers are pinned one per shard
+        if (
+            self.cpu_sets
+            and isinstance(self.event_queue, ShardedEventQueue)
+            and self.event_queue.num_shards == self.num_workers
+        ):
+            self.worker_nodes = self._worker_nodes()
+            self.event_queue.set_shard_nodes(self.worker_nodes)
+
+        # Create and start the core workers
+        with self._lock:
+            for i in range(self.num_workers):
+                self._spawn_worker(i, idle_timeout=None)
+
+            if self.max_workers > self.num_workers:
+                self._scaling = True
+                self._stop_monitor.clear()
+                self._monitor_thread = threading.Thread(
+                    target=self._monitor, name="CommitWorkerPool-monitor", daemon=True
+                )
+                self._monitor_thread.start()
 
         self.logger.info("CommitWorkerPool started successfully")
 
@@ -183,17 +613,32 @@ class CommitWorkerPool:
         """Stop the worker pool and all workers."""
         self.logger.info("Stopping CommitWorkerPool...")
 
+        # Stop scaling first, so the set of workers no longer changes
+        with self._lock:
+            self._scaling = False
+            self._stop_monitor.set()
+            workers = list(self.workers)
+            threads = list(self.threads)
+        if self._monitor_thread is not None:
+            self._monitor_thread.join()
+            self._monitor_thread = None
+
         # Stop all workers
-        for worker in self.workers:
+        for worker in workers:
             worker.stop()
 
-        # Shutdown the executor
-        if self.executor:
-            self.executor.shutdown(wait=True)
+        # Wait for the worker loops to exit
+        for thread in threads:
+            thread.join()
+        self.threads.clear()
 
         self.logger.info("CommitWorkerPool stopped")
 
     def wait_for_completion(self) -> None:
-        """Wait for all queued events to be processed."""
-        if self.event_queue:
-            self.event_queue.join()
+        """
+        Wait for all queued events to be processed.
+
+        A SimpleQueue has no join(), so for one this only waits until every
+        event has been dequeued; the last batch may still be in progress.
+        """
+        self.event_queue.join()
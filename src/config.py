@@ -1,10 +1,26 @@
-from dataclasses import dataclass
-from typing import List, Optional
+import copy
+import dataclasses
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, get_args, get_origin
 
 import yaml
 
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+AFFINITY_STRATEGIES = ("dense", "sparse")
+
+# Commas separate affinity items, except inside a bracketed group
+_AFFINITY_SEPARATOR = re.compile(r",(?![^\[]*\])")
+
+# A group of CPUs shared by several workers, e.g. "[0-3]:2"
+_AFFINITY_GROUP = re.compile(r"\[(?P<cpus>[^\]]+)\]:(?P<count>\d+)")
+
+
+@dataclass(frozen=True)
 class LLMConfig:
     """Configuration for LLM integration."""
 
@@ -14,49 +30,240 @@ class LLMConfig:
     enable_linear_fallback: bool = True
     fallback_team_id: str = "b5f1d099-acc2-4e51-a415-76c00c00f23b"
     fallback_project_id: Optional[str] = None
+    fallback_webhook_secret: Optional[str] = None
+    max_diff_chars: int = 8000
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppConfig:
-    """Dataclass holding the application configuration."""
+    """Immutable dataclass holding the application configuration."""
 
     watch_directory: str
-    log_level: str
-    include_patterns: List[str]
-    exclude_patterns: List[str]
-    llm: LLMConfig
+    log_level: str = "INFO"
+    include_patterns: List[str] = field(default_factory=lambda: ["*"])
+    exclude_patterns: List[str] = field(default_factory=list)
+    llm: LLMConfig = field(default_factory=LLMConfig)
+    worker_affinity: Optional[str] = None
+    affinity_strategy: Optional[str] = None
+    max_batch_n: int = 64
+    max_batch_ms: int = 200
+    coalesce_ms: int = 200
+    min_workers: int = 2
+    max_workers: int = 2
+    scale_up_threshold: int = 64
+    scale_down_idle_s: float = 30.0
+
+
+def _parse_cpu_range(spec: str) -> List[int]:
+    """Parses "3" or "1-4" into a list of CPU numbers."""
+    start, sep, end = spec.strip().partition("-")
+    try:
+        first = int(start)
+        last = int(end) if sep else first
+    except ValueError:
+        raise ValueError(f"Invalid CPU range '{spec.strip()}'")
+    if first < 0 or last < first:
+        raise ValueError(f"Invalid CPU range '{spec.strip()}'")
+    return list(range(first, last + 1))
+
+
+def parse_worker_affinity(spec: str) -> List[Set[int]]:
+    """
+    Parses a worker affinity string into one CPU set per worker slot.
+
+    Uses Hazelcast's thread affinity syntax: "1,2" and "1-4" give each slot a
+    single CPU, while "[0-3]:2" gives two slots that share CPUs 0-3. Items
+    can be combined, e.g. "0,[2-5]:2".
+    """
+    cpu_sets: List[Set[int]] = []
+    for item in _AFFINITY_SEPARATOR.split(spec):
+        item = item.strip()
+        group = _AFFINITY_GROUP.fullmatch(item)
+        if group:
+            cpus = set()
+            for cpu_range in group.group("cpus").split(","):
+                cpus.update(_parse_cpu_range(cpu_range))
+            cpu_sets.extend(set(cpus) for _ in range(int(group.group("count"))))
+        else:
+            cpu_sets.extend({cpu} for cpu in _parse_cpu_range(item))
+    return cpu_sets
+
+
+def worker_cpu_sets(
+    worker_affinity: Optional[str],
+    affinity_strategy: Optional[str],
+    num_workers: int,
+) -> Optional[List[Set[int]]]:
+    """
+    Computes the CPU set each commit worker should be pinned to.
+
+    An explicit worker_affinity takes precedence; its slots are assigned to
+    workers round-robin. Otherwise the strategy picks CPUs from those this
+    process may run on: "dense" packs workers onto neighbouring CPUs, while
+    "sparse" spreads them as far apart as possible.
+
+    Returns:
+        One CPU set per worker, or None if workers should not be pinned.
+    """
+    if worker_affinity:
+        slots = parse_worker_affinity(worker_affinity)
+        return [slots[i % len(slots)] for i in range(num_workers)]
+
+    if not affinity_strategy or not hasattr(os, "sched_getaffinity"):
+        return None
+    if affinity_strategy not in AFFINITY_STRATEGIES:
+        raise ValueError(f"Invalid affinity_strategy '{affinity_strategy}'")
+
+    cpus = sorted(os.sched_getaffinity(0))
+    if affinity_strategy == "dense":
+        indices = [i % len(cpus) for i in range(num_workers)]
+    else:
+        indices = [i * len(cpus) // num_workers % len(cpus) for i in range(num_workers)]
+    return [{cpus[index]} for index in indices]
+
+
+def _compile_schema(cls: Any) -> Tuple[Tuple[str, Any, bool], ...]:
+    """Lists (name, type, required) for each field of a config dataclass."""
+    return tuple(
+        (
+            f.name,
+            f.type,
+            f.default is dataclasses.MISSING
+            and f.default_factory is dataclasses.MISSING,
+        )
+        for f in dataclasses.fields(cls)
+    )
+
+
+# Built once from the dataclass definitions, so adding a field to AppConfig or
+# LLMConfig is all it takes to parse and validate a new setting
+_SCHEMAS: Dict[Any, Tuple[Tuple[str, Any, bool], ...]] = {
+    LLMConfig: _compile_schema(LLMConfig),
+    AppConfig: _compile_schema(AppConfig),
+}
+
+
+def _matches_type(value: Any, expected: Any) -> bool:
+    """Checks a parsed YAML value against a field's type annotation."""
+    origin = get_origin(expected)
+    if origin is Union:
+        return any(_matches_type(value, arg) for arg in get_args(expected))
+    if origin is list:
+        (item_type,) = get_args(expected)
+        return isinstance(value, list) and all(
+            _matches_type(item, item_type) for item in value
+        )
+    if expected is type(None):
+        return value is None
+    if isinstance(value, bool):
+        return expected is bool
+    if expected is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
+def _type_name(expected: Any) -> str:
+    """Describes a field's type annotation for error messages."""
+    if isinstance(expected, type):
+        return expected.__name__
+    return str(expected).replace("typing.", "")
+
+
+def _build_config(cls: Any, raw: Any, section: str = "") -> Any:
+    """
+    Validates a parsed YAML mapping against a config dataclass and builds it.
+
+    Missing optional keys take the dataclass defaults; unknown keys are
+    ignored.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError(f"Configuration section '{section}' must be a mapping")
+
+    values: Dict[str, Any] = {}
+    for name, expected, required in _SCHEMAS[cls]:
+        key = f"{section}.{name}" if section else name
+        if name not in raw:
+            if required:
+                raise ValueError(f"Configuration must define '{key}'")
+            continue
+
+        value = raw[name]
+        if dataclasses.is_dataclass(expected):
+            value = _build_config(expected, {} if value is None else value, key)
+        elif not _matches_type(value, expected):
+            raise ValueError(
+                f"Configuration value '{key}' must be {_type_name(expected)}, "
+                f"got {value!r}"
+            )
+        values[name] = value
+    return cls(**values)
 
 
 def load_config(path: str = "config.yml") -> AppConfig:
-    """Loads configuration from a YAML file."""
+    """
+    Loads configuration from a YAML file.
+
+    Parsed configurations are cached by path, size and modification time, so
+    reloading an unchanged file returns a copy without parsing it again.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # Let the parser report the missing file
+        return _parse_config(path)
+
+    cached = _load_config_cached(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    return copy.deepcopy(cached)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path: str, size: int, mtime_ns: int) -> AppConfig:
+    """Parses a configuration file once per (path, size, mtime_ns)."""
+    return _parse_config(path)
+
+
+def _parse_config(path: str) -> AppConfig:
+    """Parses a YAML configuration file into an AppConfig."""
     try:
         with open(path, "r") as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=_YAML_LOADER)
 
-        # Basic validation
-        if not raw_config or "watch_directory" not in raw_config:
+        if not raw_config:
             raise ValueError("Configuration must define 'watch_directory'")
+        if not isinstance(raw_config, dict):
+            raise ValueError("Configuration must be a mapping")
+        raw_config = dict(raw_config)
 
-        # Parse LLM configuration
-        llm_config_data = raw_config.get("llm", {})
-        llm_config = LLMConfig(
-            base_url=llm_config_data.get("base_url", "http://localhost:11434"),
-            model_name=llm_config_data.get("model_name", "sequentialthought"),
-            timeout_seconds=llm_config_data.get("timeout_seconds", 30),
-            enable_linear_fallback=llm_config_data.get("enable_linear_fallback", True),
-            fallback_team_id=llm_config_data.get(
-                "fallback_team_id", "b5f1d099-acc2-4e51-a415-76c00c00f23b"
-            ),
-            fallback_project_id=llm_config_data.get("fallback_project_id"),
-        )
+        # Accept both "0-3" and a YAML list of CPU numbers
+        worker_affinity = raw_config.get("worker_affinity")
+        if isinstance(worker_affinity, list):
+            worker_affinity = ",".join(str(cpu) for cpu in worker_affinity)
+        if worker_affinity is not None:
+            raw_config["worker_affinity"] = str(worker_affinity)
 
-        return AppConfig(
-            watch_directory=raw_config.get("watch_directory"),
-            log_level=raw_config.get("log_level", "INFO"),
-            include_patterns=raw_config.get("include_patterns", ["*"]),
-            exclude_patterns=raw_config.get("exclude_patterns", []),
-            llm=llm_config,
-        )
+        # max_workers defaults to min_workers, i.e. no scaling
+        if "max_workers" not in raw_config and "min_workers" in raw_config:
+            raw_config["max_workers"] = raw_config["min_workers"]
+
+        config: AppConfig = _build_config(AppConfig, raw_config)
+
+        if config.worker_affinity is not None:
+            parse_worker_affinity(config.worker_affinity)
+
+        if (
+            config.affinity_strategy is not None
+            and config.affinity_strategy not in AFFINITY_STRATEGIES
+        ):
+            raise ValueError(
+                f"affinity_strategy must be one of {', '.join(AFFINITY_STRATEGIES)}"
+            )
+
+        if config.min_workers < 1 or config.max_workers < config.min_workers:
+            raise ValueError(
+                "Worker counts must satisfy 1 <= min_workers <= max_workers"
+            )
+
+        return config
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found at: {path}")
     except yaml.YAMLError as e:
@@ -8,9 +8,228 @@ decisions.
 
 import fnmatch
 import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Pattern, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from src.file_filter import PathFilter
+    from src.git_ops import GitRepo
+
+# Names of the configuration files that hold include/ignore patterns
+CONFIG_FILE_NAMES = frozenset({".gitinclude", ".gitignore"})
+
+# Maximum number of per-path file actions remembered between cache clears
+ACTION_CACHE_SIZE = 8192
+
+# Maximum number of directories whose applicable config files are remembered;
+# paths of deleted files are walked from the path itself, so this is bounded
+CONFIG_DIR_CACHE_SIZE = 4096
+
+# Maximum number of translated globs and of distinct pattern sets whose
+# compiled matchers are kept; nested config files repeat the same patterns
+PATTERN_CACHE_SIZE = 4096
+
+# Tracked file count from which default ignore patterns are checked in
+# parallel processes; below it one pass takes less than starting the workers
+PARALLEL_SCAN_MIN_FILES = 200_000
+
+
+# Glob metacharacters; a pattern without any is matched as a plain string
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a glob into a regular expression, memoized across config files.
+
+    Args:
+        pattern: fnmatch glob
+
+    Returns:
+        Regular expression source for the glob
+    """
+    return fnmatch.translate(pattern)
+
+
+class PatternMatcher:
+    """
+    Matches relative POSIX paths against one configuration file's patterns.
+
+    Patterns ending in "/" match that directory literally and everything below
+    it, anything else is an fnmatch glob. Patterns are bucketed by shape so
+    that large pattern sets stay cheap: "*.ext" suffixes are checked with one
+    str.endswith call, plain names and directories with a set lookup and one
+    str.startswith call, and only the remaining globs with a union regex.
+    """
+
+    __slots__ = ("_literals", "_suffixes", "_dir_prefixes", "_regex")
+
+    def __init__(self, patterns: List[str]):
+        """
+        Initialize the PatternMatcher.
+
+        Args:
+            patterns: Patterns from one configuration file
+        """
+        literals = set()
+        suffixes = []
+        dir_prefixes = []
+        globs = []
+        for pattern in patterns:
+            if pattern.endswith("/"):
+                directory = pattern.rstrip("/")
+                literals.add(directory)
+                dir_prefixes.append(directory + "/")
+            elif not _GLOB_CHARS.search(pattern):
+                literals.add(pattern)
+            elif pattern[0] == "*" and not _GLOB_CHARS.search(pattern, 1):
+                # "*" also matches "/", so "*.log" is just a suffix test
+                suffixes.append(pattern[1:])
+            else:
+                globs.append(pattern)
+
+        self._literals = frozenset(literals)
+        self._suffixes = tuple(suffixes)
+        self._dir_prefixes = tuple(dir_prefixes)
+        self._regex: Optional[Pattern[str]] = None
+        if globs:
+            self._regex = re.compile(
+                "|".join(f"(?:{_translate_glob(glob)})" for glob in globs),
+                re.DOTALL,
+            )
+
+    def match(self, path: str) -> bool:
+        """
+        Check whether any pattern matches a path.
+
+        Args:
+            path: Path relative to the configuration file's directory
+
+        Returns:
+            True if a pattern matches
+        """
+        return (
+            path in self._literals
+            or path.endswith(self._suffixes)
+            or path.startswith(self._dir_prefixes)
+            or (self._regex is not None and self._regex.match(path) is not None)
+        )
+
+
+def _posix(path: str) -> str:
+    """
+    Convert a native path string to POSIX separators.
+
+    Args:
+        path: Path using the platform's separator
+
+    Returns:
+        The path with "/" separators
+    """
+    return path if os.sep == "/" else path.replace(os.sep, "/")
+
+
+def _relative_posix(path: str, directory: str) -> Optional[str]:
+    """
+    Make a POSIX path relative to a directory, like Path.relative_to.
+
+    Plain string slicing, as both paths are already absolute and resolved.
+
+    Args:
+        path: Absolute POSIX path
+        directory: Absolute POSIX path of the directory
+
+    Returns:
+        The relative path ("." for the directory itself), or None if path is
+        not under directory
+    """
+    if path == directory:
+        return "."
+    prefix = directory if directory.endswith("/") else directory + "/"
+    if path.startswith(prefix):
+        return path[len(prefix) :]
+    return None
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[PatternMatcher]:
+    """
+    Combine config patterns into a single matcher.
+
+    Matchers are shared between configuration files with the same patterns.
+
+    Args:
+        patterns: Patterns from one configuration file
+
+    Returns:
+        Matcher for the patterns, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return _shared_matcher(tuple(patterns))
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _shared_matcher(patterns: Tuple[str, ...]) -> PatternMatcher:
+    """
+    Build, or reuse, the matcher for a set of patterns.
+
+    Args:
+        patterns: Patterns from one configuration file
+
+    Returns:
+        Matcher for the patterns
+    """
+    return PatternMatcher(list(patterns))
+
+
+def _usable_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _scan_tracked_files(files: List[str], patterns: Tuple[str, ...]) -> Set[str]:
+    """
+    Find which patterns match at least one of some tracked files.
+
+    Checks each file against all patterns not yet known to match with a
+    single combined matcher; only the rare files that match are checked
+    pattern by pattern. Module-level so that worker processes can run it.
+
+    Args:
+        files: Tracked file paths, relative to the repository root
+        patterns: Patterns to check
+
+    Returns:
+        The patterns that match one of the files
+    """
+    matched: Set[str] = set()
+    remaining = list(patterns)
+    matcher = _compile_patterns(remaining)
+    for file_path in files:
+        if matcher is None:
+            break
+        if not matcher.match(file_path):
+            continue
+
+        matched.update(
+            pattern
+            for pattern in remaining
+            if PatternMatcher([pattern]).match(file_path)
+        )
+        remaining = [pattern for pattern in remaining if pattern not in matched]
+        matcher = _compile_patterns(remaining)
+    return matched
 
 
 class FileAction(Enum):
@@ -29,135 +248,234 @@ class ConfigurationManager:
     and applies rules in the correct precedence order.
     """
 
-    def __init__(self, watch_directory: str):
+    def __init__(
+        self,
+        watch_directory: str,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+    ):
         """
         Initialize the ConfigurationManager.
 
         Args:
             watch_directory: Root directory being watched
+            include_patterns: Application-level globs a path (relative to the
+                watch directory) must match to be considered at all, or None
+                to consider every path
+            exclude_patterns: Application-level globs for paths that are
+                always ignored; they take precedence over include_patterns
         """
         self.watch_directory = Path(watch_directory).resolve()
+        self._watch_directory_str = self.watch_directory.as_posix()
         self.logger = logging.getLogger("ConfigurationManager")
 
+        # Application-level filter, each side compiled into one union regex
+        self._path_filter: Optional["PathFilter"] = None
+        if include_patterns is not None or exclude_patterns is not None:
+            from src.file_filter import PathFilter
+
+            self._path_filter = PathFilter(
+                ["*"] if include_patterns is None else include_patterns,
+                exclude_patterns or [],
+            )
+
+        # The per-file caches below are keyed by str(config_path): hashing a
+        # Path rebuilds a tuple of its parts on every lookup
+
         # Cache for parsed configuration files
-        self._config_cache: dict[Path, List[str]] = {}
+        self._config_cache: dict[str, List[str]] = {}
+
+        # Cache of each configuration file's patterns compiled into a matcher
+        self._matcher_cache: dict[str, Optional[PatternMatcher]] = {}
 
-    def _find_config_files(self, file_path: Path) -> List[Tuple[Path, str]]:
+        # POSIX path of each configuration file's directory
+        self._config_dir_strs: dict[str, str] = {}
+
+        # Cache of the configuration files applying to each directory, root
+        # first, so files sharing a directory are resolved with one lookup
+        # (keyed by POSIX directory string, so lookups allocate no Path)
+        self._dir_configs: dict[str, Tuple[Tuple[Path, str], ...]] = {}
+
+        # Cache of resolved actions per path, cleared with the config cache
+        self._action_cache = lru_cache(maxsize=ACTION_CACHE_SIZE)(
+            self._resolve_file_action
+        )
+
+    def _find_config_files(
+        self, file_path: Union[str, Path]
+    ) -> List[Tuple[Path, str]]:
         """
         Find all .gitinclude and .gitignore files from root to file location.
 
         Args:
-            file_path: Path to the file being checked
+            file_path: Resolved path (Path or string) of the file being checked
 
         Returns:
             List of (config_file_path, config_type) tuples in precedence order
         """
-        config_files: List[Tuple[Path, str]] = []
+        file_path_str = _posix(os.fspath(file_path))
 
-        # Start from the file's directory and walk up to watch_directory
-        current_dir = file_path.parent if file_path.is_file() else file_path
+        # Start from the file's directory
+        current_dir = file_path_str
+        if os.path.isfile(file_path_str):
+            current_dir = os.path.dirname(file_path_str)
 
         # Ensure we're within the watch directory
-        try:
-            current_dir.relative_to(self.watch_directory)
-        except ValueError:
-            self.logger.warning(f"File {file_path} is outside watch directory")
-            return config_files
+        if _relative_posix(current_dir, self._watch_directory_str) is None:
+            self.logger.warning("File %s is outside watch directory", file_path)
+            return []
+
+        dir_configs = self._dir_configs.get(current_dir)
+        if dir_configs is None:
+            dir_configs = self._collect_dir_configs(current_dir)
+        return list(dir_configs)
+
+    def _collect_dir_configs(self, directory: str) -> Tuple[Tuple[Path, str], ...]:
+        """
+        Work out and cache the configuration files applying to a directory.
+
+        Walks up only as far as the nearest directory already in the cache,
+        then extends its list back down, caching every directory on the way.
+
+        Args:
+            directory: POSIX path of a directory inside the watch directory
+
+        Returns:
+            (config_file_path, config_type) tuples in precedence order
+        """
+        uncached = []
+        inherited: Tuple[Tuple[Path, str], ...] = ()
 
         # Walk up the directory tree
+        current_dir = directory
         while True:
-            # Check for .gitinclude
-            gitinclude_path = current_dir / ".gitinclude"
-            if gitinclude_path.exists():
-                config_files.append((gitinclude_path, "include"))
-
-            # Check for .gitignore
-            gitignore_path = current_dir / ".gitignore"
-            if gitignore_path.exists():
-                config_files.append((gitignore_path, "ignore"))
+            cached = self._dir_configs.get(current_dir)
+            if cached is not None:
+                inherited = cached
+                break
+            uncached.append(current_dir)
 
             # Stop if we've reached the watch directory
-            if current_dir == self.watch_directory:
+            if current_dir == self._watch_directory_str:
                 break
 
             # Move up one directory
-            parent = current_dir.parent
+            parent = os.path.dirname(current_dir)
             if parent == current_dir:  # Reached filesystem root
                 break
             current_dir = parent
 
-        # Reverse to get root-to-leaf order (lower precedence to higher)
-        return list(reversed(config_files))
+        if len(self._dir_configs) + len(uncached) > CONFIG_DIR_CACHE_SIZE:
+            self._dir_configs.clear()
+
+        # Walk back down in root-to-leaf order (lower precedence to higher)
+        for current_dir in reversed(uncached):
+            inherited += self._scan_config_dir(current_dir)
+            self._dir_configs[current_dir] = inherited
+        return inherited
+
+    @staticmethod
+    def _scan_config_dir(directory: Union[str, Path]) -> Tuple[Tuple[Path, str], ...]:
+        """
+        Look for configuration files directly inside a directory.
+
+        Args:
+            directory: Directory to check (Path or string)
 
-    def _parse_config_file(self, config_path: Path) -> List[str]:
+        Returns:
+            (config_file_path, config_type) tuples in precedence order
+        """
+        # One directory listing finds both files; checking each name with
+        # Path.exists would cost a stat per name
+        try:
+            with os.scandir(directory) as entries:
+                found = {
+                    entry.name
+                    for entry in entries
+                    if entry.name in CONFIG_FILE_NAMES and entry.is_file()
+                }
+        except OSError:
+            return ()
+
+        config_files = []
+        if ".gitignore" in found:
+            config_files.append((Path(directory, ".gitignore"), "ignore"))
+        if ".gitinclude" in found:
+            config_files.append((Path(directory, ".gitinclude"), "include"))
+
+        return tuple(config_files)
+
+    def _parse_config_file(self, config_path: Union[str, Path]) -> List[str]:
         """
         Parse a configuration file and return list of patterns.
 
         Args:
-            config_path: Path to the configuration file
+            config_path: Path (or its string form) of the configuration file
 
         Returns:
             List of patterns from the file
         """
-        if config_path in self._config_cache:
-            return self._config_cache[config_path]
+        key = str(config_path)
+        cached = self._config_cache.get(key)
+        if cached is not None:
+            return cached
 
-        patterns = []
+        patterns: List[str] = []
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith("#"):
-                        patterns.append(line)
+            # Config files are small; read and split them in one go
+            data = Path(config_path).read_bytes()
+            lines = data.decode("utf-8", "replace").splitlines()
+            # Skip empty lines and comments
+            patterns = [
+                line for line in map(str.strip, lines) if line and line[0] != "#"
+            ]
 
-            self._config_cache[config_path] = patterns
-            self.logger.debug(f"Parsed {len(patterns)} patterns from {config_path}")
+            self._config_cache[key] = patterns
+            self.logger.debug("Parsed %d patterns from %s", len(patterns), config_path)
 
         except Exception as e:
-            self.logger.error(f"Error parsing config file {config_path}: {e}")
+            self.logger.error("Error parsing config file %s: %s", config_path, e)
 
         return patterns
 
-    def _matches_pattern(self, file_path: Path, pattern: str, config_dir: Path) -> bool:
+    def _get_matcher(
+        self, config_path: Union[str, Path]
+    ) -> Optional[PatternMatcher]:
         """
-        Check if a file path matches a pattern.
+        Get the compiled matcher for a configuration file's patterns.
 
         Args:
-            file_path: Absolute path to the file
-            pattern: Pattern to match against
-            config_dir: Directory containing the config file
+            config_path: Path (or its string form) of the configuration file
 
         Returns:
-            True if the pattern matches
+            Compiled matcher, or None if the file has no patterns
         """
+        key = str(config_path)
         try:
-            # Make file path relative to config directory
-            rel_path = file_path.relative_to(config_dir)
-            rel_path_str = str(rel_path).replace("\\", "/")
+            return self._matcher_cache[key]
+        except KeyError:
+            matcher = _compile_patterns(self._parse_config_file(config_path))
+            self._matcher_cache[key] = matcher
+            return matcher
 
-            # Handle directory patterns (ending with /)
-            if pattern.endswith("/"):
-                # Match if file is in this directory
-                dir_pattern = pattern.rstrip("/")
-                return (
-                    rel_path_str.startswith(dir_pattern + "/")
-                    or rel_path_str == dir_pattern
-                )
+    def get_file_action(self, file_path: str) -> FileAction:
+        """
+        Determine the action for a file based on configuration rules.
 
-            # Regular file pattern matching
-            return fnmatch.fnmatch(rel_path_str, pattern)
+        Results are cached per path until clear_cache() is called or a
+        pattern is added.
 
-        except ValueError:
-            # File is not under config directory
-            return False
-        except Exception as e:
-            self.logger.error(f"Error matching pattern {pattern}: {e}")
-            return False
+        Args:
+            file_path: Path to the file to check
 
-    def get_file_action(self, file_path: str) -> FileAction:
+        Returns:
+            FileAction indicating what to do with the file
         """
-        Determine the action for a file based on configuration rules.
+        return self._action_cache(file_path)
+
+    def _resolve_file_action(self, file_path: str) -> FileAction:
+        """
+        Resolve the action for a file by walking its configuration files.
 
         Args:
             file_path: Path to the file to check
@@ -165,32 +483,36 @@ class ConfigurationManager:
         Returns:
             FileAction indicating what to do with the file
         """
-        file_path_obj = Path(file_path).resolve()
+        # Plain strings throughout: pathlib's resolve, parent and relative_to
+        # cost more than the pattern matching itself
+        file_path_str = _posix(os.path.realpath(file_path))
+
+        if self._path_filter is not None:
+            filter_path = _relative_posix(file_path_str, self._watch_directory_str)
+            if not self._path_filter.should_process(filter_path or file_path_str):
+                self.logger.debug("File %s filtered out by configuration", file_path)
+                return FileAction.IGNORE
 
         # Find all relevant config files
-        config_files = self._find_config_files(file_path_obj)
+        config_files = self._find_config_files(file_path_str)
 
         if not config_files:
             # No config files found - default to review for safety
             self.logger.debug(
-                f"No config files found for {file_path}, defaulting to REVIEW"
+                "No config files found for %s, defaulting to REVIEW", file_path
             )
             return FileAction.REVIEW
 
-        include_matches = []
-        ignore_matches = []
-
-        # Process config files in precedence order
-        for config_path, config_type in config_files:
-            patterns = self._parse_config_file(config_path)
-            config_dir = config_path.parent
-
-            for pattern in patterns:
-                if self._matches_pattern(file_path_obj, pattern, config_dir):
-                    if config_type == "include":
-                        include_matches.append((config_path, pattern))
-                    else:  # ignore
-                        ignore_matches.append((config_path, pattern))
+        # Only whether any include and any ignore file matches matters, so each
+        # type is searched in precedence order only up to its first match
+        include_match = self._first_matching_config(
+            file_path_str,
+            [path for path, config_type in config_files if config_type == "include"],
+        )
+        ignore_match = self._first_matching_config(
+            file_path_str,
+            [path for path, config_type in config_files if config_type == "ignore"],
+        )
 
         # Apply precedence rules:
         # 1. If both include and ignore matches exist, it's ambiguous -> REVIEW
@@ -198,33 +520,94 @@ class ConfigurationManager:
         # 3. If only include matches exist -> INCLUDE
         # 4. If no matches exist -> REVIEW (default to safe)
 
-        if include_matches and ignore_matches:
+        if include_match and ignore_match:
             self.logger.info(
-                f"Ambiguous rules for {file_path}: "
-                f"include={len(include_matches)}, "
-                f"ignore={len(ignore_matches)}"
+                "Ambiguous rules for %s: included by %s, ignored by %s",
+                file_path,
+                include_match,
+                ignore_match,
             )
             return FileAction.REVIEW
-        elif ignore_matches:
-            self.logger.debug(
-                f"File {file_path} ignored by {len(ignore_matches)} rules"
-            )
+        elif ignore_match:
+            self.logger.debug("File %s ignored by %s", file_path, ignore_match)
             return FileAction.IGNORE
-        elif include_matches:
-            self.logger.debug(
-                f"File {file_path} included by {len(include_matches)} rules"
-            )
+        elif include_match:
+            self.logger.debug("File %s included by %s", file_path, include_match)
             return FileAction.INCLUDE
         else:
             # No explicit rules found - default to review
             self.logger.debug(
-                f"No matching rules for {file_path}, defaulting to REVIEW"
+                "No matching rules for %s, defaulting to REVIEW", file_path
             )
             return FileAction.REVIEW
 
+    def _first_matching_config(
+        self, file_path_str: str, config_paths: List[Path]
+    ) -> Optional[Path]:
+        """
+        Find the first configuration file with a pattern matching a file.
+
+        Args:
+            file_path_str: Resolved POSIX path of the file
+            config_paths: Configuration files of one type, in precedence order
+
+        Returns:
+            The first matching configuration file, or None if none match
+        """
+        for config_path in config_paths:
+            matcher = self._get_matcher(config_path)
+            if matcher is None:
+                continue
+
+            key = str(config_path)
+            config_dir_str = self._config_dir_strs.get(key)
+            if config_dir_str is None:
+                config_dir_str = config_path.parent.as_posix()
+                self._config_dir_strs[key] = config_dir_str
+
+            rel_path = _relative_posix(file_path_str, config_dir_str)
+            if rel_path is None:
+                # File is not under config directory
+                continue
+
+            if matcher.match(rel_path):
+                return config_path
+        return None
+
+    def refresh(self, config_path: Union[str, Path]) -> None:
+        """
+        Pick up a created, modified or deleted configuration file.
+
+        Drops the file's parsed patterns, the cached configuration file lists
+        of its directory and every directory below it, and all cached file
+        actions.
+
+        Args:
+            config_path: Path to the .gitinclude or .gitignore file
+        """
+        config_path = Path(config_path).resolve()
+        self._config_cache.pop(str(config_path), None)
+        self._matcher_cache.pop(str(config_path), None)
+
+        config_dir = config_path.parent.as_posix()
+        stale_dirs = [
+            directory
+            for directory in self._dir_configs
+            if _relative_posix(directory, config_dir) is not None
+        ]
+        for directory in stale_dirs:
+            del self._dir_configs[directory]
+
+        self._action_cache.cache_clear()
+        self.logger.debug("Refreshed configuration file %s", config_path)
+
     def clear_cache(self):
-        """Clear the configuration file cache."""
+        """Clear the configuration file and file action caches."""
         self._config_cache.clear()
+        self._matcher_cache.clear()
+        self._config_dir_strs.clear()
+        self._dir_configs.clear()
+        self._action_cache.cache_clear()
         self.logger.debug("Configuration cache cleared")
 
     def add_pattern(
@@ -263,7 +646,7 @@ class ConfigurationManager:
             elif action == FileAction.IGNORE:
                 config_file = config_dir / ".gitignore"
             else:
-                self.logger.error(f"Cannot add pattern for action {action}")
+                self.logger.error("Cannot add pattern for action %s", action)
                 return False
 
             # Ensure directory exists
@@ -274,7 +657,7 @@ class ConfigurationManager:
                 existing_patterns = self._parse_config_file(config_file)
                 if pattern in existing_patterns:
                     self.logger.info(
-                        f"Pattern {pattern} already exists in {config_file}"
+                        "Pattern %s already exists in %s", pattern, config_file
                     )
                     return True
 
@@ -283,14 +666,13 @@ class ConfigurationManager:
                 f.write(f"{pattern}\n")
 
             # Clear cache to force reload
-            if config_file in self._config_cache:
-                del self._config_cache[config_file]
+            self.refresh(config_file)
 
-            self.logger.info(f"Added pattern {pattern} to {config_file}")
+            self.logger.info("Added pattern %s to %s", pattern, config_file)
             return True
 
         except Exception as e:
-            self.logger.error(f"Error adding pattern {pattern}: {e}")
+            self.logger.error("Error adding pattern %s: %s", pattern, e)
             return False
 
     def safe_add_default_ignores(self, project_path: str = None) -> bool:
@@ -335,16 +717,21 @@ class ConfigurationManager:
             # Initialize git repo
             git_repo = GitRepo(str(target_dir))
             if not git_repo.repo:
-                self.logger.warning(f"No git repository found at {target_dir}")
+                self.logger.warning("No git repository found at %s", target_dir)
                 return False
 
             gitignore_path = target_dir / ".gitignore"
             patterns_added = []
 
+            # One pass over the tracked files for all patterns
+            tracked_patterns = self._patterns_matching_tracked_files(
+                git_repo, default_patterns
+            )
+
             for pattern in default_patterns:
                 # Check if any tracked files match this pattern
-                if self._has_tracked_files_matching_pattern(git_repo, pattern):
-                    self.logger.debug(f"Skipping {pattern} - tracked files exist")
+                if pattern in tracked_patterns:
+                    self.logger.debug("Skipping %s - tracked files exist", pattern)
                     continue
 
                 # Check if pattern already exists in .gitignore
@@ -366,7 +753,9 @@ class ConfigurationManager:
 
             if patterns_added:
                 self.logger.info(
-                    f"Added {len(patterns_added)} default ignore patterns: {patterns_added}"
+                    "Added %d default ignore patterns: %s",
+                    len(patterns_added),
+                    patterns_added,
                 )
             else:
                 self.logger.debug("No new default ignore patterns added")
@@ -374,38 +763,66 @@ class ConfigurationManager:
             return True
 
         except Exception as e:
-            self.logger.error(f"Error adding default ignore patterns: {e}")
+            self.logger.error("Error adding default ignore patterns: %s", e)
             return False
 
-    def _has_tracked_files_matching_pattern(self, git_repo, pattern: str) -> bool:
+    def _patterns_matching_tracked_files(
+        self, git_repo: "GitRepo", patterns: List[str]
+    ) -> Set[str]:
         """
-        Check if git repository has any tracked files matching the pattern.
+        Find which patterns match at least one tracked file.
+
+        Lists the tracked files once. Very large lists are split between
+        worker processes, one per usable CPU.
 
         Args:
             git_repo: GitRepo instance
-            pattern: Pattern to check against
+            patterns: Patterns to check
 
         Returns:
-            True if tracked files match the pattern
+            The patterns that match a tracked file
         """
         try:
-            # Get list of tracked files
-            tracked_files = git_repo.get_tracked_files()
-
-            for file_path in tracked_files:
-                # Convert pattern for fnmatch
-                if self._matches_pattern(
-                    Path(git_repo.repo_path) / file_path, pattern, Path(git_repo.repo_path)
-                ):
-                    return True
-
-            return False
+            files = git_repo.get_tracked_files()
+            cpus = _usable_cpus()
+            if len(files) >= PARALLEL_SCAN_MIN_FILES and cpus > 1:
+                try:
+                    return self._scan_tracked_files_parallel(files, patterns, cpus)
+                except (BrokenProcessPool, OSError) as e:
+                    self.logger.warning(
+                        "Parallel tracked file scan failed, scanning in-process: %s",
+                        e,
+                    )
+            return _scan_tracked_files(files, tuple(patterns))
 
         except Exception as e:
-            self.logger.error(
-                f"Error checking tracked files for pattern {pattern}: {e}"
-            )
-            return False
+            self.logger.error("Error checking tracked files for patterns: %s", e)
+            return set()
+
+    @staticmethod
+    def _scan_tracked_files_parallel(
+        files: List[str], patterns: List[str], workers: int
+    ) -> Set[str]:
+        """
+        Split a tracked file scan between worker processes.
+
+        Workers are spawned rather than forked, as the watcher's threads are
+        already running when the scan happens.
+
+        Args:
+            files: Tracked file paths, relative to the repository root
+            patterns: Patterns to check
+            workers: Number of worker processes
+
+        Returns:
+            The patterns that match a tracked file
+        """
+        chunks = [files[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = executor.map(_scan_tracked_files, chunks, repeat(tuple(patterns)))
+            return set().union(*results)
 
     def get_stats(self) -> dict:
         """
@@ -414,8 +831,13 @@ class ConfigurationManager:
         Returns:
             Dictionary with statistics
         """
+        action_cache = self._action_cache.cache_info()
         return {
             "watch_directory": str(self.watch_directory),
             "cached_config_files": len(self._config_cache),
-            "cache_files": list(str(p) for p in self._config_cache.keys()),
+            "cache_files": list(self._config_cache.keys()),
+            "cached_config_dirs": len(self._dir_configs),
+            "cached_file_actions": action_cache.currsize,
+            "file_action_cache_hits": action_cache.hits,
+            "file_action_cache_misses": action_cache.misses,
         }
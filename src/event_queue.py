@@ -0,0 +1,589 @@
+"""
+Sharded event queue with work stealing.
+
+This module implements the ShardedEventQueue class that gives each commit
+worker its own deque of file system events. Producers hash each event's path
+to a shard, workers drain their own shard from the head, and idle workers
+steal from the tail of a random peer's shard, preferring peers on their own
+NUMA node. Idle workers sleep on an EventCount, so producers take no lock at
+all unless a worker is asleep.
+
+It also provides EventCoalescer, which sits in front of the queue and
+collapses the bursts of events editors emit for a single save, and
+QueueAdapter, which lets the workers consume a plain queue.Queue or
+SimpleQueue through the same BatchQueue interface.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from queue import Empty, Queue, SimpleQueue
+from typing import (Any, Deque, Dict, List, Optional, Protocol, Sequence, Tuple,
+                    Union)
+
+# Linux exposes one node<N>/cpulist file per NUMA node here
+NODE_SYSFS_DIR = "/sys/devices/system/node"
+
+
+def cpu_numa_nodes(sysfs_dir: str = NODE_SYSFS_DIR) -> Dict[int, int]:
+    """
+    Map each CPU to the NUMA node it belongs to.
+
+    Args:
+        sysfs_dir: Directory holding the node<N> entries
+
+    Returns:
+        CPU number -> node number; empty if the topology is unavailable
+    """
+    nodes: Dict[int, int] = {}
+    try:
+        entries = os.listdir(sysfs_dir)
+    except OSError:
+        return nodes
+
+    for entry in entries:
+        match = re.fullmatch(r"node(\d+)", entry)
+        if not match:
+            continue
+        try:
+            with open(os.path.join(sysfs_dir, entry, "cpulist")) as f:
+                cpulist = f.read().strip()
+        except OSError:
+            continue
+
+        # e.g. "0-3,8-11"
+        for cpu_range in filter(None, cpulist.split(",")):
+            start, _, end = cpu_range.partition("-")
+            for cpu in range(int(start), int(end or start) + 1):
+                nodes[cpu] = int(match.group(1))
+    return nodes
+
+
+class EventCount:
+    """
+    Wake-up primitive for lock-free producers and sleeping consumers.
+
+    A consumer announces itself with prepare_wait(), rechecks its condition,
+    and then either calls cancel_wait() or wait(). notify_one() takes no lock
+    when nobody is waiting, so notifying is free in the common case. Because
+    the waiter count is raised before the consumer's recheck and producers
+    publish their item before reading it, a wake-up cannot be lost.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the EventCount."""
+        self._cond = threading.Condition(threading.Lock())
+        self._epoch = 0
+        self._waiters = 0
+
+    def prepare_wait(self) -> int:
+        """
+        Register the caller as a prospective waiter.
+
+        Returns:
+            Epoch to pass to wait()
+        """
+        with self._cond:
+            self._waiters += 1
+            return self._epoch
+
+    def cancel_wait(self) -> None:
+        """Withdraw a prepare_wait() whose condition turned out to be met."""
+        with self._cond:
+            self._waiters -= 1
+
+    def wait(self, epoch: int, timeout: Optional[float] = None) -> bool:
+        """
+        Sleep until notified after prepare_wait() returned epoch.
+
+        Returns immediately if a notification already happened in between.
+
+        Args:
+            epoch: Value returned by prepare_wait()
+            timeout: Maximum number of seconds to sleep, or None for no limit
+
+        Returns:
+            True if notified, False if the timeout expired first
+        """
+        with self._cond:
+            try:
+                return self._cond.wait_for(lambda: self._epoch != epoch, timeout)
+            finally:
+                self._waiters -= 1
+
+    def notify_one(self) -> None:
+        """Wake one waiter, if there is any."""
+        if not self._waiters:
+            return
+        with self._cond:
+            self._epoch += 1
+            self._cond.notify()
+
+
+class ShardedEventQueue:
+    """
+    Per-worker event deques with work stealing.
+
+    Supports the subset of the queue.Queue interface used by the watcher and
+    the worker pool (put, task_done, join), plus get_batch for workers.
+    Events for the same path always land in the same shard, so a file's
+    events are normally handled by one worker in order.
+    """
+
+    def __init__(self, num_shards: int):
+        """
+        Initialize the ShardedEventQueue.
+
+        Args:
+            num_shards: Number of shards, normally one per worker
+        """
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+
+        # deque.append is atomic, so producers need no lock to queue an item
+        self._shards: List[Deque[Any]] = [deque() for _ in range(num_shards)]
+
+        # Consumers dequeue under this lock, once per batch, so that an item
+        # is always either queued or counted as in flight for join()
+        self._mutex = threading.Lock()
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self._in_flight = 0
+
+        # Idle workers sleep here
+        self._event_count = EventCount()
+
+        # Per shard, groups of peers to steal from, nearest group first
+        self._victim_tiers: List[List[List[int]]] = []
+        self.set_shard_nodes([None] * num_shards)
+
+    @property
+    def num_shards(self) -> int:
+        """Number of shards in the queue."""
+        return len(self._shards)
+
+    def set_shard_nodes(self, nodes: Sequence[Optional[int]]) -> None:
+        """
+        Record the NUMA node each shard's worker runs on.
+
+        Idle workers then steal from peers on their own node before crossing
+        to another node, keeping stolen events in node-local caches.
+
+        Args:
+            nodes: Node of each shard's worker, or None where it is unknown
+
+        Raises:
+            ValueError: If there is not exactly one node per shard
+        """
+        if len(nodes) != len(self._shards):
+            raise ValueError("Expected one node per shard")
+
+        victim_tiers = []
+        for shard_index, node in enumerate(nodes):
+            peers = [i for i in range(len(nodes)) if i != shard_index]
+            if node is None:
+                tiers = [peers]
+            else:
+                near = [i for i in peers if nodes[i] == node]
+                far = [i for i in peers if nodes[i] != node]
+                tiers = [near, far]
+            victim_tiers.append([tier for tier in tiers if tier])
+        self._victim_tiers = victim_tiers
+
+    def _shard_for(self, item: Any) -> Deque[Any]:
+        """
+        Pick the shard for an item.
+
+        Args:
+            item: Event (or other item) being queued
+
+        Returns:
+            The shard the item belongs to
+        """
+        key = getattr(item, "src_path", None)
+        if key is None:
+            key = id(item)
+        return self._shards[hash(key) % len(self._shards)]
+
+    def put(self, item: Any) -> None:
+        """
+        Queue an item on its shard and wake an idle worker if there is one.
+
+        Takes no lock unless a worker is asleep.
+
+        Args:
+            item: Event to queue
+        """
+        self._shard_for(item).append(item)
+        self._event_count.notify_one()
+
+    def qsize(self) -> int:
+        """Return the approximate number of queued items."""
+        return sum(len(shard) for shard in self._shards)
+
+    def _steal(self, shard_index: int) -> Optional[List[Any]]:
+        """
+        Take one item from the tail of another shard.
+
+        Peers on the stealing worker's NUMA node are tried first, then the
+        rest; within each group, victims are tried in order starting from a
+        random peer.
+
+        Args:
+            shard_index: Shard of the worker that is stealing
+
+        Returns:
+            A one-item list, or None if every other shard is empty
+        """
+        for tier in self._victim_tiers[shard_index]:
+            offset = random.randrange(len(tier))
+            for i in range(len(tier)):
+                try:
+                    return [self._shards[tier[(offset + i) % len(tier)]].pop()]
+                except IndexError:
+                    continue
+        return None
+
+    def get_batch(
+        self,
+        shard_index: int,
+        max_items: int,
+        until: Any = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Dequeue a batch of items for a worker, blocking while none are queued.
+
+        Drains up to max_items from the head of the worker's own shard. If it
+        is empty, steals a single item from another shard.
+
+        Args:
+            shard_index: The worker's shard (taken modulo the shard count)
+            max_items: Maximum number of items to return
+            until: Marker item that ends a batch early; it is returned as the
+                batch's last item
+            timeout: Maximum number of seconds to wait for an item, or None to
+                wait indefinitely
+
+        Returns:
+            The dequeued items; empty only if the timeout expired
+        """
+        shard_index %= len(self._shards)
+        own = self._shards[shard_index]
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._mutex:
+                batch: List[Any] = []
+                try:
+                    while len(batch) < max_items:
+                        item = own.popleft()
+                        batch.append(item)
+                        if until is not None and item is until:
+                            break
+                except IndexError:
+                    pass
+
+                if not batch:
+                    batch = self._steal(shard_index) or []
+
+                if batch:
+                    self._in_flight += len(batch)
+                    return batch
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+
+            epoch = self._event_count.prepare_wait()
+            if any(self._shards):
+                # Something arrived since the check above
+                self._event_count.cancel_wait()
+                continue
+            self._event_count.wait(epoch, remaining)
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Mark dequeued items as processed.
+
+        Args:
+            count: Number of items processed
+
+        Raises:
+            ValueError: If called more times than there were items dequeued
+        """
+        with self._mutex:
+            in_flight = self._in_flight - count
+            if in_flight < 0:
+                raise ValueError("task_done() called too many times")
+            self._in_flight = in_flight
+            if in_flight == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self) -> None:
+        """Block until every queued item has been dequeued and marked done."""
+        with self._mutex:
+            while self._in_flight or any(self._shards):
+                self._all_tasks_done.wait()
+
+
+class BatchQueue(Protocol):
+    """The queue interface consumed by CommitWorker and CommitWorkerPool."""
+
+    def put(self, item: Any) -> None:
+        """Queue an item."""
+        ...
+
+    def get_batch(
+        self,
+        shard_index: int,
+        max_items: int,
+        until: Any = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Dequeue up to max_items, blocking for at most timeout seconds."""
+        ...
+
+    def task_done(self, count: int = 1) -> None:
+        """Mark dequeued items as processed."""
+        ...
+
+    def qsize(self) -> int:
+        """Return the approximate number of queued items."""
+        ...
+
+    def join(self) -> None:
+        """Block until every queued item has been processed."""
+        ...
+
+
+class QueueAdapter:
+    """
+    Gives a queue.Queue or SimpleQueue the BatchQueue interface.
+
+    A SimpleQueue keeps no task accounting, so for one task_done() does
+    nothing and join() only waits until every item has been dequeued.
+    """
+
+    def __init__(self, queue: "Union[Queue[Any], SimpleQueue[Any]]") -> None:
+        """
+        Initialize the QueueAdapter.
+
+        Args:
+            queue: The queue to wrap
+        """
+        self.queue = queue
+
+    def put(self, item: Any) -> None:
+        """Queue an item."""
+        self.queue.put(item)
+
+    def get_batch(
+        self,
+        shard_index: int,
+        max_items: int,
+        until: Any = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Dequeue a batch of items, blocking while none are queued.
+
+        Args:
+            shard_index: Ignored; the wrapped queue has a single shard
+            max_items: Maximum number of items to return
+            until: Marker item that ends a batch early; it is returned as the
+                batch's last item
+            timeout: Maximum number of seconds to wait for an item, or None to
+                wait indefinitely
+
+        Returns:
+            The dequeued items; empty only if the timeout expired
+        """
+        try:
+            batch = [self.queue.get(timeout=timeout)]
+        except Empty:
+            return []
+
+        while len(batch) < max_items and (until is None or batch[-1] is not until):
+            try:
+                batch.append(self.queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Mark dequeued items as processed under a single lock acquisition.
+
+        Equivalent to calling Queue.task_done() count times.
+
+        Args:
+            count: Number of items processed
+
+        Raises:
+            ValueError: If called more times than there were items dequeued
+        """
+        queue = self.queue
+        if isinstance(queue, SimpleQueue):
+            # No task accounting to update
+            return
+
+        with queue.all_tasks_done:
+            unfinished = queue.unfinished_tasks - count
+            if unfinished < 0:
+                raise ValueError("task_done() called too many times")
+            if unfinished == 0:
+                queue.all_tasks_done.notify_all()
+            queue.unfinished_tasks = unfinished
+
+    def qsize(self) -> int:
+        """Return the approximate number of queued items."""
+        return self.queue.qsize()
+
+    def join(self) -> None:
+        """Block until every queued item has been processed."""
+        queue = self.queue
+        if isinstance(queue, SimpleQueue):
+            # The last batch may still be in progress when this returns
+            while not queue.empty():
+                time.sleep(0.01)
+        else:
+            queue.join()
+
+
+def as_batch_queue(
+    queue: "Union[Queue[Any], SimpleQueue[Any], BatchQueue]",
+) -> BatchQueue:
+    """
+    Wrap a standard library queue in a QueueAdapter.
+
+    Args:
+        queue: A queue.Queue, SimpleQueue or BatchQueue
+
+    Returns:
+        The queue itself if it already is a BatchQueue, else its adapter
+    """
+    if isinstance(queue, (Queue, SimpleQueue)):
+        return QueueAdapter(queue)
+    return queue
+
+
+class EventCoalescer:
+    """
+    Collapses rapid-fire events for the same path into the latest one.
+
+    Supports put() like a queue, so the watcher can feed it directly. Each
+    event replaces any pending event for its path and restarts that path's
+    quiet period; a flusher thread forwards an event to the wrapped queue once
+    its path has seen no events for the coalescing window.
+    """
+
+    def __init__(self, event_queue: Any, window: float):
+        """
+        Initialize the EventCoalescer.
+
+        Args:
+            event_queue: Queue that coalesced events are forwarded to
+            window: Seconds a path must stay quiet before its latest event is
+                forwarded; 0 forwards every event immediately
+        """
+        self.event_queue = event_queue
+        self.window = window
+
+        # src_path, or (src_path, dest_path) for moves -> (deadline, latest
+        # event). Every put() re-inserts its key at the end with a later
+        # deadline, so the dict stays in deadline order
+        self._pending: Dict[Any, Tuple[float, Any]] = {}
+        self._cond = threading.Condition(threading.Lock())
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the flusher thread."""
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="EventCoalescer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Forward all pending events immediately and stop the flusher."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def put(self, item: Any) -> None:
+        """
+        Hold an event until its path goes quiet.
+
+        Items without a src_path, and all items when the window is 0 or the
+        flusher is not running, are forwarded straight away. A move is keyed
+        by both of its paths, so that later events for its source path do
+        not replace it and lose its destination.
+
+        Args:
+            item: Event to coalesce
+        """
+        key = getattr(item, "src_path", None)
+        dest_path = getattr(item, "dest_path", None)
+        if dest_path:
+            key = (key, dest_path)
+        if key is not None and self.window > 0:
+            with self._cond:
+                if self._running:
+                    was_empty = not self._pending
+                    self._pending.pop(key, None)
+                    self._pending[key] = (time.monotonic() + self.window, item)
+                    if was_empty:
+                        self._cond.notify()
+                    return
+
+        self.event_queue.put(item)
+
+    def pending(self) -> int:
+        """Return the number of paths with an event waiting to be forwarded."""
+        return len(self._pending)
+
+    def _take_due(self) -> List[Any]:
+        """
+        Remove the events whose quiet period is over; called with the lock held.
+
+        Returns:
+            The events to forward, oldest first
+        """
+        now = time.monotonic()
+        due = []
+        for key, (deadline, item) in self._pending.items():
+            if self._running and deadline > now:
+                break
+            due.append((key, item))
+        for key, _ in due:
+            del self._pending[key]
+        return [item for _, item in due]
+
+    def _run(self) -> None:
+        """Flusher loop: forward events as their paths go quiet."""
+        while True:
+            with self._cond:
+                due = self._take_due()
+                while not due and self._running:
+                    if self._pending:
+                        first_deadline = next(iter(self._pending.values()))[0]
+                        self._cond.wait(first_deadline - time.monotonic())
+                    else:
+                        self._cond.wait()
+                    due = self._take_due()
+                running = self._running
+
+            # Forward outside the lock so producers are never held up by it
+            for item in due:
+                self.event_queue.put(item)
+            if not running:
+                return
@@ -1,13 +1,61 @@
 import fnmatch
-from typing import List
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+
+def compile_globs(
+    patterns: Iterable[str], match_directories: bool = False
+) -> Optional[Pattern[str]]:
+    """
+    Compiles glob patterns into a single regex that matches a path if any
+    pattern does. With match_directories, a pattern ending in "/" matches the
+    path itself, as if it were a directory.
+    """
+    regexes = [
+        fnmatch.translate(
+            pattern[:-1] if match_directories and pattern.endswith("/") else pattern
+        )
+        for pattern in patterns
+    ]
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes))
+
+
+class PathFilter:
+    """
+    Include and exclude glob patterns, each compiled into a single regex.
+
+    Exclude patterns take precedence over include patterns, and an exclude
+    pattern ending in "/" matches the path itself, as if it were a directory.
+    """
+
+    __slots__ = ("include_regex", "exclude_regex")
+
+    def __init__(self, include: Iterable[str], exclude: Iterable[str] = ()):
+        self.include_regex = compile_globs(include)
+        self.exclude_regex = compile_globs(exclude, match_directories=True)
+
+    def should_process(self, path: str) -> bool:
+        """Determines if a path should be processed."""
+        exclude_regex = self.exclude_regex
+        if exclude_regex is not None and exclude_regex.match(path):
+            return False
+        include_regex = self.include_regex
+        return include_regex is not None and include_regex.match(path) is not None
+
+
+@lru_cache(maxsize=64)
+def _compiled_filter(include: Tuple[str, ...], exclude: Tuple[str, ...]) -> PathFilter:
+    """Compiles include and exclude patterns once per distinct pattern set."""
+    return PathFilter(include, exclude)
 
 
 def is_path_match(path: str, patterns: List[str]) -> bool:
     """Checks if a path matches any of the glob patterns."""
-    for pattern in patterns:
-        if fnmatch.fnmatch(path, pattern):
-            return True
-    return False
+    regex = _compiled_filter(tuple(patterns), ()).include_regex
+    return regex is not None and regex.match(path) is not None
 
 
 def should_process_path(path: str, include: List[str], exclude: List[str]) -> bool:
@@ -15,15 +63,4 @@ def should_process_path(path: str, include: List[str], exclude: List[str]) -> bo
     Determines if a file path should be processed based on include and
     exclude patterns. Exclude patterns take precedence over include patterns.
     """
-    # Check for directory patterns in exclude
-    for pattern in exclude:
-        if pattern.endswith("/") and fnmatch.fnmatch(path + "/", pattern):
-            return False
-
-    if is_path_match(path, exclude):
-        return False
-
-    if is_path_match(path, include):
-        return True
-
-    return False
+    return _compiled_filter(tuple(include), tuple(exclude)).should_process(path)
@@ -1,13 +1,19 @@
-from typing import Optional
+import os
+from typing import List, Optional, Tuple
 
 import git
 
+# Paths passed to one git add; keeps the command line well under ARG_MAX
+ADD_CHUNK_SIZE = 500
+
 
 class GitRepo:
     """A wrapper around a GitPython repository."""
 
     def __init__(self, path: str, init_new: bool = True):
         self.repo_path = path
+        # (index mtime_ns, index size, files) from the last git ls-files
+        self._tracked_cache: Optional[Tuple[int, int, List[str]]] = None
         try:
             self.repo = git.Repo(path, search_parent_directories=True)
             print("Successfully loaded Git repository at: " f"{self.repo.working_dir}")
@@ -38,41 +44,131 @@ class GitRepo:
         """Stages all changes."""
         if self.repo:
             self.repo.git.add(A=True)
+            self.invalidate_tracked_cache()
 
     def add_files(self, files: list):
-        """Stages specific files."""
-        if self.repo and files:
-            for file in files:
-                self.repo.git.add(file)
-
-    def commit(self, message: str) -> Optional[str]:
-        """Creates a new commit and returns its SHA."""
-        if self.repo and self.repo.is_dirty(untracked_files=True):
+        """
+        Stages specific files, passing them to git in chunks. Files that no
+        longer exist are staged as removed if they are tracked and skipped if
+        not, so that one vanished path does not fail the whole call.
+        """
+        if not self.repo or not files:
+            return
+        existing: List[str] = []
+        missing: List[str] = []
+        for path in files:
+            full_path = os.path.join(self.repo.working_dir, path)
+            (existing if os.path.lexists(full_path) else missing).append(path)
+        for i in range(0, len(existing), ADD_CHUNK_SIZE):
+            self.repo.git.add("--", *existing[i : i + ADD_CHUNK_SIZE])
+        for i in range(0, len(missing), ADD_CHUNK_SIZE):
+            self.repo.git.rm(
+                "--",
+                *missing[i : i + ADD_CHUNK_SIZE],
+                cached=True,
+                r=True,
+                ignore_unmatch=True,
+                q=True,
+            )
+        self.invalidate_tracked_cache()
+
+    def commit(
+        self,
+        message: str,
+        stage_all: bool = True,
+        paths: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """
+        Creates a new commit and returns its SHA. Stages all changes first,
+        unless stage_all is False, in which case only what is already staged
+        is committed. Given paths (see get_staged_files), only those paths are
+        committed and anything else that is staged stays staged.
+        """
+        if not self.repo:
+            return None
+        if paths:
+            self.repo.git.commit("--", *paths, m=message, only=True)
+            self.invalidate_tracked_cache()
+            return self.repo.head.commit.hexsha
+        if stage_all:
+            # One porcelain status covers staged, unstaged and untracked
+            # changes; is_dirty(untracked_files=True) runs up to three commands
+            if not self.get_status():
+                return None
             self.add_all()
-            commit = self.repo.index.commit(message)
-            return commit.hexsha
-        return None
+        elif not self.repo.is_dirty(working_tree=False):
+            return None
+        self.repo.git.commit(m=message)
+        self.invalidate_tracked_cache()
+        return self.repo.head.commit.hexsha
 
-    def get_diff(self, commit: Optional[str] = "HEAD", staged: bool = True) -> Optional[str]:
-        """Returns the diff for the specified commit, or the staged/unstaged diff."""
+    def get_diff(
+        self,
+        commit: Optional[str] = "HEAD",
+        staged: bool = True,
+        paths: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """
+        Returns the diff for the specified commit, or the staged/unstaged diff,
+        limited to the given paths if there are any.
+        """
         if not self.repo:
             return None
 
+        pathspec = ["--", *paths] if paths else []
         if not staged:
-            return self.repo.git.diff()
+            return self.repo.git.diff(*pathspec)
 
         target = commit if commit != "STAGED" else None
-        return self.repo.git.diff(target, cached=True)
+        return self.repo.git.diff(target, *pathspec, cached=True)
+
+    def get_staged_files(self, paths: List[str]) -> List[str]:
+        """
+        Returns which of the given paths have staged changes, relative to the
+        repository root. A rename is reported as both its old and new path.
+        """
+        if not self.repo or not paths:
+            return []
+        output = self.repo.git.diff(
+            "--", *paths, cached=True, name_only=True, no_renames=True, z=True
+        )
+        return output.split("\0")[:-1] if output else []
+
+    def invalidate_tracked_cache(self):
+        """Forgets the cached list of tracked files."""
+        self._tracked_cache = None
 
     def get_tracked_files(self) -> list:
-        """Returns a list of all tracked files in the repository."""
+        """
+        Returns a list of all tracked files in the repository. The listing is
+        cached until the index file changes.
+        """
         if not self.repo:
             return []
 
         try:
-            # Use git ls-files to get all tracked files
-            tracked_files = self.repo.git.ls_files().splitlines()
-            return tracked_files
+            index_stat = os.stat(os.path.join(self.repo.git_dir, "index"))
+            index_key: Optional[Tuple[int, int]] = (
+                index_stat.st_mtime_ns,
+                index_stat.st_size,
+            )
+        except OSError:
+            # No index yet, e.g. a fresh repository
+            index_key = None
+
+        cached = self._tracked_cache
+        if cached is not None and index_key == cached[:2]:
+            return list(cached[2])
+
+        try:
+            # NUL-separated raw bytes: no path quoting, and one decode/split
+            # pass over the whole listing
+            output = self.repo.git.ls_files(z=True, stdout_as_string=False)
+            tracked_files = output.decode("utf-8", "surrogateescape").split("\0")[:-1]
         except Exception as e:
             print(f"Error getting tracked files: {e}")
             return []
+
+        if index_key is not None:
+            self._tracked_cache = (*index_key, tracked_files)
+        return list(tracked_files)
@@ -4,14 +4,56 @@ This module provides fallback functionality when the local LLM is unavailable.
 It creates Linear issues with diff information and polls for human responses.
 """
 
+import hashlib
+import hmac
 import logging
+import re
+import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# First line of an acceptable commit message: 10-100 characters with a colon
+# (conventional commits), not a question and not an instruction
+_COMMIT_LINE_RE = re.compile(
+    r"(?!please|can you|how)(?=[^:]*:).{10,100}(?<!\?)", re.IGNORECASE
+)
+
+# Body of a fenced code block: from a line starting with ``` (after optional
+# whitespace) to the next such line
+_CODE_BLOCK_RE = re.compile(r"^[^\S\n]*```[^\n]*\n(.*?)^[^\S\n]*```", re.M | re.S)
+
+# Default cap on how much of a diff goes into an LLM prompt or Linear issue
+MAX_DIFF_CHARS = 8000
+
+
+def valid_webhook_signature(secret: str, body: bytes, signature: str) -> bool:
+    """Check a webhook's Linear-Signature header (HMAC-SHA256 of the body)."""
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def truncate_diff(diff: str, max_chars: int = MAX_DIFF_CHARS) -> str:
+    """Cut a diff down to at most max_chars, at a line boundary.
+
+    Args:
+        diff: The git diff
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        The diff, or its leading lines followed by a marker saying how many
+        lines were dropped
+    """
+    if len(diff) <= max_chars:
+        return diff
+
+    # Keep whole lines, unless even the first line is too long
+    cut = diff.rfind("\n", 0, max_chars) + 1 or max_chars
+    dropped_lines = diff.count("\n", cut) + (not diff.endswith("\n"))
+    return f"{diff[:cut]}... [truncated {dropped_lines} lines]"
+
 
 @dataclass
 class LinearFallbackConfig:
@@ -22,6 +64,7 @@ class LinearFallbackConfig:
     poll_interval_seconds: int = 30
     max_poll_duration_minutes: int = 60
     issue_title_prefix: str = "Auto-commit: Commit message needed"
+    max_diff_chars: int = MAX_DIFF_CHARS
 
 
 class LinearFallbackError(Exception):
@@ -37,6 +80,17 @@ class LinearFallbackManager:
         self.config = config
         # issue_id -> expected_format
         self._pending_issues: Dict[str, str] = {}
+        # issue_id -> commit message found by a check or pushed by webhook
+        self._pushed_messages: Dict[str, str] = {}
+        # issue_id -> time.monotonic() of its last comment check
+        self._last_checked: Dict[str, float] = {}
+        # issue_id -> latest updatedAt among its comments already inspected
+        self._last_seen: Dict[str, str] = {}
+        self._cancelled = False
+        # Polls wait on this between checks; new messages and cancel() notify it
+        self._cond = threading.Condition()
+        # Held by the one poll checking all pending issues for the others
+        self._check_lock = threading.Lock()
 
     def create_commit_message_request(self, diff_content: str, file_paths: list) -> str:
         """Create a Linear issue requesting a commit message for the diff.
@@ -91,34 +145,116 @@ class LinearFallbackManager:
             The commit message if found, None if still pending
 
         Raises:
-            LinearFallbackError: If polling fails or times out
+            LinearFallbackError: If polling fails, times out or is cancelled
         """
-        start_time = datetime.now()
-        max_duration = timedelta(minutes=self.config.max_poll_duration_minutes)
-
-        while datetime.now() - start_time < max_duration:
-            try:
-                # Check issue comments for commit message
-                commit_message = self._check_issue_for_response(issue_id)
-                if commit_message:
-                    # Clean up tracking
-                    self._pending_issues.pop(issue_id, None)
-                    logger.info(f"Received commit message from Linear issue {issue_id}")
-                    return commit_message
-
-                # Wait before next poll
-                time.sleep(self.config.poll_interval_seconds)
-
-            except Exception as e:
-                logger.error(f"Error polling Linear issue {issue_id}: {e}")
-                time.sleep(self.config.poll_interval_seconds)
+        deadline = time.monotonic() + self.config.max_poll_duration_minutes * 60
+
+        while time.monotonic() < deadline:
+            # Check comments on every pending issue that is due, not just ours
+            self._check_pending_issues()
+
+            with self._cond:
+                commit_message = self._pushed_messages.pop(issue_id, None)
+
+            if commit_message:
+                # Clean up tracking
+                self._forget_issue(issue_id)
+                logger.info(f"Received commit message from Linear issue {issue_id}")
+                return commit_message
+
+            # Wait before next poll; a pushed comment or cancel() cuts it short
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._cancelled or issue_id in self._pushed_messages,
+                    self.config.poll_interval_seconds,
+                )
+                if self._cancelled:
+                    self._forget_issue(issue_id)
+                    raise LinearFallbackError(
+                        f"Stopped waiting for response on Linear issue {issue_id}"
+                    )
 
         # Timeout reached
-        self._pending_issues.pop(issue_id, None)
+        self._forget_issue(issue_id)
         raise LinearFallbackError(
             f"Timeout waiting for response on Linear issue {issue_id}"
         )
 
+    def _forget_issue(self, issue_id: str) -> None:
+        """Stop tracking an issue whose poll has finished."""
+        with self._cond:
+            self._pending_issues.pop(issue_id, None)
+            self._pushed_messages.pop(issue_id, None)
+            self._last_checked.pop(issue_id, None)
+            self._last_seen.pop(issue_id, None)
+
+    def _check_pending_issues(self) -> None:
+        """Check all pending issues that are due with one batched request.
+
+        Only one poll checks at a time. Messages it finds for other issues
+        are handed to their polls just like webhook pushes, so every pending
+        issue is checked about once per poll interval in total, rather than
+        once per interval by each poll.
+        """
+        if not self._check_lock.acquire(blocking=False):
+            # Another poll is checking, and will wake us if it finds our answer
+            return
+
+        try:
+            now = time.monotonic()
+            due = [
+                issue_id
+                for issue_id in list(self._pending_issues)
+                if now - self._last_checked.get(issue_id, float("-inf"))
+                >= self.config.poll_interval_seconds
+            ]
+            if not due:
+                return
+
+            commit_messages = self._check_issues_for_responses(due)
+            with self._cond:
+                # Polls that finished during the check have been forgotten
+                found = False
+                for issue_id in due:
+                    if issue_id not in self._pending_issues:
+                        continue
+                    self._last_checked[issue_id] = now
+                    if issue_id in commit_messages:
+                        self._pushed_messages[issue_id] = commit_messages[issue_id]
+                        found = True
+                if found:
+                    self._cond.notify_all()
+        finally:
+            self._check_lock.release()
+
+    def deliver_comment(self, issue_id: str, body: str) -> bool:
+        """Hand a comment pushed by a Linear webhook to the issue's poll.
+
+        Args:
+            issue_id: The Linear issue the comment was posted on
+            body: The comment's markdown body
+
+        Returns:
+            True if the comment held a commit message for a pending issue
+        """
+        commit_message = self._extract_commit_message(body)
+        if not commit_message:
+            return False
+
+        with self._cond:
+            if issue_id not in self._pending_issues:
+                return False
+            self._pushed_messages[issue_id] = commit_message
+            self._cond.notify_all()
+        logger.info(f"Commit message for Linear issue {issue_id} pushed by webhook")
+        return True
+
+    def cancel(self) -> None:
+        """Stop all current and future polls, e.g. when shutting down."""
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
     def _format_issue_description(self, diff_content: str, file_paths: list) -> str:
         """Format the Linear issue description with diff and instructions."""
         description = f"""**Auto-commit needs a commit message**
@@ -130,7 +266,7 @@ The local LLM is unavailable, so human assistance is needed to generate a commit
 
 **Diff:**
 ```diff
-{diff_content}
+{truncate_diff(diff_content, self.config.max_diff_chars)}
 ```
 
 **Instructions:**
@@ -154,76 +290,71 @@ Once you provide the commit message, the auto-commit system will use it and clos
 """
         return description
 
-    def _check_issue_for_response(self, issue_id: str) -> Optional[str]:
-        """Check a Linear issue for commit message responses in comments."""
+    def _check_issues_for_responses(self, issue_ids: List[str]) -> Dict[str, str]:
+        """Check Linear issues for commit message responses in comments.
+
+        Only comments added or edited since the issue's previous check are
+        fetched and inspected.
+
+        Returns:
+            issue_id -> commit message, for the issues that have one
+        """
         try:
-            from src.linear_integration import get_issue_comments
+            from src.linear_integration import get_issues_comments_batch
+
+            since = {
+                issue_id: self._last_seen[issue_id]
+                for issue_id in issue_ids
+                if issue_id in self._last_seen
+            }
+            comments_by_issue = get_issues_comments_batch(issue_ids, since)
+        except Exception as e:
+            logger.error(f"Error checking Linear issues {issue_ids} for responses: {e}")
+            return {}
 
-            comments = get_issue_comments(issue_id)
+        commit_messages = {}
+        for issue_id, comments in comments_by_issue.items():
+            timestamps = [c["updatedAt"] for c in comments if c.get("updatedAt")]
+            if timestamps and issue_id in self._pending_issues:
+                self._last_seen[issue_id] = max(timestamps)
 
             # Look for commit message in comments (reverse order to get latest first)
             for comment in reversed(comments):
-                content = comment.get("body", "").strip()
-
-                # Skip empty comments or system comments
-                if not content or content.startswith("**Auto-commit"):
-                    continue
-
-                # Look for code blocks that might contain commit messages
-                if "```" in content:
-                    lines = content.split("\n")
-                    in_code_block = False
-                    commit_lines = []
-
-                    for line in lines:
-                        if line.strip().startswith("```"):
-                            if in_code_block:
-                                # End of code block
-                                if commit_lines:
-                                    commit_message = "\n".join(commit_lines).strip()
-                                    if self._is_valid_commit_message(commit_message):
-                                        return commit_message
-                                commit_lines = []
-                                in_code_block = False
-                            else:
-                                # Start of code block
-                                in_code_block = True
-                        elif in_code_block:
-                            commit_lines.append(line)
-
-                # Also check if the entire comment looks like a commit message
-                if self._is_valid_commit_message(content):
-                    return content
+                commit_message = self._extract_commit_message(comment.get("body", ""))
+                if commit_message:
+                    commit_messages[issue_id] = commit_message
+                    break
+        return commit_messages
 
-            return None
+    def _extract_commit_message(self, content: str) -> Optional[str]:
+        """Find a commit message in a Linear comment body."""
+        content = (content or "").strip()
 
-        except Exception as e:
-            logger.error(f"Error checking Linear issue {issue_id} for responses: {e}")
+        # Skip empty comments or system comments
+        if not content or content.startswith("**Auto-commit"):
             return None
 
-    def _is_valid_commit_message(self, message: str) -> bool:
-        """Check if a message looks like a valid commit message."""
-        if not message or len(message.strip()) < 10:
-            return False
-
-        # Basic validation: should have a reasonable first line
-        first_line = message.split("\n")[0].strip()
+        # Look for code blocks that might contain commit messages
+        for match in _CODE_BLOCK_RE.finditer(content):
+            commit_message = match.group(1).strip()
+            if self._is_valid_commit_message(commit_message):
+                return commit_message
 
-        # Should be reasonable length
-        if len(first_line) < 10 or len(first_line) > 100:
-            return False
+        # Also check if the entire comment looks like a commit message
+        if self._is_valid_commit_message(content):
+            return content
 
-        # Should contain a colon (conventional commits format)
-        if ":" not in first_line:
-            return False
+        return None
 
-        # Should not be a question or instruction
-        if first_line.endswith("?") or first_line.lower().startswith(
-            ("please", "can you", "how")
-        ):
+    def _is_valid_commit_message(self, message: str) -> bool:
+        """Check if a message looks like a valid commit message."""
+        if not message:
             return False
 
-        return True
+        # Basic validation: should have a reasonable first line; only the
+        # first line is split off, however long the comment is
+        first_line = message.split("\n", 1)[0].strip()
+        return _COMMIT_LINE_RE.fullmatch(first_line) is not None
 
     def cleanup_pending_issues(self):
         """Clean up any pending issues that are no longer needed."""
@@ -235,3 +366,5 @@ Once you provide the commit message, the auto-commit system will use it and clos
                 logger.error(f"Error cleaning up issue {issue_id}: {e}")
 
         self._pending_issues.clear()
+        self._last_checked.clear()
+        self._last_seen.clear()
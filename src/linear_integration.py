@@ -5,10 +5,14 @@ using the MCP Linear OAuth functions.
 """
 
 import logging
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of issues whose comments are fetched at the same time
+MAX_CONCURRENT_FETCHES = 8
+
 
 def create_linear_issue(issue_data: Dict[str, Any]) -> str:
     """Create a Linear issue and return the issue ID.
@@ -38,11 +42,15 @@ def create_linear_issue(issue_data: Dict[str, Any]) -> str:
         raise
 
 
-def get_issue_comments(issue_id: str) -> List[Dict[str, Any]]:
+def get_issue_comments(
+    issue_id: str, since: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """Get comments for a Linear issue.
 
     Args:
         issue_id: The Linear issue ID
+        since: Only return comments whose updatedAt is later than this
+            ISO 8601 timestamp, as returned by Linear
 
     Returns:
         List of comment dictionaries
@@ -58,7 +66,16 @@ def get_issue_comments(issue_id: str) -> List[Dict[str, Any]]:
         result = mcp_linear_oauth_list_comments(issueId=issue_id)
 
         if isinstance(result, list):
-            return result
+            if since is None:
+                return result
+            # The MCP tool has no filter argument, so drop seen comments here.
+            # Linear's timestamps share one format and so compare as strings;
+            # comments without one are kept
+            return [
+                comment
+                for comment in result
+                if comment.get("updatedAt") is None or comment["updatedAt"] > since
+            ]
         else:
             logger.warning(f"Unexpected comments format for issue {issue_id}: {result}")
             return []
@@ -68,6 +85,48 @@ def get_issue_comments(issue_id: str) -> List[Dict[str, Any]]:
         raise
 
 
+def get_issues_comments_batch(
+    issue_ids: List[str], since: Optional[Dict[str, str]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Get comments for several Linear issues in one call.
+
+    The MCP Linear tools only list one issue's comments per call, so this
+    makes one call per issue, running up to MAX_CONCURRENT_FETCHES of them
+    at once; it is the single place to switch to one aliased GraphQL query.
+    Issues whose comments cannot be fetched are left out rather than failing
+    the whole batch.
+
+    Args:
+        issue_ids: The Linear issue IDs
+        since: Issue ID -> updatedAt timestamp; only comments updated after
+            it are returned for that issue
+
+    Returns:
+        Issue ID -> list of comment dictionaries
+    """
+    since = since or {}
+
+    def fetch(issue_id: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return get_issue_comments(issue_id, since.get(issue_id))
+        except Exception:
+            # Already logged by get_issue_comments
+            return None
+
+    if len(issue_ids) <= 1:
+        results = [fetch(issue_id) for issue_id in issue_ids]
+    else:
+        workers = min(len(issue_ids), MAX_CONCURRENT_FETCHES)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, issue_ids))
+
+    return {
+        issue_id: comments
+        for issue_id, comments in zip(issue_ids, results)
+        if comments is not None
+    }
+
+
 def update_linear_issue(issue_id: str, update_data: Dict[str, Any]) -> bool:
     """Update a Linear issue.
 
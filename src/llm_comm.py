@@ -5,14 +5,27 @@ This module handles communication with a Large Language Model
 to generate meaningful commit messages from git diffs.
 """
 
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from src.linear_fallback import (LinearFallbackConfig, LinearFallbackError,
-                                 LinearFallbackManager)
+from src.linear_fallback import (MAX_DIFF_CHARS, LinearFallbackConfig,
+                                 LinearFallbackError, LinearFallbackManager,
+                                 truncate_diff)
+
+# Keep-alive connections kept open to the LLM service; commits are generated
+# one at a time, so a few cover the connection check and any overlap
+LLM_POOL_SIZE = 4
+
+# Generated messages remembered per diff, so a repeated diff (a retry after a
+# failed commit, an amend) skips the model
+MESSAGE_CACHE_SIZE = 128
 
 
 class LLMCommitGenerator:
@@ -29,6 +42,8 @@ class LLMCommitGenerator:
         model_name: str = "sequentialthought",
         enable_linear_fallback: bool = True,
         fallback_team_id: str = "b5f1d099-acc2-4e51-a415-76c00c00f23b",
+        timeout_seconds: int = 30,
+        max_diff_chars: int = MAX_DIFF_CHARS,
     ):
         """
         Initialize the LLM commit generator.
@@ -38,24 +53,45 @@ class LLMCommitGenerator:
             model_name: Name of the model to use
             enable_linear_fallback: Whether to use Linear fallback
             fallback_team_id: Linear team ID for fallback issues
+            timeout_seconds: Timeout for each LLM generation request
+            max_diff_chars: Diffs longer than this are truncated in prompts
+                and Linear issues, keeping generation time bounded
         """
         self.base_url = base_url.rstrip("/")
         self.model_name = model_name
+        self.timeout_seconds = timeout_seconds
+        self.max_diff_chars = max_diff_chars
+
+        # Reuse keep-alive connections to the LLM service across commits
+        self.session = requests.Session()
+        self.session.mount(
+            f"{self.base_url}/",
+            HTTPAdapter(pool_connections=1, pool_maxsize=LLM_POOL_SIZE),
+        )
         self.logger = logging.getLogger("LLMCommitGenerator")
 
+        # BLAKE2 digest of the diff -> message the LLM generated for it, in
+        # least recently used order; workers share the generator
+        self._message_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._message_cache_lock = threading.Lock()
+
         # Setup Linear fallback if enabled
         self.linear_fallback = None
         if enable_linear_fallback:
-            fallback_config = LinearFallbackConfig(fallback_team_id=fallback_team_id)
+            fallback_config = LinearFallbackConfig(
+                fallback_team_id=fallback_team_id, max_diff_chars=max_diff_chars
+            )
             self.linear_fallback = LinearFallbackManager(fallback_config)
 
-        # Test connection on initialization
-        self._test_connection()
+        # The connection is tested on first use, not here, so that creating a
+        # generator never blocks on the LLM service
+        self._connection_checked = False
+        self._connection_lock = threading.Lock()
 
     def _test_connection(self) -> bool:
         """Test if the LLM service is available."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 self.logger.info("Successfully connected to LLM service")
                 return True
@@ -88,7 +124,7 @@ Based on the following git diff, generate a single line commit message following
 
 Git diff:
 ```
-{diff}
+{truncate_diff(diff, self.max_diff_chars)}
 ```
 
 Commit message:"""
@@ -109,7 +145,8 @@ Commit message:"""
             payload = {
                 "model": self.model_name,
                 "prompt": prompt,
-                "stream": False,
+                # Streamed, so reading can stop at the end of the first line
+                "stream": True,
                 "options": {
                     "temperature": 0.3,
                     "max_tokens": 100,
@@ -117,16 +154,22 @@ Commit message:"""
                 },
             }
 
-            response = requests.post(
-                f"{self.base_url}/api/generate", json=payload, timeout=30
+            response = self.session.post(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=self.timeout_seconds,
+                stream=True,
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
-            else:
-                self.logger.error(f"LLM API error: {response.status_code}")
-                return None
+            try:
+                if response.status_code == 200:
+                    return self._read_first_line(response)
+                else:
+                    self.logger.error(f"LLM API error: {response.status_code}")
+                    return None
+            finally:
+                # Drops the connection if generation is still running
+                response.close()
 
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error calling LLM: {e}")
@@ -135,6 +178,27 @@ Commit message:"""
             self.logger.error(f"Error parsing LLM response: {e}")
             return None
 
+    def _read_first_line(self, response: requests.Response) -> str:
+        """
+        Read a streamed generation until its first non-empty line is complete.
+
+        Args:
+            response: Streaming response from the /api/generate endpoint
+
+        Returns:
+            The first line of generated text, stripped
+        """
+        text = ""
+        # Each line of the stream is a JSON chunk with the next piece of text
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            text += chunk.get("response", "")
+            if "\n" in text.lstrip() or chunk.get("done"):
+                break
+        return text.lstrip().partition("\n")[0].strip()
+
     def generate_commit_message(
         self, diff: str, file_paths: Optional[List[str]] = None
     ) -> Optional[str]:
@@ -152,6 +216,23 @@ Commit message:"""
             self.logger.warning("Empty diff provided")
             return "chore: update files"
 
+        diff_key = hashlib.blake2b(
+            diff.encode("utf-8", "surrogateescape"), digest_size=16
+        ).digest()
+        with self._message_cache_lock:
+            commit_msg = self._message_cache.get(diff_key)
+            if commit_msg is not None:
+                self._message_cache.move_to_end(diff_key)
+        if commit_msg is not None:
+            self.logger.info(f"Reusing commit message for identical diff: {commit_msg}")
+            return commit_msg
+
+        if not self._connection_checked:
+            with self._connection_lock:
+                if not self._connection_checked:
+                    self._test_connection()
+                    self._connection_checked = True
+
         # Format the prompt
         prompt = self._format_prompt(diff)
 
@@ -165,6 +246,11 @@ Commit message:"""
             # Validate the response looks like a commit message
             if len(commit_msg) > 0 and len(commit_msg) <= 100:
                 self.logger.info(f"Generated commit message: {commit_msg}")
+                # Only LLM results are cached; failures should be retried
+                with self._message_cache_lock:
+                    self._message_cache[diff_key] = commit_msg
+                    if len(self._message_cache) > MESSAGE_CACHE_SIZE:
+                        self._message_cache.popitem(last=False)
                 return commit_msg
             else:
                 self.logger.warning(f"Invalid LLM response: {commit_msg}")
@@ -191,6 +277,16 @@ Commit message:"""
         # Final fallback to simple heuristic
         return self._fallback_commit_message(diff)
 
+    def cancel_fallback(self) -> None:
+        """
+        Stop waiting on Linear fallback issues.
+
+        Workers blocked polling for a human response fall back to a heuristic
+        message straight away, so they can be stopped promptly.
+        """
+        if self.linear_fallback:
+            self.linear_fallback.cancel()
+
     def _fallback_commit_message(self, diff: str) -> str:
         """
         Generate a fallback commit message using simple heuristics.
@@ -203,9 +299,9 @@ Commit message:"""
         """
         self.logger.info("Using fallback commit message generation")
 
-        lines = diff.split("\n")
-        added_lines = len([line for line in lines if line.startswith("+")])
-        removed_lines = len([line for line in lines if line.startswith("-")])
+        # Count lines starting with +/- without splitting the diff into lines
+        added_lines = diff.count("\n+") + diff.startswith("+")
+        removed_lines = diff.count("\n-") + diff.startswith("-")
 
         if added_lines > removed_lines:
             return "feat: add new functionality"
@@ -215,8 +311,16 @@ Commit message:"""
             return "chore: update implementation"
 
 
-# Global instance for backward compatibility
-_llm_generator = LLMCommitGenerator()
+# Global instance for backward compatibility, created on first use
+_llm_generator: Optional[LLMCommitGenerator] = None
+
+
+def _get_generator() -> LLMCommitGenerator:
+    """Return the global LLMCommitGenerator, creating it if needed."""
+    global _llm_generator
+    if _llm_generator is None:
+        _llm_generator = LLMCommitGenerator()
+    return _llm_generator
 
 
 def generate_commit_message(diff: str) -> Optional[str]:
@@ -229,4 +333,4 @@ def generate_commit_message(diff: str) -> Optional[str]:
     Returns:
         Generated commit message
     """
-    return _llm_generator.generate_commit_message(diff)
+    return _get_generator().generate_commit_message(diff)
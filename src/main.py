@@ -1,11 +1,11 @@
 import logging
 import threading
 import time
-from queue import Queue
 
 from commit_worker import CommitWorkerPool
-from config import load_config
+from config import load_config, worker_cpu_sets
 from config_manager import ConfigurationManager
+from event_queue import EventCoalescer, ShardedEventQueue
 from git_ops import GitRepo
 from llm_comm import LLMCommitGenerator
 from review_queue import ReviewQueue
@@ -37,13 +37,23 @@ def main():
         logger.error("Could not initialize Git repository. Exiting.")
         return
 
-    event_queue = Queue()
+    # One event shard per core commit worker; extra workers share them
+    num_workers = config.min_workers
+    event_queue = ShardedEventQueue(num_workers)
+
+    # Collapse the several events a single save produces into one
+    coalescer = EventCoalescer(event_queue, config.coalesce_ms / 1000)
+    coalescer.start()
 
     path_to_watch = config.watch_directory
-    observer = start_watching(path_to_watch, event_queue)
+    observer = start_watching(path_to_watch, coalescer)
 
     # Initialize configuration manager
-    config_manager = ConfigurationManager(config.watch_directory)
+    config_manager = ConfigurationManager(
+        config.watch_directory,
+        include_patterns=config.include_patterns,
+        exclude_patterns=config.exclude_patterns,
+    )
 
     # Add default ignore patterns safely
     config_manager.safe_add_default_ignores()
@@ -57,16 +67,36 @@ def main():
         model_name=config.llm.model_name,
         enable_linear_fallback=config.llm.enable_linear_fallback,
         fallback_team_id=config.llm.fallback_team_id,
+        timeout_seconds=config.llm.timeout_seconds,
+        max_diff_chars=config.llm.max_diff_chars,
     )
 
     # Start the commit worker pool
     worker_pool = CommitWorkerPool(
-        event_queue, config_manager, review_queue, num_workers=2
+        config_manager=config_manager,
+        git_repo=repo,
+        event_queue=event_queue,
+        review_queue=review_queue,
+        llm_generator=llm_generator,
+        num_workers=num_workers,
+        max_workers=config.max_workers,
+        scale_up_threshold=config.scale_up_threshold,
+        scale_down_idle_s=config.scale_down_idle_s,
+        max_batch_n=config.max_batch_n,
+        max_batch_ms=config.max_batch_ms,
+        cpu_sets=worker_cpu_sets(
+            config.worker_affinity, config.affinity_strategy, config.max_workers
+        ),
     )
     worker_pool.start()
 
     # Start UI backend in a separate thread
-    ui_backend = create_ui_backend(review_queue, config_manager)
+    ui_backend = create_ui_backend(
+        review_queue,
+        config_manager,
+        linear_fallback=llm_generator.linear_fallback,
+        linear_webhook_secret=config.llm.fallback_webhook_secret,
+    )
     ui_thread = threading.Thread(
         target=ui_backend.run,
         kwargs={"host": "127.0.0.1", "port": 8000, "debug": False},
@@ -75,53 +105,19 @@ def main():
     ui_thread.start()
     logger.info("UI backend started on http://127.0.0.1:8000")
 
-    last_commit_time = time.time()
-    commit_interval = 10  # seconds
-
     try:
+        # The workers stage and commit included files as their events arrive
         while True:
-            # Commit changes on a timer if the repo is dirty
-            if time.time() - last_commit_time > commit_interval:
-                staged_diff = repo.get_diff("STAGED")
-                if repo.get_status() or staged_diff:
-                    logger.info("Changes detected, generating commit message...")
-                    repo.add_all()
-
-                    # Use staged diff for commit message generation
-                    diff_for_llm = repo.get_diff("STAGED")
-
-                    # Get changed file paths for LLM context
-                    status_output = repo.get_status()
-                    changed_files = []
-                    if status_output:
-                        for line in status_output.split("\n"):
-                            if line.strip():
-                                # Parse git status porcelain format
-                                file_path = line[3:].strip()
-                                changed_files.append(file_path)
-
-                    message = llm_generator.generate_commit_message(
-                        diff_for_llm, changed_files
-                    )
-                    if message:
-                        logger.info(f"Committing with message: {message}")
-                        repo.commit(message)
-                        last_commit_time = time.time()
-                    else:
-                        logger.warning(
-                            "Commit message generation failed. " "No changes committed."
-                        )
-                else:
-                    logger.debug("No changes to commit.")
-
-                last_commit_time = time.time()
-
             time.sleep(1)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
-        worker_pool.stop()
         observer.stop()
-    observer.join()
+        observer.join()
+        # Forward held events before the workers' stop sentinels
+        coalescer.stop()
+        # Don't let workers sit out a Linear poll before they can stop
+        llm_generator.cancel_fallback()
+        worker_pool.stop()
     logger.info("Auto-commit agent stopped.")
 
 
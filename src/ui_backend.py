@@ -4,15 +4,17 @@ This module provides the web API endpoints for the file review interface,
 allowing users to review ambiguous files and make include/exclude decisions.
 """
 
+import json
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import uvicorn
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from src.config_manager import ConfigurationManager, FileAction
+from src.linear_fallback import LinearFallbackManager, valid_webhook_signature
 from src.review_queue import ReviewItem, ReviewQueue
 
 logger = logging.getLogger(__name__)
@@ -44,9 +46,19 @@ class UserDecisionRequest(BaseModel):
 class UIBackend:
     """FastAPI backend for the user review interface."""
 
-    def __init__(self, review_queue: ReviewQueue, config_manager: ConfigurationManager):
+    def __init__(
+        self,
+        review_queue: ReviewQueue,
+        config_manager: ConfigurationManager,
+        linear_fallback: Optional[LinearFallbackManager] = None,
+        linear_webhook_secret: Optional[str] = None,
+    ):
         self.review_queue = review_queue
         self.config_manager = config_manager
+        # Receives Linear comment webhooks, so fallback issues get their
+        # answer as soon as it is posted instead of at the next poll
+        self.linear_fallback = linear_fallback
+        self.linear_webhook_secret = linear_webhook_secret
         self.app = FastAPI(
             title="Auto-commit Review UI",
             description="Web interface for reviewing ambiguous files",
@@ -178,6 +190,39 @@ class UIBackend:
                 logger.error(f"Error getting stats: {e}")
                 raise HTTPException(status_code=500, detail="Failed to get stats")
 
+        @self.app.post("/linear/webhook")
+        async def linear_webhook(request: Request) -> Dict[str, str]:
+            """Receive Linear comment events for pending fallback issues."""
+            # Unsigned requests could inject commit messages, so the endpoint
+            # only exists once a signing secret is configured
+            secret = self.linear_webhook_secret
+            if self.linear_fallback is None or not secret:
+                raise HTTPException(status_code=404, detail="Linear webhook disabled")
+
+            body = await request.body()
+            if not valid_webhook_signature(
+                secret, body, request.headers.get("linear-signature", "")
+            ):
+                raise HTTPException(status_code=401, detail="Invalid signature")
+
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+            if not isinstance(payload, dict):
+                raise HTTPException(status_code=400, detail="Invalid webhook payload")
+            data = payload.get("data") or {}
+            if not isinstance(data, dict):
+                raise HTTPException(status_code=400, detail="Invalid webhook payload")
+            if payload.get("type") != "Comment" or payload.get("action") != "create":
+                return {"status": "ignored"}
+
+            accepted = self.linear_fallback.deliver_comment(
+                data.get("issueId", ""), data.get("body", "")
+            )
+            return {"status": "accepted" if accepted else "ignored"}
+
     async def _process_user_decision(
         self, item: ReviewItem, decision: UserDecisionRequest
     ) -> bool:
@@ -255,7 +300,12 @@ class UIBackend:
 
 
 def create_ui_backend(
-    review_queue: ReviewQueue, config_manager: ConfigurationManager
+    review_queue: ReviewQueue,
+    config_manager: ConfigurationManager,
+    linear_fallback: Optional[LinearFallbackManager] = None,
+    linear_webhook_secret: Optional[str] = None,
 ) -> UIBackend:
     """Factory function to create a UI backend instance."""
-    return UIBackend(review_queue, config_manager)
+    return UIBackend(
+        review_queue, config_manager, linear_fallback, linear_webhook_secret
+    )
@@ -1,18 +1,47 @@
+import os
+import sys
 import time
+from typing import Union
 
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
 
+def _normalize_path(path: Union[bytes, str]) -> Union[bytes, str]:
+    """Returns an absolute, normalized path, interned for cheap dict lookups."""
+    if not path:
+        return path
+    path = os.path.abspath(path)
+    return sys.intern(path) if isinstance(path, str) else path
+
+
+def normalize_event(event: FileSystemEvent) -> FileSystemEvent:
+    """
+    Returns the event with its paths normalized once, so that the coalescer,
+    the file action cache and the workers all see the same key for a file.
+    Events whose paths are already normalized are returned unchanged.
+    """
+    src_path = _normalize_path(event.src_path)
+    dest_path = _normalize_path(getattr(event, "dest_path", ""))
+    if src_path == event.src_path and dest_path == getattr(event, "dest_path", ""):
+        return event
+    if dest_path:
+        normalized = type(event)(src_path, dest_path)
+    else:
+        normalized = type(event)(src_path)
+    normalized.is_synthetic = event.is_synthetic
+    return normalized
+
+
 class ChangeHandler(FileSystemEventHandler):
-    """Puts all events on a queue."""
+    """Puts all events on a queue, with normalized paths."""
 
     def __init__(self, queue):
         self.queue = queue
         super().__init__()
 
     def on_any_event(self, event):
-        self.queue.put(event)
+        self.queue.put(normalize_event(event))
 
 
 def start_watching(path, queue):
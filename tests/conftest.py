@@ -130,10 +130,12 @@ def sample_files(temp_dir):
 @pytest.fixture
 def mock_llm_response():
     """Mock LLM API response for testing."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "feat: add new functionality"}
+        mock_response.iter_lines.return_value = [
+            b'{"response": "feat: add new functionality", "done": true}'
+        ]
         mock_post.return_value = mock_response
         yield mock_post
 
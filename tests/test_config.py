@@ -2,6 +2,7 @@
 Unit tests for the config module.
 """
 
+import dataclasses
 import sys
 import tempfile
 from pathlib import Path
@@ -12,7 +13,13 @@ import yaml
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from config import AppConfig, LLMConfig, load_config
+from config import (
+    AppConfig,
+    LLMConfig,
+    load_config,
+    parse_worker_affinity,
+    worker_cpu_sets,
+)
 
 
 class TestLLMConfig:
@@ -65,6 +72,23 @@ class TestAppConfig:
         assert config.exclude_patterns == ["*.log"]
         assert config.llm == llm_config
 
+    def test_app_config_frozen(self):
+        """Test that AppConfig fields cannot be reassigned."""
+        config = AppConfig(
+            watch_directory="/test/path",
+            log_level="INFO",
+            include_patterns=["*"],
+            exclude_patterns=[],
+            llm=LLMConfig(),
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.log_level = "DEBUG"
+
+        updated = dataclasses.replace(config, log_level="DEBUG")
+        assert updated.log_level == "DEBUG"
+        assert config.log_level == "INFO"
+
 
 class TestLoadConfig:
     """Test cases for load_config function."""
@@ -116,6 +140,11 @@ class TestLoadConfig:
         assert config.include_patterns == ["*"]  # Default
         assert config.exclude_patterns == []  # Default
         assert config.llm.base_url == "http://localhost:11434"  # Default
+        assert config.max_batch_n == 64  # Default
+        assert config.max_batch_ms == 200  # Default
+        assert config.coalesce_ms == 200  # Default
+        assert config.min_workers == 2  # Default
+        assert config.max_workers == 2  # Default
 
     def test_load_config_missing_watch_directory(self):
         """Test config loading fails without watch_directory."""
@@ -166,6 +195,73 @@ class TestLoadConfig:
         assert config.llm.base_url == "http://localhost:11434"  # Default
         assert config.llm.timeout_seconds == 30  # Default
 
+    def test_load_config_worker_affinity(self):
+        """Test config loading with worker affinity settings."""
+        config_data = {
+            "watch_directory": "/test/dir",
+            "worker_affinity": [0, 2],
+            "affinity_strategy": "sparse",
+        }
+
+        with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
+            config = load_config("affinity_config.yml")
+
+        assert config.worker_affinity == "0,2"
+        assert config.affinity_strategy == "sparse"
+
+    def test_load_config_invalid_worker_affinity(self):
+        """Test config loading fails with a malformed affinity."""
+        for key, value in (
+            ("worker_affinity", "1-x"),
+            ("affinity_strategy", "random"),
+        ):
+            config_data = {"watch_directory": "/test/dir", key: value}
+
+            with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
+                with pytest.raises(ValueError):
+                    load_config("invalid_affinity.yml")
+
+    def test_load_config_worker_scaling(self):
+        """Test config loading with adaptive worker settings."""
+        config_data = {
+            "watch_directory": "/test/dir",
+            "min_workers": 1,
+            "max_workers": 6,
+            "scale_up_threshold": 10,
+            "scale_down_idle_s": 5,
+        }
+
+        with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
+            config = load_config("scaling_config.yml")
+
+        assert config.min_workers == 1
+        assert config.max_workers == 6
+        assert config.scale_up_threshold == 10
+        assert config.scale_down_idle_s == 5
+
+    def test_load_config_invalid_worker_counts(self):
+        """Test config loading fails when worker bounds are inconsistent."""
+        for counts in ({"min_workers": 0}, {"min_workers": 3, "max_workers": 2}):
+            config_data = {"watch_directory": "/test/dir", **counts}
+
+            with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
+                with pytest.raises(ValueError):
+                    load_config("invalid_workers.yml")
+
+    def test_load_config_invalid_types(self):
+        """Test config loading reports values of the wrong type."""
+        for overrides, key in (
+            ({"max_batch_n": "many"}, "max_batch_n"),
+            ({"include_patterns": "*.py"}, "include_patterns"),
+            ({"llm": {"timeout_seconds": "30"}}, "llm.timeout_seconds"),
+            ({"llm": ["http://test:1234"]}, "llm"),
+        ):
+            config_data = {"watch_directory": "/test/dir", **overrides}
+
+            with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
+                with pytest.raises(ValueError, match=f"'{key}'"):
+                    load_config("invalid_types.yml")
+
     def test_load_config_with_real_file(self, temp_dir):
         """Test config loading with actual file I/O."""
         config_data = {
@@ -185,3 +281,55 @@ class TestLoadConfig:
         assert config.log_level == "WARNING"
         assert config.include_patterns == ["*.txt"]
         assert config.exclude_patterns == ["*.bak"]
+
+    def test_load_config_cached_until_modified(self, temp_dir):
+        """Test that an unchanged file is parsed only once."""
+        config_file = temp_dir / "cached_config.yml"
+        config_file.write_text("watch_directory: /first\n")
+
+        with patch("config.yaml.load", wraps=yaml.load) as mock_load:
+            first = load_config(str(config_file))
+            first.include_patterns.append("*.mutated")
+            second = load_config(str(config_file))
+
+            assert mock_load.call_count == 1
+            assert second.include_patterns == ["*"]  # Callers get copies
+
+            config_file.write_text("watch_directory: /second/dir\n")
+            third = load_config(str(config_file))
+
+        assert mock_load.call_count == 2
+        assert third.watch_directory == "/second/dir"
+
+
+class TestWorkerAffinity:
+    """Test cases for worker CPU affinity helpers."""
+
+    def test_parse_worker_affinity(self):
+        """Test the supported affinity syntaxes."""
+        assert parse_worker_affinity("1,2") == [{1}, {2}]
+        assert parse_worker_affinity("1-3") == [{1}, {2}, {3}]
+        assert parse_worker_affinity("[0-3]:2") == [{0, 1, 2, 3}, {0, 1, 2, 3}]
+        assert parse_worker_affinity("0, [2,4]:2") == [{0}, {2, 4}, {2, 4}]
+
+    def test_parse_worker_affinity_invalid(self):
+        """Test that malformed affinities are rejected."""
+        for spec in ("", "a", "3-1", "1,,2", "[0-3]"):
+            with pytest.raises(ValueError):
+                parse_worker_affinity(spec)
+
+    def test_worker_cpu_sets_explicit(self):
+        """Test that affinity slots are assigned round-robin."""
+        assert worker_cpu_sets("1,2", "dense", 3) == [{1}, {2}, {1}]
+
+    def test_worker_cpu_sets_unpinned(self):
+        """Test that workers are not pinned by default."""
+        assert worker_cpu_sets(None, None, 2) is None
+
+    def test_worker_cpu_sets_strategies(self):
+        """Test dense and sparse placement within the allowed CPUs."""
+        with patch(
+            "config.os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True
+        ):
+            assert worker_cpu_sets(None, "dense", 2) == [{0}, {1}]
+            assert worker_cpu_sets(None, "sparse", 2) == [{0}, {2}]
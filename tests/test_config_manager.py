@@ -10,7 +10,12 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from config_manager import ConfigurationManager, FileAction
+from config_manager import (
+    ConfigurationManager,
+    FileAction,
+    PatternMatcher,
+    _relative_posix,
+)
 
 
 class TestFileAction:
@@ -89,6 +94,62 @@ class TestConfigurationManager:
         assert config_files[0] == (root_gitignore, "ignore")
         assert config_files[1] == (sub_gitinclude, "include")
 
+    def test_find_config_files_cached_per_directory(self, config_manager, temp_dir):
+        """Test that each directory is scanned for config files only once."""
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        gitignore = temp_dir / ".gitignore"
+        gitignore.write_text("*.log")
+        for name in ("a.py", "b.py", "c.py"):
+            (subdir / name).touch()
+
+        config_manager._find_config_files(subdir / "a.py")
+
+        with patch.object(config_manager, "_scan_config_dir") as mock_scan:
+            config_files = config_manager._find_config_files(subdir / "b.py")
+
+        mock_scan.assert_not_called()
+        assert config_files == [(gitignore, "ignore")]
+
+        # New config files are picked up once refreshed
+        sub_gitinclude = subdir / ".gitinclude"
+        sub_gitinclude.write_text("*.py")
+        config_manager.refresh(sub_gitinclude)
+
+        assert config_manager._find_config_files(subdir / "c.py") == [
+            (gitignore, "ignore"),
+            (sub_gitinclude, "include"),
+        ]
+
+    def test_scan_config_dir(self, config_manager, temp_dir):
+        """Test that only regular config files in a directory are picked up."""
+        gitinclude = temp_dir / ".gitinclude"
+        gitinclude.write_text("*.py")
+        (temp_dir / ".gitignore").mkdir()
+        (temp_dir / "other.txt").touch()
+
+        assert config_manager._scan_config_dir(temp_dir) == (
+            (gitinclude, "include"),
+        )
+        assert config_manager._scan_config_dir(temp_dir / "missing") == ()
+
+    def test_refresh_invalidates_subtree(self, config_manager, temp_dir):
+        """Test that refreshing a config file updates rules below it only."""
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        test_file = subdir / "debug.log"
+        test_file.touch()
+
+        gitignore = temp_dir / ".gitignore"
+        gitignore.write_text("*.py\n")
+        assert config_manager.get_file_action(str(test_file)) == FileAction.REVIEW
+
+        gitignore.write_text("*.log\n")
+        config_manager.refresh(str(gitignore))
+
+        assert config_manager.get_file_action(str(test_file)) == FileAction.IGNORE
+        assert config_manager._find_config_files(test_file) == [(gitignore, "ignore")]
+
     def test_parse_config_file(self, config_manager, temp_dir):
         """Test parsing configuration files."""
         config_file = temp_dir / ".gitignore"
@@ -99,6 +160,15 @@ class TestConfigurationManager:
         # Should exclude comments and empty lines
         assert patterns == ["*.log", "__pycache__/", "*.tmp"]
 
+    def test_parse_config_file_crlf_and_bad_bytes(self, config_manager, temp_dir):
+        """Test parsing files with CRLF endings and invalid UTF-8."""
+        config_file = temp_dir / ".gitignore"
+        config_file.write_bytes(b"*.log\r\n  # Comment\r\nbad\xff.txt\r\n")
+
+        patterns = config_manager._parse_config_file(config_file)
+
+        assert patterns == ["*.log", "bad\ufffd.txt"]
+
     def test_parse_config_file_caching(self, config_manager, temp_dir):
         """Test that config file parsing uses caching."""
         config_file = temp_dir / ".gitignore"
@@ -106,35 +176,59 @@ class TestConfigurationManager:
 
         # First call
         patterns1 = config_manager._parse_config_file(config_file)
-        assert config_file in config_manager._config_cache
+        assert str(config_file) in config_manager._config_cache
 
         # Second call should use cache
         patterns2 = config_manager._parse_config_file(config_file)
         assert patterns1 == patterns2
 
-    def test_matches_pattern_simple(self, config_manager, temp_dir):
-        """Test simple pattern matching."""
-        test_file = temp_dir / "test.log"
-        pattern = "*.log"
-
-        assert config_manager._matches_pattern(test_file, pattern, temp_dir)
-
-    def test_matches_pattern_directory(self, config_manager, temp_dir):
-        """Test directory pattern matching."""
-        subdir = temp_dir / "cache"
+    def test_get_matcher_union(self, config_manager, temp_dir):
+        """Test that a config file's patterns compile into one matcher."""
+        config_file = temp_dir / ".gitignore"
+        config_file.write_text("*.log\ncache/\n")
+
+        matcher = config_manager._get_matcher(config_file)
+
+        assert matcher.match("debug.log")
+        assert matcher.match("cache")
+        assert matcher.match("cache/file.py")
+        assert not matcher.match("cached/file.py")
+        assert not matcher.match("test.py")
+
+    def test_pattern_matcher_buckets(self):
+        """Test that every kind of pattern matches like fnmatch would."""
+        matcher = PatternMatcher(["*.log", "README", "cache/", "build-?.txt", "*"])
+        assert matcher.match("anything")
+
+        matcher = PatternMatcher(["*.log", "README", "cache/", "build-?.txt"])
+        assert matcher.match("logs/debug.log")
+        assert matcher.match("README")
+        assert not matcher.match("docs/README")
+        assert matcher.match("cache")
+        assert matcher.match("cache/a/b.py")
+        assert not matcher.match("cached/b.py")
+        assert matcher.match("build-1.txt")
+        assert not matcher.match("build-10.txt")
+
+    def test_matchers_shared_between_config_files(self, config_manager, temp_dir):
+        """Test that config files with the same patterns share one matcher."""
+        subdir = temp_dir / "subdir"
         subdir.mkdir()
-        test_file = subdir / "file.py"
-        test_file.touch()
+        root_gitignore = temp_dir / ".gitignore"
+        sub_gitignore = subdir / ".gitignore"
+        root_gitignore.write_text("__pycache__/\n*.py[co]\n")
+        sub_gitignore.write_text("__pycache__/\n*.py[co]\n")
 
-        pattern = "cache/"
-        assert config_manager._matches_pattern(test_file, pattern, temp_dir)
+        root_matcher = config_manager._get_matcher(root_gitignore)
+        assert root_matcher is config_manager._get_matcher(sub_gitignore)
+        assert root_matcher.match("a/b.pyc")
 
-    def test_matches_pattern_no_match(self, config_manager, temp_dir):
-        """Test pattern that doesn't match."""
-        test_file = temp_dir / "test.py"
-        pattern = "*.log"
-
-        assert not config_manager._matches_pattern(test_file, pattern, temp_dir)
+    def test_relative_posix(self):
+        """Test string-based relative paths against Path.relative_to."""
+        assert _relative_posix("/repo/src/a.py", "/repo") == "src/a.py"
+        assert _relative_posix("/repo", "/repo") == "."
+        assert _relative_posix("/repository/a.py", "/repo") is None
+        assert _relative_posix("/repo/a.py", "/") == "repo/a.py"
 
     def test_get_file_action_no_config(self, config_manager, temp_dir):
         """Test file action when no config files exist."""
@@ -180,6 +274,68 @@ class TestConfigurationManager:
         action = config_manager.get_file_action(str(test_file))
         assert action == FileAction.REVIEW
 
+    def test_get_file_action_stops_once_decided(self, config_manager, temp_dir):
+        """Test that config files that cannot change the outcome are skipped."""
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        (temp_dir / ".gitignore").write_text("*.log")
+        (subdir / ".gitignore").write_text("debug.log")
+
+        test_file = subdir / "debug.log"
+        test_file.touch()
+
+        with patch.object(
+            config_manager, "_get_matcher", wraps=config_manager._get_matcher
+        ) as mock_matcher:
+            action = config_manager.get_file_action(str(test_file))
+
+        assert action == FileAction.IGNORE
+        mock_matcher.assert_called_once_with(temp_dir / ".gitignore")
+
+    def test_get_file_action_app_filter(self, temp_dir):
+        """Test that application-level include/exclude globs apply first."""
+        cm = ConfigurationManager(
+            str(temp_dir),
+            include_patterns=["*.py", "*.md"],
+            exclude_patterns=[".*", "build/*"],
+        )
+        (temp_dir / ".gitinclude").write_text("*.txt\n*.py\n")
+
+        assert cm.get_file_action(str(temp_dir / "main.py")) == FileAction.INCLUDE
+        assert cm.get_file_action(str(temp_dir / "notes.md")) == FileAction.REVIEW
+        assert cm.get_file_action(str(temp_dir / "notes.txt")) == FileAction.IGNORE
+        assert cm.get_file_action(str(temp_dir / ".env")) == FileAction.IGNORE
+        assert cm.get_file_action(str(temp_dir / "build" / "x.py")) == FileAction.IGNORE
+
+    def test_get_file_action_cached(self, config_manager, temp_dir):
+        """Test that file actions are cached per path."""
+        gitignore = temp_dir / ".gitignore"
+        gitignore.write_text("*.log")
+
+        test_file = temp_dir / "test.log"
+        test_file.touch()
+
+        assert config_manager.get_file_action(str(test_file)) == FileAction.IGNORE
+
+        with patch.object(config_manager, "_find_config_files") as mock_find:
+            action = config_manager.get_file_action(str(test_file))
+
+        assert action == FileAction.IGNORE
+        mock_find.assert_not_called()
+
+    def test_get_file_action_cache_invalidated(self, config_manager, temp_dir):
+        """Test that adding a pattern invalidates cached file actions."""
+        test_file = temp_dir / "test.log"
+        test_file.touch()
+
+        assert config_manager.get_file_action(str(test_file)) == FileAction.REVIEW
+
+        config_manager.add_pattern(
+            pattern="*.log", action=FileAction.IGNORE, scope="global"
+        )
+
+        assert config_manager.get_file_action(str(test_file)) == FileAction.IGNORE
+
     def test_add_pattern_include_project(self, config_manager, temp_dir):
         """Test adding include pattern at project level."""
         test_file = temp_dir / "test.py"
@@ -255,6 +411,53 @@ class TestConfigurationManager:
         assert "__pycache__/" in content
         assert "*.log" in content
 
+    def test_patterns_matching_tracked_files_anchored(self, config_manager):
+        """Test that directory patterns only match from the repository root."""
+        git_repo = Mock()
+        git_repo.get_tracked_files.return_value = ["README.md", "build/app/main.py"]
+
+        matched = config_manager._patterns_matching_tracked_files(
+            git_repo, ["build/", "*.md", "dist/", "app/"]
+        )
+
+        assert matched == {"build/", "*.md"}
+        assert config_manager._patterns_matching_tracked_files(git_repo, []) == set()
+
+    def test_patterns_matching_tracked_files(self, config_manager):
+        """Test finding every pattern that matches a tracked file in one pass."""
+        git_repo = Mock()
+        git_repo.get_tracked_files.return_value = [
+            "README.md",
+            "build/debug.log",
+            "src/app.py",
+        ]
+
+        matched = config_manager._patterns_matching_tracked_files(
+            git_repo, ["build/", "*.log", "dist/", "*.pyc", "*.md"]
+        )
+
+        assert matched == {"build/", "*.log", "*.md"}
+        git_repo.get_tracked_files.assert_called_once()
+
+    def test_patterns_matching_tracked_files_parallel(self, config_manager):
+        """Test that a large tracked file scan is split between processes."""
+        git_repo = Mock()
+        git_repo.get_tracked_files.return_value = [
+            "README.md",
+            "build/debug.log",
+            "src/app.py",
+            "src/app.pyc",
+        ]
+
+        with patch("config_manager.PARALLEL_SCAN_MIN_FILES", 1), patch(
+            "config_manager._usable_cpus", return_value=2
+        ):
+            matched = config_manager._patterns_matching_tracked_files(
+                git_repo, ["build/", "*.log", "dist/", "*.pyc"]
+            )
+
+        assert matched == {"build/", "*.log", "*.pyc"}
+
     @patch("src.git_ops.GitRepo")
     def test_safe_add_default_ignores_with_conflicts(
         self, mock_git_repo_class, config_manager, temp_dir
@@ -271,16 +474,7 @@ class TestConfigurationManager:
         ]
         mock_git_repo_class.return_value = mock_repo
 
-        # Mock the pattern matching to return True for conflicting patterns
-        with patch.object(
-            config_manager, "_has_tracked_files_matching_pattern"
-        ) as mock_match:
-            mock_match.side_effect = lambda repo, pattern: pattern in [
-                "build/",
-                "dist/",
-            ]
-
-            success = config_manager.safe_add_default_ignores()
+        success = config_manager.safe_add_default_ignores()
 
         assert success
         gitignore_path = temp_dir / ".gitignore"
@@ -320,3 +514,16 @@ class TestConfigurationManager:
         assert "cache_files" in stats
         assert stats["cached_config_files"] == 1
         assert str(config_file) in stats["cache_files"]
+
+    def test_get_stats_file_action_cache(self, config_manager, temp_dir):
+        """Test that statistics report file action cache usage."""
+        test_file = str(temp_dir / "test.py")
+
+        config_manager.get_file_action(test_file)
+        config_manager.get_file_action(test_file)
+
+        stats = config_manager.get_stats()
+
+        assert stats["cached_file_actions"] == 1
+        assert stats["file_action_cache_hits"] == 1
+        assert stats["file_action_cache_misses"] == 1
@@ -0,0 +1,284 @@
+"""
+Unit tests for the event_queue module.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from queue import Queue, SimpleQueue
+
+import pytest
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from event_queue import (
+    EventCoalescer,
+    EventCount,
+    QueueAdapter,
+    ShardedEventQueue,
+    as_batch_queue,
+    cpu_numa_nodes,
+)
+
+
+class TestShardedEventQueue:
+    """Test cases for ShardedEventQueue class."""
+
+    def test_init_invalid_shards(self):
+        """Test that at least one shard is required."""
+        with pytest.raises(ValueError):
+            ShardedEventQueue(0)
+
+    def test_same_path_same_shard(self):
+        """Test that events for one path are queued on one shard in order."""
+        event_queue = ShardedEventQueue(4)
+        events = [FileModifiedEvent("/watched/file.py") for _ in range(3)]
+        for event in events:
+            event_queue.put(event)
+
+        assert event_queue.qsize() == 3
+        assert sum(1 for shard in event_queue._shards if shard) == 1
+
+        shard_index = next(i for i, shard in enumerate(event_queue._shards) if shard)
+        batch = event_queue.get_batch(shard_index, max_items=10)
+
+        assert len(batch) == 3
+        assert all(event is expected for event, expected in zip(batch, events))
+
+    def test_get_batch_respects_max_items(self):
+        """Test that a batch never exceeds max_items."""
+        event_queue = ShardedEventQueue(1)
+        for i in range(5):
+            event_queue.put(FileModifiedEvent(f"/watched/file{i}.py"))
+
+        assert len(event_queue.get_batch(0, max_items=2)) == 2
+        assert len(event_queue.get_batch(0, max_items=10)) == 3
+
+    def test_get_batch_stops_at_marker(self):
+        """Test that a batch ends after the until marker."""
+        event_queue = ShardedEventQueue(1)
+        marker = object()
+        event_queue.put(FileModifiedEvent("/watched/a.py"))
+        event_queue.put(marker)
+        event_queue.put(FileModifiedEvent("/watched/b.py"))
+
+        batch = event_queue.get_batch(0, max_items=10, until=marker)
+
+        assert len(batch) == 2
+        assert batch[-1] is marker
+        assert event_queue.qsize() == 1
+
+    def test_idle_worker_steals(self):
+        """Test that a worker with an empty shard steals from a peer."""
+        event_queue = ShardedEventQueue(2)
+        event = FileModifiedEvent("/watched/file.py")
+        event_queue.put(event)
+
+        owner = next(i for i, shard in enumerate(event_queue._shards) if shard)
+        batch = event_queue.get_batch(1 - owner, max_items=10)
+
+        assert batch == [event]
+        assert event_queue.qsize() == 0
+
+    def test_steal_prefers_same_node(self):
+        """Test that victims on the thief's NUMA node are tried first."""
+        event_queue = ShardedEventQueue(4)
+        event_queue.set_shard_nodes([0, 1, 0, 1])
+        near = FileModifiedEvent("/watched/near.py")
+        far = FileModifiedEvent("/watched/far.py")
+        event_queue._shards[2].append(near)
+        event_queue._shards[1].append(far)
+        event_queue._shards[3].append(far)
+
+        assert event_queue._steal(0) == [near]
+        assert event_queue._steal(0) == [far]
+
+    def test_set_shard_nodes_invalid(self):
+        """Test that one node is required per shard."""
+        with pytest.raises(ValueError):
+            ShardedEventQueue(2).set_shard_nodes([0])
+
+    def test_get_batch_blocks_until_put(self):
+        """Test that an idle worker is woken by a put."""
+        event_queue = ShardedEventQueue(2)
+        results = []
+
+        thread = threading.Thread(
+            target=lambda: results.append(event_queue.get_batch(0, max_items=10)),
+            daemon=True,
+        )
+        thread.start()
+        time.sleep(0.1)
+        assert thread.is_alive()
+
+        event_queue.put(FileModifiedEvent("/watched/file.py"))
+        thread.join(timeout=1)
+
+        assert not thread.is_alive()
+        assert len(results[0]) == 1
+
+    def test_get_batch_timeout(self):
+        """Test that get_batch gives up once its timeout expires."""
+        event_queue = ShardedEventQueue(2)
+
+        assert event_queue.get_batch(0, max_items=10, timeout=0) == []
+        assert event_queue.get_batch(0, max_items=10, timeout=0.05) == []
+
+    def test_task_done_and_join(self):
+        """Test in-flight task accounting."""
+        event_queue = ShardedEventQueue(1)
+        for i in range(3):
+            event_queue.put(FileModifiedEvent(f"/watched/file{i}.py"))
+
+        batch = event_queue.get_batch(0, max_items=10)
+        assert len(batch) == 3
+
+        event_queue.task_done(len(batch))
+        event_queue.join()  # Returns immediately once all are done
+
+        with pytest.raises(ValueError):
+            event_queue.task_done()
+
+
+class TestQueueAdapter:
+    """Test cases for QueueAdapter class."""
+
+    def test_as_batch_queue(self):
+        """Test that only standard library queues get wrapped."""
+        sharded = ShardedEventQueue(1)
+        assert as_batch_queue(sharded) is sharded
+        assert isinstance(as_batch_queue(Queue()), QueueAdapter)
+        assert isinstance(as_batch_queue(SimpleQueue()), QueueAdapter)
+
+    def test_get_batch_stops_at_marker(self):
+        """Test that a batch drains up to max_items or the marker."""
+        queue = Queue()
+        adapter = QueueAdapter(queue)
+        marker = object()
+        for item in [1, 2, 3, marker, 4]:
+            adapter.put(item)
+
+        assert adapter.get_batch(0, max_items=2, until=marker) == [1, 2]
+        assert adapter.get_batch(0, max_items=10, until=marker) == [3, marker]
+        assert adapter.get_batch(0, max_items=10, timeout=0) == [4]
+        assert adapter.get_batch(0, max_items=10, timeout=0) == []
+
+        adapter.task_done(5)
+        queue.join()  # Returns immediately once all are done
+        with pytest.raises(ValueError):
+            adapter.task_done()
+
+    def test_simple_queue(self):
+        """Test that a SimpleQueue needs no task accounting."""
+        adapter = QueueAdapter(SimpleQueue())
+        adapter.put(1)
+        assert adapter.qsize() == 1
+
+        assert adapter.get_batch(0, max_items=10) == [1]
+        adapter.task_done(1)
+        adapter.join()
+
+
+class TestEventCount:
+    """Test cases for EventCount class."""
+
+    def test_notify_without_waiters(self):
+        """Test that notifying with nobody waiting is a no-op."""
+        event_count = EventCount()
+        event_count.notify_one()
+
+        epoch = event_count.prepare_wait()
+        event_count.cancel_wait()
+        assert event_count.prepare_wait() == epoch
+
+    def test_notify_between_prepare_and_wait(self):
+        """Test that a notification before wait() is not lost."""
+        event_count = EventCount()
+        epoch = event_count.prepare_wait()
+        event_count.notify_one()
+
+        # Would block forever if the wake-up had been lost
+        event_count.wait(epoch)
+
+
+class TestEventCoalescer:
+    """Test cases for EventCoalescer class."""
+
+    def test_burst_collapses_to_latest(self):
+        """Test that a burst for one path forwards only its last event."""
+        event_queue = Queue()
+        coalescer = EventCoalescer(event_queue, window=0.2)
+        coalescer.start()
+        try:
+            created = FileCreatedEvent("/watched/file.py")
+            modified = FileModifiedEvent("/watched/file.py")
+            other = FileModifiedEvent("/watched/other.py")
+            for event in (created, modified, other, modified):
+                coalescer.put(event)
+
+            assert event_queue.empty()
+            assert coalescer.pending() == 2
+
+            forwarded = [event_queue.get(timeout=1) for _ in range(2)]
+        finally:
+            coalescer.stop()
+
+        assert forwarded == [other, modified]
+        assert event_queue.empty()
+
+    def test_stop_flushes_pending(self):
+        """Test that stopping forwards held events immediately."""
+        event_queue = Queue()
+        coalescer = EventCoalescer(event_queue, window=60)
+        coalescer.start()
+        event = FileModifiedEvent("/watched/file.py")
+        coalescer.put(event)
+
+        coalescer.stop()
+
+        assert event_queue.get_nowait() is event
+        assert coalescer.pending() == 0
+
+    def test_move_not_replaced_by_source_event(self):
+        """Test that a later event on a move's source keeps the move."""
+        event_queue = Queue()
+        coalescer = EventCoalescer(event_queue, window=60)
+        coalescer.start()
+        moved = FileMovedEvent("/watched/a.txt", "/watched/b.txt")
+        created = FileCreatedEvent("/watched/a.txt")
+        coalescer.put(moved)
+        coalescer.put(created)
+        assert coalescer.pending() == 2
+
+        coalescer.stop()
+
+        assert [event_queue.get_nowait() for _ in range(2)] == [moved, created]
+
+    def test_zero_window_passes_through(self):
+        """Test that a zero window forwards events without holding them."""
+        event_queue = Queue()
+        coalescer = EventCoalescer(event_queue, window=0)
+        event = FileModifiedEvent("/watched/file.py")
+
+        coalescer.put(event)
+
+        assert event_queue.get_nowait() is event
+
+
+class TestCpuNumaNodes:
+    """Test cases for cpu_numa_nodes function."""
+
+    def test_reads_sysfs_cpulists(self, temp_dir):
+        """Test mapping CPUs to nodes from node*/cpulist files."""
+        for node, cpulist in (("node0", "0-1,4\n"), ("node1", "2-3\n")):
+            (temp_dir / node).mkdir()
+            (temp_dir / node / "cpulist").write_text(cpulist)
+        (temp_dir / "online").write_text("0-1\n")
+
+        assert cpu_numa_nodes(str(temp_dir)) == {0: 0, 1: 0, 4: 0, 2: 1, 3: 1}
+
+    def test_missing_topology(self, temp_dir):
+        """Test that a missing sysfs directory yields no mapping."""
+        assert cpu_numa_nodes(str(temp_dir / "missing")) == {}
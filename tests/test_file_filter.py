@@ -0,0 +1,64 @@
+"""
+Unit tests for the file_filter module.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from file_filter import PathFilter, compile_globs, is_path_match, should_process_path
+
+
+class TestCompileGlobs:
+    """Test cases for compile_globs."""
+
+    def test_no_patterns(self):
+        """Test that no patterns compile to no regex."""
+        assert compile_globs([]) is None
+
+    def test_any_pattern_matches(self):
+        """Test that the regex matches a path if any pattern does."""
+        regex = compile_globs(["*.py", "docs/*"])
+
+        assert regex.match("src/main.py")
+        assert regex.match("docs/guide.md")
+        assert not regex.match("README.md")
+
+    def test_directory_patterns(self):
+        """Test that a trailing slash only matches with match_directories."""
+        assert compile_globs(["build/"], match_directories=True).match("build")
+        assert not compile_globs(["build/"]).match("build")
+
+
+class TestPathFilter:
+    """Test cases for PathFilter class."""
+
+    def test_include_and_exclude(self):
+        """Test that exclude patterns take precedence over include patterns."""
+        path_filter = PathFilter(["*.py"], ["tests/*", "build/"])
+
+        assert path_filter.should_process("src/main.py")
+        assert not path_filter.should_process("tests/test_main.py")
+        assert not path_filter.should_process("build")
+        assert not path_filter.should_process("README.md")
+
+    def test_no_include_patterns(self):
+        """Test that nothing is processed without include patterns."""
+        assert not PathFilter([]).should_process("src/main.py")
+
+
+class TestFilterFunctions:
+    """Test cases for the pattern list wrappers."""
+
+    def test_is_path_match(self):
+        """Test matching a path against a list of patterns."""
+        assert is_path_match("src/main.py", ["*.md", "*.py"])
+        assert not is_path_match("src/main.py", ["*.md"])
+        assert not is_path_match("src/main.py", [])
+
+    def test_should_process_path(self):
+        """Test filtering a path with include and exclude lists."""
+        assert should_process_path("src/main.py", ["*.py"], [])
+        assert not should_process_path("src/main.py", ["*.py"], ["src/*"])
+        assert not should_process_path("src/main.py", [], [])
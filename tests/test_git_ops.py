@@ -93,14 +93,77 @@ class TestGitRepo:
         for i in range(3):
             assert f"test{i}.py" in staged_files
 
+    def test_add_files_single_git_call_per_chunk(self, temp_git_repo):
+        """Test that files are staged with one git add per chunk."""
+        temp_dir, repo = temp_git_repo
+
+        files = []
+        for i in range(5):
+            file_path = temp_dir / f"chunk{i}.py"
+            file_path.write_text(f"print('chunk{i}')")
+            files.append(str(file_path))
+
+        git_repo = GitRepo(str(temp_dir))
+        with patch("git_ops.ADD_CHUNK_SIZE", 2), patch.object(
+            git_repo.repo, "git", wraps=git_repo.repo.git
+        ) as mock_git:
+            git_repo.add_files(files)
+
+        assert mock_git.add.call_count == 3
+        staged_files = [item.a_path for item in repo.index.diff("HEAD")]
+        for i in range(5):
+            assert f"chunk{i}.py" in staged_files
+
     def test_add_files_nonexistent(self, temp_git_repo):
-        """Test adding nonexistent file raises error."""
+        """Test that missing files are staged as removed or skipped."""
         temp_dir, repo = temp_git_repo
 
+        new_file = temp_dir / "new.py"
+        new_file.write_text("print('new')")
+        (temp_dir / "README.md").unlink()
+
         git_repo = GitRepo(str(temp_dir))
+        git_repo.add_files(
+            [
+                str(temp_dir / "nonexistent.py"),
+                str(temp_dir / "README.md"),
+                str(new_file),
+            ]
+        )
+
+        staged = {item.a_path: item.change_type for item in repo.index.diff("HEAD")}
+        # Diffing the index against HEAD reports the reverse change
+        assert staged == {"README.md": "A", "new.py": "D"}
+
+    def test_commit_only_given_paths(self, temp_git_repo):
+        """Test that committing paths leaves other staged changes staged."""
+        temp_dir, repo = temp_git_repo
 
-        with pytest.raises(git.GitCommandError):
-            git_repo.add_files(["nonexistent.py"])
+        mine = temp_dir / "mine.py"
+        mine.write_text("print('mine')")
+        other = temp_dir / "other.py"
+        other.write_text("print('other')")
+        (temp_dir / "README.md").rename(temp_dir / "README.txt")
+
+        git_repo = GitRepo(str(temp_dir))
+        git_repo.add_files([str(other)])
+        paths = [str(mine), str(temp_dir / "README.md"), str(temp_dir / "README.txt")]
+        git_repo.add_files(paths)
+
+        staged = git_repo.get_staged_files(paths)
+        assert sorted(staged) == ["README.md", "README.txt", "mine.py"]
+        assert "mine.py" in git_repo.get_diff("STAGED", paths=staged)
+        assert "other.py" not in git_repo.get_diff("STAGED", paths=staged)
+
+        commit_sha = git_repo.commit("feat: add mine", stage_all=False, paths=staged)
+
+        assert commit_sha == repo.head.commit.hexsha
+        assert sorted(repo.head.commit.stats.files) == [
+            "README.md",
+            "README.txt",
+            "mine.py",
+        ]
+        assert [item.a_path for item in repo.index.diff("HEAD")] == ["other.py"]
 
     def test_commit_with_message(self, temp_git_repo):
         """Test committing with custom message."""
@@ -124,6 +187,35 @@ class TestGitRepo:
         latest_commit = repo.head.commit
         assert latest_commit.message.strip() == commit_message
 
+    def test_commit_staged_only(self, temp_git_repo):
+        """Test committing only the staged files."""
+        temp_dir, repo = temp_git_repo
+
+        staged_file = temp_dir / "staged.py"
+        staged_file.write_text("print('staged')")
+        unstaged_file = temp_dir / "unstaged.py"
+        unstaged_file.write_text("print('unstaged')")
+
+        git_repo = GitRepo(str(temp_dir))
+        git_repo.add_files([str(staged_file)])
+
+        assert git_repo.commit("feat: add staged file", stage_all=False)
+        assert list(repo.head.commit.stats.files) == ["staged.py"]
+        assert git_repo.commit("Nothing staged", stage_all=False) is None
+
+    def test_commit_stages_untracked_files(self, temp_git_repo):
+        """Test that committing with stage_all picks up untracked files."""
+        temp_dir, repo = temp_git_repo
+
+        (temp_dir / "untracked.py").write_text("print('untracked')")
+
+        git_repo = GitRepo(str(temp_dir))
+        commit_sha = git_repo.commit("feat: add untracked file")
+
+        assert commit_sha == repo.head.commit.hexsha
+        assert list(repo.head.commit.stats.files) == ["untracked.py"]
+        assert git_repo.get_status() == ""
+
     def test_commit_no_changes(self, temp_git_repo):
         """Test committing with no staged changes."""
         temp_dir, repo = temp_git_repo
@@ -193,6 +285,39 @@ class TestGitRepo:
         for i in range(3):
             assert f"tracked{i}.py" in tracked_files
 
+    def test_get_tracked_files_unusual_names(self, temp_git_repo):
+        """Test that tracked paths are returned verbatim, without quoting."""
+        temp_dir, repo = temp_git_repo
+
+        names = ["caf\u00e9.py", "with space.txt", "sub/line\nbreak.md"]
+        for name in names:
+            file_path = temp_dir / name
+            file_path.parent.mkdir(exist_ok=True)
+            file_path.write_text("content")
+            repo.index.add([str(file_path)])
+        repo.index.commit("Add unusual names")
+
+        tracked_files = GitRepo(str(temp_dir)).get_tracked_files()
+
+        for name in names:
+            assert name in tracked_files
+
+    def test_get_tracked_files_cached_until_index_changes(self, temp_git_repo):
+        """Test that the tracked file listing is reused until the index changes."""
+        temp_dir, repo = temp_git_repo
+        git_repo = GitRepo(str(temp_dir))
+
+        first = git_repo.get_tracked_files()
+        with patch.object(git_repo.repo, "git") as mock_git:
+            assert git_repo.get_tracked_files() == first
+        mock_git.ls_files.assert_not_called()
+
+        new_file = temp_dir / "new.py"
+        new_file.write_text("print('new')")
+        git_repo.add_files([str(new_file)])
+
+        assert "new.py" in git_repo.get_tracked_files()
+
     def test_get_tracked_files_empty_repo(self, temp_dir):
         """Test getting tracked files from empty repository."""
         # Create empty git repo
@@ -198,7 +198,7 @@ class TestFileWatchingIntegration:
         action = config_manager.get_file_action(str(other_file))
         assert action == FileAction.INCLUDE
 
-    @patch("src.llm_comm.requests.post")
+    @patch("src.llm_comm.requests.Session.post")
     def test_llm_commit_message_generation(self, mock_post, temp_git_repo):
         """Test LLM integration for commit message generation."""
         temp_dir, repo = temp_git_repo
@@ -206,9 +206,11 @@ class TestFileWatchingIntegration:
         # Mock LLM response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "response": "feat: implement user authentication system"
-        }
+        mock_response.iter_lines.return_value = [
+            b'{"response": "feat: implement", "done": false}',
+            b'{"response": " user authentication system", "done": false}',
+            b'{"response": "\\n\\nAdds AuthSystem", "done": false}',
+        ]
         mock_post.return_value = mock_response
 
         # Setup components
@@ -221,6 +223,7 @@ class TestFileWatchingIntegration:
             model_name=llm_config.model_name,
             enable_linear_fallback=llm_config.enable_linear_fallback,
             fallback_team_id=llm_config.fallback_team_id,
+            timeout_seconds=llm_config.timeout_seconds,
         )
         git_repo = GitRepo(str(temp_dir))
 
@@ -245,6 +248,80 @@ class AuthSystem:
 
         assert commit_message == "feat: implement user authentication system"
         mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["timeout"] == llm_config.timeout_seconds
+        assert mock_post.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
+
+    def test_llm_commit_message_cached_per_diff(self, mock_llm_response):
+        """Test that a repeated diff reuses the generated message."""
+        from llm_comm import LLMCommitGenerator
+
+        llm_generator = LLMCommitGenerator(enable_linear_fallback=False)
+        mock_llm_response.reset_mock()
+
+        diff = "+print('hello')\n"
+        assert llm_generator.generate_commit_message(diff) == (
+            "feat: add new functionality"
+        )
+        assert llm_generator.generate_commit_message(diff) == (
+            "feat: add new functionality"
+        )
+        mock_llm_response.assert_called_once()
+
+        llm_generator.generate_commit_message(diff + "+print('again')\n")
+        assert mock_llm_response.call_count == 2
+
+    def test_llm_connection_tested_on_first_use(self, mock_llm_response):
+        """Test that the LLM service is only contacted once it is needed."""
+        import llm_comm
+
+        with patch("requests.Session.get") as mock_get:
+            llm_generator = llm_comm.LLMCommitGenerator(enable_linear_fallback=False)
+            assert llm_comm._get_generator() is llm_comm._get_generator()
+            mock_get.assert_not_called()
+
+            llm_generator.generate_commit_message("+print('hello')\n")
+            llm_generator.generate_commit_message("-print('hello')\n")
+            mock_get.assert_called_once()
+
+    def test_fallback_commit_message_counts_changed_lines(self):
+        """Test the heuristic message picks the dominant kind of change."""
+        from llm_comm import LLMCommitGenerator
+
+        llm_generator = LLMCommitGenerator(enable_linear_fallback=False)
+
+        assert (
+            llm_generator._fallback_commit_message("+a\n+b\n-c\n")
+            == "feat: add new functionality"
+        )
+        assert (
+            llm_generator._fallback_commit_message("-a\n context\n-b")
+            == "refactor: remove code"
+        )
+        assert (
+            llm_generator._fallback_commit_message("+a\n-b\n")
+            == "chore: update implementation"
+        )
+
+    def test_large_diff_truncated_in_prompt(self):
+        """Test that prompts carry at most max_diff_chars of the diff."""
+        from linear_fallback import truncate_diff
+        from llm_comm import LLMCommitGenerator
+
+        diff = "".join(f"+line {i}\n" for i in range(1000))
+        truncated = truncate_diff(diff, 100)
+        assert len(truncated) < 150
+        assert truncated.startswith("+line 0\n")
+        kept_lines = truncated.count("\n")
+        assert truncated.endswith(f"... [truncated {1000 - kept_lines} lines]")
+        assert truncate_diff("+short\n", 100) == "+short\n"
+
+        llm_generator = LLMCommitGenerator(
+            enable_linear_fallback=False, max_diff_chars=100
+        )
+        prompt = llm_generator._format_prompt(diff)
+        assert truncated in prompt
+        assert "+line 999" not in prompt
 
     def test_ui_backend_integration(self, temp_dir):
         """Test UI backend integration with review queue."""
@@ -307,7 +384,7 @@ class TestErrorHandlingIntegration:
         temp_dir, repo = temp_git_repo
 
         # Mock failed LLM request
-        with patch("src.llm_comm.requests.post") as mock_post:
+        with patch("src.llm_comm.requests.Session.post") as mock_post:
             mock_post.side_effect = Exception("LLM service unavailable")
 
             # Mock Linear integration
@@ -332,6 +409,280 @@ class TestErrorHandlingIntegration:
                 assert "Linear issue created" in result
                 mock_linear.assert_called_once()
 
+    def test_linear_fallback_poll_cancelled(self):
+        """Test that cancelling stops a Linear poll without waiting it out."""
+        from linear_fallback import (LinearFallbackConfig, LinearFallbackError,
+                                     LinearFallbackManager)
+
+        manager = LinearFallbackManager(
+            LinearFallbackConfig(fallback_team_id="team", poll_interval_seconds=30)
+        )
+        errors = []
+
+        def poll():
+            try:
+                manager.poll_for_commit_message("test-issue-id")
+            except LinearFallbackError as e:
+                errors.append(e)
+
+        with patch(
+            "src.linear_integration.get_issues_comments_batch", return_value={}
+        ):
+            thread = threading.Thread(target=poll)
+            thread.start()
+            manager.cancel()
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert len(errors) == 1
+        assert "test-issue-id" in str(errors[0])
+
+    def test_linear_fallback_pushed_comment_ends_poll(self):
+        """Test that a webhook-pushed comment answers a poll immediately."""
+        from linear_fallback import LinearFallbackConfig, LinearFallbackManager
+
+        manager = LinearFallbackManager(
+            LinearFallbackConfig(fallback_team_id="team", poll_interval_seconds=30)
+        )
+        manager._pending_issues["test-issue-id"] = "commit_message"
+        results = []
+
+        with patch(
+            "src.linear_integration.get_issues_comments_batch", return_value={}
+        ):
+            thread = threading.Thread(
+                target=lambda: results.append(
+                    manager.poll_for_commit_message("test-issue-id")
+                )
+            )
+            thread.start()
+
+            assert not manager.deliver_comment("other-issue", "feat: add a thing")
+            assert not manager.deliver_comment("test-issue-id", "Looking at it now")
+            assert manager.deliver_comment(
+                "test-issue-id", "```\nfeat(auth): add login endpoint\n```"
+            )
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert results == ["feat(auth): add login endpoint"]
+
+    def test_linear_fallback_checks_pending_issues_in_one_batch(self):
+        """Test that one poll checks every pending issue in a single call."""
+        from linear_fallback import LinearFallbackConfig, LinearFallbackManager
+
+        manager = LinearFallbackManager(
+            LinearFallbackConfig(fallback_team_id="team", poll_interval_seconds=30)
+        )
+        manager._pending_issues["issue-a"] = "commit_message"
+        manager._pending_issues["issue-b"] = "commit_message"
+        comments = {
+            "issue-a": [{"body": "fix(ui): align review buttons"}],
+            "issue-b": [{"body": "docs: describe the review queue"}],
+        }
+
+        with patch(
+            "src.linear_integration.get_issues_comments_batch", return_value=comments
+        ) as mock_batch:
+            assert manager.poll_for_commit_message("issue-a") == (
+                "fix(ui): align review buttons"
+            )
+            # issue-b was answered by the same check
+            assert manager.poll_for_commit_message("issue-b") == (
+                "docs: describe the review queue"
+            )
+
+        mock_batch.assert_called_once()
+        assert sorted(mock_batch.call_args[0][0]) == ["issue-a", "issue-b"]
+
+    def test_linear_webhook_requires_signature(self, temp_dir):
+        """Test that the Linear webhook only accepts signed requests."""
+        import hashlib
+        import hmac
+        import json
+
+        testclient = pytest.importorskip("fastapi.testclient")
+        from linear_fallback import LinearFallbackConfig, LinearFallbackManager
+        from ui_backend import create_ui_backend
+
+        manager = LinearFallbackManager(LinearFallbackConfig(fallback_team_id="team"))
+        manager._pending_issues["issue-a"] = "commit_message"
+        review_queue = ReviewQueue(str(temp_dir / "review.db"))
+        config_manager = ConfigurationManager(str(temp_dir))
+        body = json.dumps(
+            {
+                "type": "Comment",
+                "action": "create",
+                "data": {"issueId": "issue-a", "body": "feat: add login endpoint"},
+            }
+        ).encode()
+
+        # No secret configured: the endpoint does not exist
+        backend = create_ui_backend(review_queue, config_manager, manager)
+        client = testclient.TestClient(backend.app)
+        assert client.post("/linear/webhook", content=body).status_code == 404
+
+        backend = create_ui_backend(review_queue, config_manager, manager, "s3cret")
+        client = testclient.TestClient(backend.app)
+        response = client.post(
+            "/linear/webhook", content=body, headers={"Linear-Signature": "bad"}
+        )
+        assert response.status_code == 401
+
+        signature = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        response = client.post(
+            "/linear/webhook", content=body, headers={"Linear-Signature": signature}
+        )
+        assert response.json() == {"status": "accepted"}
+
+        # Signed bodies that are not JSON objects are rejected
+        for bad_body in (b"[]", b'{"type": "Comment", "data": ["issue-a"]}'):
+            signature = hmac.new(b"s3cret", bad_body, hashlib.sha256).hexdigest()
+            response = client.post(
+                "/linear/webhook",
+                content=bad_body,
+                headers={"Linear-Signature": signature},
+            )
+            assert response.status_code == 400
+
+    def test_linear_webhook_signature_and_delivery(self):
+        """Test the webhook's signature check and comment delivery."""
+        import hashlib
+        import hmac
+
+        from linear_fallback import (
+            LinearFallbackConfig,
+            LinearFallbackManager,
+            valid_webhook_signature,
+        )
+
+        body = b'{"type": "Comment", "action": "create"}'
+        signature = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        assert valid_webhook_signature("s3cret", body, signature)
+        assert not valid_webhook_signature("other", body, signature)
+        assert not valid_webhook_signature("s3cret", body + b" ", signature)
+        assert not valid_webhook_signature("s3cret", body, "")
+
+        manager = LinearFallbackManager(LinearFallbackConfig(fallback_team_id="team"))
+        manager._pending_issues["issue-a"] = "commit_message"
+        assert not manager.deliver_comment("issue-b", "feat: add login endpoint")
+        assert manager.deliver_comment("issue-a", "feat: add login endpoint")
+        assert manager._pushed_messages == {"issue-a": "feat: add login endpoint"}
+
+        # A finished poll's issue takes no more messages
+        manager._forget_issue("issue-a")
+        assert not manager.deliver_comment("issue-a", "fix: handle empty input")
+        assert manager._pushed_messages == {}
+
+    def test_linear_fallback_skips_seen_comments(self):
+        """Test that each check only asks for comments newer than the last."""
+        from linear_fallback import LinearFallbackConfig, LinearFallbackManager
+
+        manager = LinearFallbackManager(LinearFallbackConfig(fallback_team_id="team"))
+        manager._pending_issues["issue-a"] = "commit_message"
+        comments = {
+            "issue-a": [
+                {"body": "Looking", "updatedAt": "2024-05-01T10:00:00.000Z"},
+                {"body": "Soon", "updatedAt": "2024-05-01T09:00:00.000Z"},
+            ]
+        }
+
+        with patch(
+            "src.linear_integration.get_issues_comments_batch", return_value=comments
+        ) as mock_batch:
+            assert manager._check_issues_for_responses(["issue-a"]) == {}
+            assert mock_batch.call_args[0][1] == {}
+            assert manager._check_issues_for_responses(["issue-a"]) == {}
+            assert mock_batch.call_args[0][1] == {
+                "issue-a": "2024-05-01T10:00:00.000Z"
+            }
+
+        # The MCP tool cannot filter, so get_issue_comments drops seen comments
+        from linear_integration import get_issue_comments
+
+        list_comments = Mock(
+            return_value=[
+                {"body": "old", "updatedAt": "2024-05-01T10:00:00.000Z"},
+                {"body": "new", "updatedAt": "2024-05-01T11:00:00.000Z"},
+                {"body": "undated"},
+            ]
+        )
+        mcp_module = Mock(mcp_linear_oauth_list_comments=list_comments)
+        with patch.dict(sys.modules, {"mcp_linear_oauth_list_comments": mcp_module}):
+            recent = get_issue_comments("issue-a", since="2024-05-01T10:00:00.000Z")
+            assert [c["body"] for c in recent] == ["new", "undated"]
+            assert len(get_issue_comments("issue-a")) == 3
+
+    def test_linear_fallback_commit_message_validation(self):
+        """Test which Linear comments are accepted as commit messages."""
+        from linear_fallback import LinearFallbackConfig, LinearFallbackManager
+
+        manager = LinearFallbackManager(LinearFallbackConfig(fallback_team_id="team"))
+
+        assert manager._is_valid_commit_message("feat(auth): add login endpoint")
+        assert manager._is_valid_commit_message("fix: handle empty diffs\n\nDetails")
+        assert manager._is_valid_commit_message("  docs: update the README  ")
+        assert not manager._is_valid_commit_message("")
+        assert not manager._is_valid_commit_message("fix: typo")
+        assert not manager._is_valid_commit_message("no colon in this line")
+        assert not manager._is_valid_commit_message("feat: " + "x" * 100)
+        assert not manager._is_valid_commit_message("fix: should this be fixed?")
+        assert not manager._is_valid_commit_message("Please use: feat: something")
+        assert not manager._is_valid_commit_message("How about: fix: something")
+        assert not manager._is_valid_commit_message("\nfeat: on the second line")
+
+    def test_linear_fallback_extracts_code_block(self):
+        """Test that commit messages are pulled out of fenced code blocks."""
+        from linear_fallback import LinearFallbackConfig, LinearFallbackManager
+
+        manager = LinearFallbackManager(LinearFallbackConfig(fallback_team_id="team"))
+        extract = manager._extract_commit_message
+
+        assert extract("Use this:\n```\nfeat: add login endpoint\n```") == (
+            "feat: add login endpoint"
+        )
+        assert extract("  ```text\n  fix: handle empty diffs\n  ```\n") == (
+            "fix: handle empty diffs"
+        )
+        # The first block is not a commit message, the second one is
+        assert extract(
+            "```\nnot a message\n```\nor\n```\nchore: bump deps now\n```"
+        ) == ("chore: bump deps now")
+        # An unclosed block is ignored and the whole comment is checked instead
+        assert extract("```\nfeat: add login endpoint") is None
+        assert extract("docs: update the README") == "docs: update the README"
+
+    def test_linear_comments_fetched_concurrently(self):
+        """Test that a batch fetches issues in parallel and skips failures."""
+        from linear_integration import get_issues_comments_batch
+
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_get_issue_comments(issue_id, since=None):
+            with lock:
+                in_flight.append(issue_id)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(issue_id)
+            if issue_id == "broken":
+                raise Exception("Linear unavailable")
+            return [{"body": f"comment on {issue_id}"}]
+
+        with patch(
+            "linear_integration.get_issue_comments",
+            side_effect=fake_get_issue_comments,
+        ):
+            comments = get_issues_comments_batch(["a", "broken", "c"])
+
+        assert comments == {
+            "a": [{"body": "comment on a"}],
+            "c": [{"body": "comment on c"}],
+        }
+        assert max(peak) > 1
+
     def test_database_error_handling(self, temp_dir):
         """Test handling of database errors in review queue."""
         # Create review queue with invalid database path
@@ -411,3 +762,373 @@ class TestPerformanceIntegration:
         # Verify all items were processed
         pending_items = review_queue.get_pending_items()
         assert len(pending_items) <= 50  # Up to 50 items could be added
+
+    def test_worker_drains_event_burst(self, temp_dir):
+        """Test that a worker drains a burst of queued events in batches."""
+        from watchdog.events import FileModifiedEvent
+
+        from commit_worker import EVENT_BATCH_SIZE
+
+        config_manager = Mock()
+        config_manager.get_file_action.return_value = FileAction.IGNORE
+        event_queue = Queue()
+
+        worker = CommitWorker(
+            config_manager=config_manager,
+            git_repo=Mock(),
+            review_queue=Mock(),
+            llm_generator=Mock(),
+            event_queue=event_queue,
+        )
+
+        num_events = EVENT_BATCH_SIZE * 2 + 1
+        for i in range(num_events):
+            event_queue.put(FileModifiedEvent(str(temp_dir / f"burst_{i}.py")))
+
+        with patch.object(
+            worker, "process_batch", wraps=worker.process_batch
+        ) as mock_batch:
+            thread = threading.Thread(target=worker.run, daemon=True)
+            thread.start()
+            try:
+                # join() only returns once every event has been task_done()'d
+                event_queue.join()
+            finally:
+                worker.stop()
+                thread.join(timeout=5)
+
+        assert config_manager.get_file_action.call_count == num_events
+        assert all(
+            len(call.args[0]) <= EVENT_BATCH_SIZE for call in mock_batch.call_args_list
+        )
+        assert mock_batch.call_count < num_events
+
+    def test_worker_routes_repeated_events(self, temp_dir):
+        """Test that workers leave coalescing repeats to the EventCoalescer."""
+        from watchdog.events import FileCreatedEvent, FileModifiedEvent
+
+        config_manager = Mock()
+        config_manager.get_file_action.return_value = FileAction.IGNORE
+
+        worker = CommitWorker(
+            config_manager=config_manager,
+            git_repo=Mock(),
+            review_queue=Mock(),
+            llm_generator=Mock(),
+        )
+
+        test_file = str(temp_dir / "saved.py")
+        for _ in range(3):
+            assert worker.process_event(FileModifiedEvent(test_file))
+        assert worker.process_event(FileCreatedEvent(test_file))
+
+        # Dropping a repeat here could lose the latest write
+        assert config_manager.get_file_action.call_count == 4
+
+    def test_worker_clears_config_cache_on_rule_change(self, temp_dir):
+        """Test that config file events invalidate cached file actions."""
+        from watchdog.events import FileModifiedEvent
+
+        config_manager = ConfigurationManager(str(temp_dir))
+        worker = CommitWorker(
+            config_manager=config_manager,
+            git_repo=Mock(),
+            review_queue=Mock(),
+            llm_generator=Mock(),
+        )
+
+        test_file = temp_dir / "debug.log"
+        test_file.touch()
+        assert config_manager.get_file_action(str(test_file)) == FileAction.REVIEW
+
+        gitignore = temp_dir / ".gitignore"
+        gitignore.write_text("*.log\n")
+        worker.process_event(FileModifiedEvent(str(gitignore)))
+
+        assert config_manager.get_file_action(str(test_file)) == FileAction.IGNORE
+
+    def test_worker_stops_without_polling(self):
+        """Test that stop() wakes a worker blocked on an empty queue."""
+        event_queue = Queue()
+        worker = CommitWorker(
+            config_manager=Mock(),
+            git_repo=Mock(),
+            review_queue=Mock(),
+            llm_generator=Mock(),
+            event_queue=event_queue,
+        )
+
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        time.sleep(0.1)
+        assert thread.is_alive()
+
+        worker.stop()
+        thread.join(timeout=0.5)
+
+        assert not thread.is_alive()
+        # The sentinel is accounted for, so join() does not hang
+        event_queue.join()
+
+    def test_worker_commits_burst_together(self, temp_git_repo):
+        """Test that events arriving within max_batch_ms share one commit."""
+        from watchdog.events import FileCreatedEvent
+
+        temp_dir, repo = temp_git_repo
+        (temp_dir / ".gitinclude").write_text("*.py\n")
+
+        mock_llm = Mock()
+        mock_llm.generate_commit_message.return_value = "feat: add burst"
+        event_queue = Queue()
+        worker = CommitWorker(
+            config_manager=ConfigurationManager(str(temp_dir)),
+            git_repo=GitRepo(str(temp_dir)),
+            review_queue=Mock(),
+            llm_generator=mock_llm,
+            event_queue=event_queue,
+            max_batch_ms=500,
+        )
+
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        try:
+            for i in range(3):
+                test_file = temp_dir / f"burst{i}.py"
+                test_file.write_text(f"print({i})")
+                event_queue.put(FileCreatedEvent(str(test_file)))
+                time.sleep(0.05)
+            event_queue.join()
+        finally:
+            worker.stop()
+            thread.join(timeout=5)
+
+        assert len(list(repo.iter_commits())) == 2  # Initial + one batch commit
+        assert mock_llm.generate_commit_message.call_count == 1
+        assert sorted(repo.head.commit.stats.files) == [
+            "burst0.py",
+            "burst1.py",
+            "burst2.py",
+        ]
+
+    def test_worker_commits_moved_file(self, temp_git_repo):
+        """Test that a rename commits both the removal and the new path."""
+        from watchdog.events import FileMovedEvent
+
+        temp_dir, repo = temp_git_repo
+        (temp_dir / ".gitinclude").write_text("*.md\n")
+
+        mock_llm = Mock()
+        mock_llm.generate_commit_message.return_value = "docs: rename readme"
+        worker = CommitWorker(
+            config_manager=ConfigurationManager(str(temp_dir)),
+            git_repo=GitRepo(str(temp_dir)),
+            review_queue=Mock(),
+            llm_generator=mock_llm,
+        )
+
+        (temp_dir / "README.md").rename(temp_dir / "GUIDE.md")
+        assert worker.process_event(
+            FileMovedEvent(str(temp_dir / "README.md"), str(temp_dir / "GUIDE.md"))
+        )
+
+        assert sorted(repo.head.commit.stats.files) == ["GUIDE.md", "README.md"]
+        assert "GUIDE.md" in repo.head.commit.tree
+        assert "README.md" not in repo.head.commit.tree
+
+    def test_worker_batch_survives_vanished_file(self, temp_git_repo):
+        """Test that an untracked file deleted before staging is skipped."""
+        from watchdog.events import FileCreatedEvent, FileDeletedEvent
+
+        temp_dir, repo = temp_git_repo
+        (temp_dir / ".gitinclude").write_text("*.py\n")
+
+        mock_llm = Mock()
+        mock_llm.generate_commit_message.return_value = "feat: add kept file"
+        worker = CommitWorker(
+            config_manager=ConfigurationManager(str(temp_dir)),
+            git_repo=GitRepo(str(temp_dir)),
+            review_queue=Mock(),
+            llm_generator=mock_llm,
+        )
+
+        kept_file = temp_dir / "kept.py"
+        kept_file.write_text("print('kept')")
+        events = [
+            FileCreatedEvent(str(temp_dir / "scratch.py")),
+            FileDeletedEvent(str(temp_dir / "scratch.py")),
+            FileCreatedEvent(str(kept_file)),
+        ]
+
+        assert worker.process_batch(events) == 3
+        assert list(repo.head.commit.stats.files) == ["kept.py"]
+
+    def test_worker_generates_message_outside_commit_lock(self, temp_git_repo):
+        """Test that a slow commit message does not block other workers."""
+        from watchdog.events import FileCreatedEvent
+
+        temp_dir, repo = temp_git_repo
+        (temp_dir / ".gitinclude").write_text("*.py\n")
+
+        def generate(diff, paths):
+            # Another worker could stage and commit right now
+            assert CommitWorker._commit_lock.acquire(blocking=False)
+            CommitWorker._commit_lock.release()
+            return "feat: add slow file"
+
+        mock_llm = Mock()
+        mock_llm.generate_commit_message.side_effect = generate
+        worker = CommitWorker(
+            config_manager=ConfigurationManager(str(temp_dir)),
+            git_repo=GitRepo(str(temp_dir)),
+            review_queue=Mock(),
+            llm_generator=mock_llm,
+        )
+
+        slow_file = temp_dir / "slow.py"
+        slow_file.write_text("print('slow')")
+        assert worker.process_event(FileCreatedEvent(str(slow_file)))
+        assert repo.head.commit.message.strip() == "feat: add slow file"
+
+    def test_change_handler_normalizes_paths(self, temp_dir):
+        """Test that events are queued with one canonical path per file."""
+        from watchdog.events import FileModifiedEvent, FileMovedEvent
+
+        event_queue = Queue()
+        handler = ChangeHandler(event_queue)
+
+        handler.on_any_event(FileModifiedEvent(f"{temp_dir}/sub/../a.py"))
+        handler.on_any_event(FileModifiedEvent(str(temp_dir / "a.py")))
+        handler.on_any_event(FileMovedEvent(f"{temp_dir}//a.py", f"{temp_dir}/./b.py"))
+
+        first, second, moved = (event_queue.get_nowait() for _ in range(3))
+        assert first.src_path == second.src_path == str(temp_dir / "a.py")
+        assert isinstance(moved, FileMovedEvent)
+        assert moved.dest_path == str(temp_dir / "b.py")
+
+    def test_worker_pins_itself_to_cpu_set(self):
+        """Test that a worker applies its CPU affinity when it starts."""
+        worker = CommitWorker(
+            config_manager=Mock(),
+            git_repo=Mock(),
+            review_queue=Mock(),
+            llm_generator=Mock(),
+            cpu_set={0},
+        )
+
+        with patch("commit_worker.os.sched_setaffinity", create=True) as mock_pin:
+            worker.start()
+
+        mock_pin.assert_called_once_with(0, {0})
+
+    def test_worker_pool_drains_sharded_queue(self, temp_dir):
+        """Test that a pool consumes a sharded queue and stops cleanly."""
+        from watchdog.events import FileModifiedEvent
+
+        from event_queue import ShardedEventQueue
+
+        config_manager = Mock()
+        config_manager.get_file_action.return_value = FileAction.IGNORE
+        event_queue = ShardedEventQueue(3)
+
+        worker_pool = CommitWorkerPool(
+            config_manager=config_manager,
+            git_repo=Mock(),
+            event_queue=event_queue,
+            review_queue=Mock(),
+            llm_generator=Mock(),
+            num_workers=3,
+        )
+        worker_pool.start()
+
+        try:
+            for i in range(200):
+                event_queue.put(FileModifiedEvent(str(temp_dir / f"shard_{i}.py")))
+            worker_pool.wait_for_completion()
+        finally:
+            worker_pool.stop()
+
+        assert config_manager.get_file_action.call_count == 200
+        assert all(not thread.is_alive() for thread in worker_pool.threads)
+        event_queue.join()
+
+    def test_worker_pool_drains_simple_queue(self, temp_dir):
+        """Test that a pool consumes a SimpleQueue without task accounting."""
+        from queue import SimpleQueue
+
+        from watchdog.events import FileModifiedEvent
+
+        config_manager = Mock()
+        config_manager.get_file_action.return_value = FileAction.IGNORE
+        event_queue = SimpleQueue()
+
+        worker_pool = CommitWorkerPool(
+            config_manager=config_manager,
+            git_repo=Mock(),
+            event_queue=event_queue,
+            review_queue=Mock(),
+            llm_generator=Mock(),
+            num_workers=2,
+        )
+        worker_pool.start()
+
+        try:
+            for i in range(100):
+                event_queue.put(FileModifiedEvent(str(temp_dir / f"simple_{i}.py")))
+            worker_pool.wait_for_completion()
+        finally:
+            worker_pool.stop()
+
+        assert event_queue.empty()
+        assert config_manager.get_file_action.call_count == 100
+
+    def test_worker_pool_scales_with_backlog(self, temp_dir):
+        """Test that a pool adds workers under a backlog and retires them."""
+        from watchdog.events import FileModifiedEvent
+
+        release = threading.Event()
+
+        def blocked_action(path):
+            release.wait(5)
+            return FileAction.IGNORE
+
+        config_manager = Mock()
+        config_manager.get_file_action.side_effect = blocked_action
+        event_queue = Queue()
+
+        worker_pool = CommitWorkerPool(
+            config_manager=config_manager,
+            git_repo=Mock(),
+            event_queue=event_queue,
+            review_queue=Mock(),
+            llm_generator=Mock(),
+            num_workers=1,
+            max_batch_n=1,
+            max_workers=3,
+            scale_up_threshold=5,
+            scale_down_idle_s=0.2,
+        )
+
+        with patch("commit_worker.SCALE_CHECK_INTERVAL", 0.02):
+            worker_pool.start()
+            try:
+                for i in range(50):
+                    event_queue.put(FileModifiedEvent(str(temp_dir / f"scale_{i}.py")))
+
+                deadline = time.monotonic() + 5
+                while len(worker_pool.workers) < 3 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert len(worker_pool.workers) == 3
+
+                release.set()
+                worker_pool.wait_for_completion()
+
+                deadline = time.monotonic() + 5
+                while len(worker_pool.workers) > 1 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert [worker.worker_id for worker in worker_pool.workers] == [0]
+            finally:
+                release.set()
+                worker_pool.stop()
+
+        assert config_manager.get_file_action.call_count == 50
+        assert not worker_pool.threads
@@ -0,0 +1,68 @@
+"""
+Unit tests for the security_check audit script.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from security_check import SecurityAuditor, _find_secrets
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class TestCheckImports:
+    """Test cases for SecurityAuditor.check_imports."""
+
+    def test_findings_sorted_by_file_and_line(self, tmp_path):
+        """Test that findings are reported by file, then line, then function."""
+        src_dir = tmp_path / "src"
+        _write(src_dir / "z.py", "yaml.load(f)\n")
+        _write(src_dir / "pkg" / "mod.py", "import os\nos.system('ls')\n")
+        _write(
+            src_dir / "a.py",
+            "x = eval(s); exec(s)\n# eval(s)\nobj = pickle.loads(b)\n",
+        )
+        _write(src_dir / "clean.py", "print('hello')\n")
+
+        auditor = SecurityAuditor()
+        auditor.project_root = tmp_path
+        auditor.src_dir = src_dir
+        result = auditor.check_imports()
+
+        found = [
+            (finding["file"], finding["line"], finding["function"])
+            for finding in result["details"]
+        ]
+        assert found == [
+            (str(Path("src/a.py")), 1, "eval"),
+            (str(Path("src/a.py")), 1, "exec"),
+            (str(Path("src/a.py")), 3, "pickle.loads"),
+            (str(Path("src/pkg/mod.py")), 2, "os.system"),
+            (str(Path("src/z.py")), 1, "yaml.load"),
+        ]
+        assert result["dangerous_imports"] == 5
+
+
+class TestFindSecrets:
+    """Test cases for _find_secrets."""
+
+    def test_findings_in_line_order(self):
+        """Test that secrets are reported per line, skipping comments."""
+        content = (
+            b"password = 'hunter2hunter2'\n"
+            b"# token = 'abcdefghijklmnopqrstuvwxyz'\n"
+            b"API_KEY = 'abcdefghijklmnopqrstuvwxyz'\n"
+        )
+
+        findings = _find_secrets(content, "src/settings.py")
+
+        assert [(f["line"], f["description"]) for f in findings] == [
+            (1, "Hardcoded password"),
+            (3, "API key"),
+        ]
+        assert findings[0]["content"] == "password = 'hunter2hunter2'"